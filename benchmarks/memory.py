@@ -0,0 +1,260 @@
+"""
+Memory footprint benchmarks of the `Matrix` and `Vector` operations.
+
+Every operation is measured with `tracemalloc` across a sweep of sizes, recording:
+
+- `peak`: the highest number of bytes allocated while the operation runs, including temporaries.
+- `retained`: the bytes still allocated when it returns, which is mostly the result itself.
+
+The operands are built before tracing starts, and every operation is run once before being measured, so that one time
+allocations like imports and caches are not counted.
+
+The measurements are compared against the budgets checked in at `benchmarks/memory_budgets.json`, with a relative
+tolerance for the differences between Python versions. Run it from the root of the repository:
+
+    python -m benchmarks.memory            # Print the measurements.
+    python -m benchmarks.memory --check    # Fail if any measurement goes over its budget.
+    python -m benchmarks.memory --update   # Write the current measurements as the new budgets.
+"""
+import argparse
+import gc
+import json
+import operator
+import sys
+import tracemalloc
+import typing as t
+from pathlib import Path
+
+import hypemaths as hm
+
+BUDGETS_PATH = Path(__file__).resolve().parent / "memory_budgets.json"
+
+# The sizes of the sweep, as the number of rows and columns of the square matrices. Vectors get `size ** 2` points,
+# so that they have as many elements as the matrices.
+DEFAULT_SIZES = (8, 32, 64)
+
+# The relative amount a measurement can go over its budget before it counts as a regression, and the absolute amount
+# added on top, so that the small measurements aren't failed by the differences in object sizes between Python versions.
+DEFAULT_TOLERANCE = 0.1
+DEFAULT_SLACK = 1024
+
+
+def _rows(size: int, offset: int = 0) -> list:
+    return [[float(row * size + col + offset + 1) for col in range(size)] for row in range(size)]
+
+
+def _matrix(size: int) -> tuple:
+    return hm.Matrix(_rows(size)),
+
+
+def _matrices(size: int) -> tuple:
+    return hm.Matrix(_rows(size)), hm.Matrix(_rows(size, 1))
+
+
+def _matrix_scalar(size: int) -> tuple:
+    return hm.Matrix(_rows(size)), 3.0
+
+
+def _scalar_matrix(size: int) -> tuple:
+    return 3.0, hm.Matrix(_rows(size))
+
+
+def _diagonally_dominant(size: int) -> tuple:
+    rows = _rows(size)
+    for index, row in enumerate(rows):
+        row[index] += size ** 3
+    return hm.Matrix(rows),
+
+
+def _points(size: int, offset: int = 0) -> list:
+    return [float(point + offset + 1) for point in range(size ** 2)]
+
+
+def _vectors(size: int) -> tuple:
+    return hm.Vector(_points(size)), hm.Vector(_points(size, 1))
+
+
+def _vector_scalar(size: int) -> tuple:
+    return hm.Vector(_points(size)), 3.0
+
+
+# The name of every benchmark, with the function building its operands for a size, and the operation.
+BENCHMARKS = {
+    "Matrix.__init__": (lambda size: (_rows(size),), hm.Matrix),
+    "Matrix.__add__": (_matrices, operator.add),
+    "Matrix.__sub__": (_matrices, operator.sub),
+    "Matrix.__mul__[scalar]": (_matrix_scalar, operator.mul),
+    "Matrix.__mul__[matrix]": (_matrices, operator.mul),
+    "Matrix.__matmul__": (_matrices, operator.matmul),
+    "Matrix.__truediv__": (_matrix_scalar, operator.truediv),
+    "Matrix.__radd__": (_scalar_matrix, operator.add),
+    "Matrix.__rsub__": (_scalar_matrix, operator.sub),
+    "Matrix.__rmul__": (_scalar_matrix, operator.mul),
+    "Matrix.__rtruediv__": (_scalar_matrix, operator.truediv),
+    "Matrix.multiply": (_matrices, hm.Matrix.multiply),
+    "Matrix.__abs__": (_matrix, abs),
+    "Matrix.__round__": (_matrix, round),
+    "Matrix.transpose": (_matrix, hm.Matrix.transpose),
+    "Matrix.clone": (_matrix, hm.Matrix.clone),
+    "Matrix.determinant": (_diagonally_dominant, hm.Matrix.determinant),
+    "Matrix.get_randomized_matrix": (lambda size: ((size, size), 0, 100, 1), hm.Matrix.get_randomized_matrix),
+    "Vector.__init__": (lambda size: (_points(size),), hm.Vector),
+    "Vector.__add__": (_vectors, operator.add),
+    "Vector.__sub__": (_vectors, operator.sub),
+    "Vector.__mul__[vector]": (_vectors, operator.mul),
+    "Vector.__mul__[scalar]": (_vector_scalar, operator.mul),
+    "Vector.__truediv__": (_vector_scalar, operator.truediv),
+    "Vector.clone": (lambda size: (hm.Vector(_points(size)),), hm.Vector.clone),
+}
+
+
+def measure(setup: t.Callable[[int], tuple], operation: t.Callable, size: int) -> t.Dict[str, int]:
+    """
+    Measure the memory allocated by an operation, for the operands built for a size.
+
+    Parameters
+    ----------
+    setup: t.Callable[[int], tuple]
+        The function building the operands for a size.
+    operation: t.Callable
+        The operation, called with the operands.
+    size: int
+        The size of the operands.
+
+    Returns
+    -------
+    t.Dict[str, int]
+        The `peak` and `retained` bytes.
+    """
+    operation(*setup(size))
+
+    operands = setup(size)
+    gc.collect()
+
+    # Only the allocations made after tracing starts are counted, so the operands are left out.
+    tracemalloc.start()
+    try:
+        result = operation(*operands)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return {"peak": peak, "retained": retained}
+
+
+def run(names: t.Optional[t.Iterable[str]] = None, sizes: t.Iterable[int] = DEFAULT_SIZES) -> t.Dict[str, dict]:
+    """
+    Run the benchmarks across the sizes.
+
+    Parameters
+    ----------
+    names: t.Optional[t.Iterable[str]]
+        The names of the benchmarks to be run. All of them are run when it isn't specified.
+    sizes: t.Iterable[int]
+        The sizes of the sweep.
+
+    Returns
+    -------
+    t.Dict[str, dict]
+        The measurements of every benchmark, keyed by the size as a string, like the budget files.
+    """
+    if tracemalloc.is_tracing():
+        raise RuntimeError("The memory benchmarks cannot run while tracemalloc is already tracing.")
+
+    names = list(BENCHMARKS) if names is None else list(names)
+    for name in names:
+        if name not in BENCHMARKS:
+            raise KeyError(f"Unknown benchmark {name!r}.")
+
+    results = {}
+    for name in names:
+        setup, operation = BENCHMARKS[name]
+        results[name] = {str(size): measure(setup, operation, size) for size in sizes}
+    return results
+
+
+def check(
+        results: t.Dict[str, dict], budgets: t.Dict[str, dict], tolerance: float = DEFAULT_TOLERANCE,
+        slack: int = DEFAULT_SLACK
+) -> t.List[str]:
+    """
+    Compare the measurements against the budgets.
+
+    Parameters
+    ----------
+    results: t.Dict[str, dict]
+        The measurements, as returned by `run`.
+    budgets: t.Dict[str, dict]
+        The budgets, in the same layout. Measurements without a budget are not checked.
+    tolerance: float
+        The relative amount a measurement can go over its budget.
+    slack: int
+        The number of bytes a measurement can go over its budget, on top of the tolerance.
+
+    Returns
+    -------
+    t.List[str]
+        A description of every measurement going over its budget, which is empty when all of them fit.
+    """
+    failures = []
+    for name, sizes in results.items():
+        for size, measurements in sizes.items():
+            budget = budgets.get(name, {}).get(size)
+            if budget is None:
+                continue
+
+            for metric, value in measurements.items():
+                limit = budget[metric] * (1 + tolerance) + slack
+                if value > limit:
+                    failures.append(
+                        f"{name} [size {size}]: {metric} of {value} bytes is over the budget of {budget[metric]} bytes."
+                    )
+    return failures
+
+
+def load_budgets(path: Path = BUDGETS_PATH) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+def main(arguments: t.Optional[t.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the memory footprint of the HypeMaths operations.")
+    parser.add_argument("--check", action="store_true", help="fail if any measurement goes over its budget")
+    parser.add_argument("--update", action="store_true", help="write the measurements as the new budgets")
+    parser.add_argument("--budgets", type=Path, default=BUDGETS_PATH, help="the path of the budget file")
+    parser.add_argument("--sizes", type=int, nargs="+", help="the sizes of the sweep")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="the names of the benchmarks to be run")
+    options = parser.parse_args(arguments)
+
+    budgets = load_budgets(options.budgets) if options.budgets.exists() else {"tolerance": DEFAULT_TOLERANCE, "slack": DEFAULT_SLACK}
+    sizes = options.sizes or budgets.get("sizes", DEFAULT_SIZES)
+    results = run(options.only, sizes)
+
+    for name, measurements in results.items():
+        for size, values in measurements.items():
+            print(f"{name:<32} {size:>6} {values['peak']:>12} peak {values['retained']:>12} retained")
+
+    if options.update:
+        budgets["sizes"] = list(sizes)
+        budgets.setdefault("budgets", {}).update(results)
+        with open(options.budgets, "w") as file:
+            json.dump(budgets, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"\nThe budgets were written to {options.budgets}.")
+
+    if options.check:
+        failures = check(
+            results, budgets.get("budgets", {}), budgets.get("tolerance", DEFAULT_TOLERANCE),
+            budgets.get("slack", DEFAULT_SLACK)
+        )
+        if failures:
+            print("\nMemory regressions:", *failures, sep="\n")
+            return 1
+        print("\nAll the measurements are within their budgets.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
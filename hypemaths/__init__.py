@@ -1,6 +1,31 @@
+from hypemaths import aio, dtypes, instrumentation
+from hypemaths.covariance import CovarianceAccumulator
+from hypemaths.distances import pairwise, top_k_neighbors
+from hypemaths.dtypes import (
+    DType,
+    complex128,
+    float32,
+    float64,
+    int32,
+    int64
+)
+from hypemaths.generators import RandomGenerator
+from hypemaths.instrumentation import instrument
 from hypemaths.models import (
+    BandedMatrix,
+    BlockMatrix,
+    CirculantMatrix,
+    DiagonalMatrix,
+    Identity,
+    KroneckerOperator,
     Matrix,
-    Vector
+    MatrixInverse,
+    ModMatrix,
+    SymmetricMatrix,
+    ToeplitzMatrix,
+    TriangularMatrix,
+    Vector,
+    detect_structure
 )
 
 __author__ = "Sunrit Jana"
@@ -8,3 +33,5 @@ __email__ = "warriordefenderz@gmail.com"
 __version__ = "0.1.0-alpha"
 __licence__ = "GPL-3.0 License"
 __copyright__ = "Copyright 2020 Sunrit Jana"
+
+instrumentation.enable_from_environment()
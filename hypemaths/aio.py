@@ -0,0 +1,248 @@
+"""
+Awaitable matrix operations, which keep heavy computations off the event loop.
+
+Every operation is run by an `AsyncRunner`, either on an executor (a thread pool by default, or any
+`concurrent.futures.Executor` like a process pool) or cooperatively on the event loop itself. The pure Python kernels
+for the matrix product and the determinant are split into chunks of rows:
+
+- On a thread pool, cancelling the awaiting task stops the kernel at the next chunk, instead of letting it run on.
+- In the cooperative mode, the kernel yields to the event loop after every chunk, so other tasks keep being served.
+
+Every runner limits the number of operations running at the same time, so that heavy jobs cannot take over the whole
+pool. The runner used by default can be changed with `configure`.
+"""
+import asyncio
+import concurrent.futures
+import functools
+import operator
+import threading
+import typing as t
+import weakref
+
+import hypemaths as hm
+from hypemaths import dtypes
+from hypemaths.exceptions import MatrixDimensionError
+from hypemaths.models.utils.linalg import determinant_steps, matmul_steps
+
+# The number of rows computed between the checks for cancellation, or the yields to the event loop.
+DEFAULT_CHUNK_ROWS = 16
+
+StepsFactory = t.Callable[[], t.Generator]
+
+
+class _Cancelled(Exception):
+    """Raised inside the executor when the awaiting task has been cancelled."""
+
+
+def _drive(factory: StepsFactory, cancelled: t.Optional[threading.Event]) -> t.Any:
+    """Run the steps of a kernel inside the executor, stopping between the chunks once it is cancelled."""
+    steps = factory()
+    while True:
+        if cancelled is not None and cancelled.is_set():
+            steps.close()
+            raise _Cancelled
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+def _call(function: t.Callable, *args) -> t.Generator[None, None, t.Any]:
+    """Wrap an operation without a step wise kernel, as a kernel having a single step."""
+    return function(*args)
+    yield  # Unreachable, but makes this function a generator.
+
+
+def _matmul(left: "hm.Matrix", right: "hm.Matrix", chunk_rows: int) -> t.Generator[None, None, "hm.Matrix"]:
+    if left.cols != right.rows:
+        raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+
+    matrix = yield from matmul_steps(left._read(), right._read(), chunk_rows)
+    return hm.Matrix._from_rows(matrix, dtypes.promote(left.dtype, right.dtype))
+
+
+def _determinant(matrix: "hm.Matrix") -> t.Generator[None, None, float]:
+    return (yield from determinant_steps(matrix._read()))
+
+
+class AsyncRunner:
+    def __init__(
+            self, executor: t.Optional[concurrent.futures.Executor] = None, max_concurrency: t.Optional[int] = None,
+            chunk_rows: int = DEFAULT_CHUNK_ROWS, cooperative: bool = False
+    ) -> None:
+        """
+        The configuration for running the awaitable operations.
+
+        Parameters
+        ----------
+        executor: t.Optional[concurrent.futures.Executor]
+            The executor running the operations. The default executor of the event loop is used when it isn't
+            specified. With a process pool, the operations and their operands are pickled, and a running operation
+            cannot be stopped by cancelling.
+        max_concurrency: t.Optional[int]
+            The maximum number of operations of this runner running at the same time, the others wait for their turn.
+            Unlimited by default.
+        chunk_rows: int
+            The number of rows computed between the checks for cancellation, or the yields to the event loop. Defaults
+            to `16`.
+        cooperative: bool
+            If the operations should run on the event loop itself, yielding to it after every chunk, instead of on the
+            executor. Operations without a chunked kernel run in a single step. Defaults to `False`.
+
+        Examples
+        --------
+        >>> import concurrent.futures
+        >>> runner = AsyncRunner(concurrent.futures.ThreadPoolExecutor(4), max_concurrency=2)
+        >>> # product = await matrix.matmul_async(other, runner=runner)
+        """
+        if max_concurrency is not None and (not isinstance(max_concurrency, int) or max_concurrency < 1):
+            raise ValueError("The maximum concurrency must be a positive integer.")
+        if not isinstance(chunk_rows, int) or chunk_rows < 1:
+            raise ValueError("The number of rows in a chunk must be a positive integer.")
+
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.chunk_rows = chunk_rows
+        self.cooperative = cooperative
+        # A semaphore is bound to an event loop, so there is one for each loop using the runner.
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(executor={self.executor!r}, max_concurrency={self.max_concurrency}, "
+            f"chunk_rows={self.chunk_rows}, cooperative={self.cooperative})"
+        )
+
+    def _semaphore(self) -> t.Optional[asyncio.Semaphore]:
+        if self.max_concurrency is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    async def run(self, factory: StepsFactory) -> t.Any:
+        """
+        Run a step wise kernel, waiting for a free slot when the concurrency is limited.
+
+        Parameters
+        ----------
+        factory: StepsFactory
+            The function creating the generator of the kernel, which pauses between its chunks and returns the result.
+            It must be picklable for process pools, like a `functools.partial` of a module level function.
+
+        Returns
+        -------
+        t.Any
+            The result of the kernel.
+        """
+        semaphore = self._semaphore()
+        if semaphore is None:
+            return await self._run(factory)
+
+        async with semaphore:
+            return await self._run(factory)
+
+    async def _run(self, factory: StepsFactory) -> t.Any:
+        if self.cooperative:
+            steps = factory()
+            try:
+                while True:
+                    try:
+                        next(steps)
+                    except StopIteration as stop:
+                        return stop.value
+                    await asyncio.sleep(0)
+            finally:
+                steps.close()
+
+        # A process cannot see the event, so the pending work can only be dropped before it starts.
+        cancelled = None if isinstance(self.executor, concurrent.futures.ProcessPoolExecutor) else threading.Event()
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, _drive, factory, cancelled)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if cancelled is not None:
+                cancelled.set()
+            raise
+
+    async def call(self, function: t.Callable, *args) -> t.Any:
+        """
+        Run any function with the arguments, as a single step.
+
+        Returns
+        -------
+        t.Any
+            The value returned by the function.
+        """
+        return await self.run(functools.partial(_call, function, *args))
+
+
+_default_runner = AsyncRunner()
+
+
+def configure(
+        executor: t.Optional[concurrent.futures.Executor] = None, max_concurrency: t.Optional[int] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS, cooperative: bool = False
+) -> AsyncRunner:
+    """
+    Replace the runner used by default, taking the same arguments as `AsyncRunner`.
+
+    Returns
+    -------
+    AsyncRunner
+        The new default runner.
+    """
+    global _default_runner
+
+    _default_runner = AsyncRunner(executor, max_concurrency, chunk_rows, cooperative)
+    return _default_runner
+
+
+def get_runner() -> AsyncRunner:
+    """
+    Returns
+    -------
+    AsyncRunner
+        The runner used by default.
+    """
+    return _default_runner
+
+
+async def matmul(
+        left: "hm.Matrix", right: t.Union["hm.Matrix", "hm.Vector", dtypes.Number], runner: t.Optional[AsyncRunner] = None
+) -> "hm.Matrix":
+    """
+    Compute `left * right` without blocking the event loop. The product of two general matrices is computed in
+    chunks of rows, other operands in a single step.
+    """
+    runner = runner or _default_runner
+    if type(left) is hm.Matrix and type(right) is hm.Matrix:
+        return await runner.run(functools.partial(_matmul, left, right, runner.chunk_rows))
+    return await runner.call(operator.mul, left, right)
+
+
+async def determinant(matrix: "hm.Matrix", runner: t.Optional[AsyncRunner] = None) -> float:
+    """
+    Compute the determinant without blocking the event loop. The elimination of a general matrix pauses after every
+    column, and the specialized determinants of the other matrix types run in a single step.
+    """
+    runner = runner or _default_runner
+    if type(matrix).determinant is hm.Matrix.determinant:
+        return await runner.run(functools.partial(_determinant, matrix))
+    return await runner.call(operator.methodcaller("determinant"), matrix)
+
+
+async def solve(
+        matrix: "hm.Matrix", other: t.Union["hm.Matrix", "hm.Vector"], runner: t.Optional[AsyncRunner] = None
+) -> t.Union["hm.Matrix", "hm.Vector"]:
+    """Solve the linear system `matrix x = other` without blocking the event loop, in a single step."""
+    return await (runner or _default_runner).call(operator.methodcaller("solve", other), matrix)
+
+
+async def inverse(matrix: "hm.Matrix", runner: t.Optional[AsyncRunner] = None) -> "hm.Matrix":
+    """Compute the inverse without blocking the event loop, in a single step."""
+    return await (runner or _default_runner).call(operator.methodcaller("inverse"), matrix)
@@ -0,0 +1,238 @@
+"""
+Streaming accumulation of Gram, covariance and correlation matrices.
+
+The samples are never stored. `CovarianceAccumulator` keeps the count, the mean and the co-moment matrix (the sum of
+the outer products of the deviations from the mean), which are updated with Welford's algorithm for single samples and
+merged with the formulas of Chan et al. for chunks and partial accumulators. As the co-moment matrix is symmetric, only
+its upper triangle is stored and updated.
+"""
+import math
+import operator
+import typing as t
+
+import hypemaths as hm
+from hypemaths.exceptions import MatrixDimensionError, VectorDimensionError
+
+
+class CovarianceAccumulator:
+    def __init__(self, dimension: t.Optional[int] = None) -> None:
+        """
+        An accumulator of samples, for computing their Gram, covariance and correlation matrices incrementally.
+
+        Parameters
+        ----------
+        dimension: t.Optional[int]
+            The number of variables in every sample. It is taken from the first sample when it isn't specified.
+
+        Examples
+        --------
+        Accumulate in parallel workers, and merge the partial results.
+
+        >>> from hypemaths import Matrix, Vector
+        >>> first, second = CovarianceAccumulator(), CovarianceAccumulator()
+        >>> first.update(Vector(1, 2)).update(Vector(2, 4))
+        CovarianceAccumulator(dimension=2, count=2)
+        >>> second.update(Matrix([[3, 6], [4, 8]]))
+        CovarianceAccumulator(dimension=2, count=2)
+        >>> first.merge(second).covariance()
+        SymmetricMatrix([[1.6666666666666667, 3.3333333333333335], [3.3333333333333335, 6.666666666666667]])
+        """
+        if dimension is not None and (not isinstance(dimension, int) or dimension < 1):
+            raise ValueError("The dimension must be a positive integer.")
+
+        self.dimension = dimension
+        self.count = 0
+        self._mean = [0.0] * dimension if dimension else []
+        # The upper triangle of the co-moment matrix, row `i` holding the columns from `i` onwards.
+        self._comoment = [[0.0] * (dimension - row) for row in range(dimension)] if dimension else []
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(dimension={self.dimension}, count={self.count})"
+
+    def _check_dimension(self, dimension: int, error: type) -> None:
+        if self.dimension is None:
+            self.dimension = dimension
+            self._mean = [0.0] * dimension
+            self._comoment = [[0.0] * (dimension - row) for row in range(dimension)]
+        elif dimension != self.dimension:
+            raise error(f"The samples must have {self.dimension} values, but got {dimension}.")
+
+    def update(self, samples: t.Union["hm.Vector", "hm.Matrix", list]) -> "CovarianceAccumulator":
+        """
+        Add samples to the accumulator.
+
+        Parameters
+        ----------
+        samples: t.Union[Vector, Matrix, list]
+            A single sample as a `Vector`, or a chunk of samples as the rows of a `Matrix` or a 2D list. Chunks are
+            summarized on their own first and merged in, which is faster than adding the samples one by one.
+
+        Returns
+        -------
+        CovarianceAccumulator
+            The same accumulator, for chaining the updates.
+
+        Raises
+        ------
+        VectorDimensionError
+            If a sample doesn't have the dimension of the accumulator.
+        MatrixDimensionError
+            If the rows of a chunk don't have the dimension of the accumulator.
+        """
+        if isinstance(samples, hm.Vector):
+            return self._update_sample(samples._read())
+
+        rows = samples._read() if isinstance(samples, hm.Matrix) else samples
+        if not rows:
+            return self
+        if len(rows) == 1:
+            self._check_dimension(len(rows[0]), MatrixDimensionError)
+            return self._update_sample(rows[0])
+        return self.merge(self._summarize(rows))
+
+    def _update_sample(self, sample: t.Sequence) -> "CovarianceAccumulator":
+        self._check_dimension(len(sample), VectorDimensionError)
+
+        self.count += 1
+        deltas = [value - mean for value, mean in zip(sample, self._mean)]
+        self._mean = [mean + delta / self.count for mean, delta in zip(self._mean, deltas)]
+
+        # The outer product of the deviations from the old and the new mean, which is `(n - 1) / n` of the outer
+        # product of `deltas` and keeps the update exactly symmetric.
+        scale = (self.count - 1) / self.count
+        for row, values in enumerate(self._comoment):
+            scaled = deltas[row] * scale
+            if scaled:
+                self._comoment[row] = [value + scaled * delta for value, delta in zip(values, deltas[row:])]
+        return self
+
+    def _summarize(self, rows: t.Sequence) -> "CovarianceAccumulator":
+        """Summarize a chunk of samples into a new accumulator, with the mean subtracted before the products."""
+        summary = CovarianceAccumulator()
+        for row in rows:
+            summary._check_dimension(len(row), MatrixDimensionError)
+        self._check_dimension(summary.dimension, MatrixDimensionError)
+
+        count = len(rows)
+        mean = [total / count for total in map(math.fsum, zip(*rows))]
+        centered = [[value - average for value, average in zip(row, mean)] for row in rows]
+
+        columns = list(zip(*centered))
+        comoment = [
+            [math.fsum(map(operator.mul, column, other)) for other in columns[index:]]
+            for index, column in enumerate(columns)
+        ]
+
+        summary.count, summary._mean, summary._comoment = count, mean, comoment
+        return summary
+
+    def merge(self, other: "CovarianceAccumulator") -> "CovarianceAccumulator":
+        """
+        Merge another accumulator into this one, like the partial results of parallel workers.
+
+        Parameters
+        ----------
+        other: CovarianceAccumulator
+            The accumulator to be merged, which isn't modified.
+
+        Returns
+        -------
+        CovarianceAccumulator
+            The same accumulator, holding the statistics of the samples of both.
+        """
+        if not isinstance(other, CovarianceAccumulator):
+            raise TypeError(f"Only covariance accumulators can be merged. Not {type(other)}")
+        if other.count == 0:
+            return self
+        self._check_dimension(other.dimension, MatrixDimensionError)
+
+        if self.count == 0:
+            self.count = other.count
+            self._mean = list(other._mean)
+            self._comoment = [list(values) for values in other._comoment]
+            return self
+
+        count = self.count + other.count
+        deltas = [second - first for first, second in zip(self._mean, other._mean)]
+        self._mean = [mean + delta * other.count / count for mean, delta in zip(self._mean, deltas)]
+
+        scale = self.count * other.count / count
+        comoment = []
+        for row, (values, other_values) in enumerate(zip(self._comoment, other._comoment)):
+            scaled = deltas[row] * scale
+            comoment.append([
+                value + other_value + scaled * delta for value, other_value, delta in zip(values, other_values, deltas[row:])
+            ])
+        self._comoment = comoment
+        self.count = count
+        return self
+
+    def _check_count(self, minimum: int) -> None:
+        if self.count < minimum:
+            raise ValueError(f"At least {minimum} samples are needed, but only {self.count} were accumulated.")
+
+    def mean(self) -> "hm.Vector":
+        """
+        Returns
+        -------
+        Vector
+            The mean of the samples.
+        """
+        self._check_count(1)
+        return hm.Vector._from_points(list(self._mean))
+
+    def gram(self) -> "hm.SymmetricMatrix":
+        """
+        Returns
+        -------
+        SymmetricMatrix
+            The Gram matrix `X^T X` of the samples `X`, stacked as rows.
+        """
+        self._check_count(1)
+
+        mean, count = self._mean, self.count
+        data = [
+            [value + count * mean[row] * average for value, average in zip(values, mean[row:])]
+            for row, values in enumerate(self._comoment)
+        ]
+        return hm.SymmetricMatrix._new(self.dimension, _data=data)
+
+    def covariance(self, ddof: int = 1) -> "hm.SymmetricMatrix":
+        """
+        Parameters
+        ----------
+        ddof: int
+            The delta degrees of freedom, the co-moments are divided by `n - ddof`. Defaults to `1`, for the sample
+            covariance.
+
+        Returns
+        -------
+        SymmetricMatrix
+            The covariance matrix of the samples.
+        """
+        self._check_count(ddof + 1)
+
+        divisor = self.count - ddof
+        return hm.SymmetricMatrix._new(
+            self.dimension, _data=[[value / divisor for value in values] for values in self._comoment]
+        )
+
+    def correlation(self) -> "hm.SymmetricMatrix":
+        """
+        Returns
+        -------
+        SymmetricMatrix
+            The Pearson correlation matrix of the samples. The correlations of a variable without any variance are
+            `nan`.
+        """
+        self._check_count(2)
+
+        deviations = [math.sqrt(values[0]) for values in self._comoment]
+        data = []
+        for row, values in enumerate(self._comoment):
+            data.append([
+                value / (deviations[row] * deviation) if deviations[row] and deviation else math.nan
+                for value, deviation in zip(values[1:], deviations[row + 1:])
+            ])
+            data[row].insert(0, 1.0 if deviations[row] else math.nan)
+        return hm.SymmetricMatrix._new(self.dimension, _data=data)
@@ -0,0 +1,223 @@
+"""
+Pairwise distances between collections of vectors, and nearest neighbour search.
+
+The pairs are visited in blocks of rows of both collections, and the values are read straight from the storage of the
+vectors, so that no intermediate vector is ever created for a pair. The squared norms needed by the Euclidean and the
+cosine metrics are computed once for every vector, leaving a single dot product for each pair.
+"""
+import heapq
+import math
+import operator
+import typing as t
+
+import hypemaths as hm
+from hypemaths.exceptions import VectorDimensionError
+
+Collection = t.Union["hm.Matrix", t.Sequence["hm.Vector"], t.Sequence[t.Sequence]]
+Metric = t.Union[str, t.Callable[[t.Sequence, t.Sequence], float]]
+
+METRICS = ("euclidean", "cosine", "manhattan")
+
+DEFAULT_BLOCK_SIZE = 256
+
+
+def _rows(collection: Collection) -> list:
+    """
+    Get the values of every vector in the collection, which can be a matrix holding a vector in every row, or a
+    sequence of vectors or lists.
+    """
+    if isinstance(collection, hm.Matrix):
+        rows = collection._read()
+    else:
+        rows = [item._read() if isinstance(item, hm.Vector) else item for item in collection]
+
+    if not rows:
+        raise ValueError("The collection of vectors cannot be empty.")
+
+    size = len(rows[0])
+    for index, row in enumerate(rows):
+        if len(row) != size:
+            raise VectorDimensionError(f"All the vectors must have {size} dimensions, but vector[{index}] has {len(row)}.")
+    return rows
+
+
+def _dot(first: t.Sequence, second: t.Sequence) -> float:
+    return sum(map(operator.mul, first, second))
+
+
+def _block_kernel(metric: Metric, x_rows: list, y_rows: list) -> t.Callable[[int, int, int, int], list]:
+    """
+    Build the function computing the distances between a block of `x_rows` and a block of `y_rows`, given the start
+    and end index of both blocks.
+    """
+    if callable(metric):
+        def kernel(x_start: int, x_end: int, y_start: int, y_end: int) -> list:
+            y_block = y_rows[y_start:y_end]
+            return [[metric(x, y) for y in y_block] for x in x_rows[x_start:x_end]]
+        return kernel
+
+    if metric == "manhattan":
+        def kernel(x_start: int, x_end: int, y_start: int, y_end: int) -> list:
+            y_block = y_rows[y_start:y_end]
+            return [[sum(map(abs, map(operator.sub, x, y))) for y in y_block] for x in x_rows[x_start:x_end]]
+        return kernel
+
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric!r}, it must be one of {', '.join(METRICS)} or a callable.")
+
+    x_norms = [_dot(x, x) for x in x_rows]
+    y_norms = x_norms if y_rows is x_rows else [_dot(y, y) for y in y_rows]
+
+    if metric == "euclidean":
+        def kernel(x_start: int, x_end: int, y_start: int, y_end: int) -> list:
+            y_block, y_block_norms = y_rows[y_start:y_end], y_norms[y_start:y_end]
+            block = []
+            for x, x_norm in zip(x_rows[x_start:x_end], x_norms[x_start:x_end]):
+                # `|x - y|^2 = |x|^2 + |y|^2 - 2 x.y`, clamped as rounding can make it slightly negative.
+                block.append([
+                    math.sqrt(max(x_norm + y_norm - 2 * _dot(x, y), 0.0)) for y, y_norm in zip(y_block, y_block_norms)
+                ])
+            return block
+        return kernel
+
+    x_lengths = [math.sqrt(norm) for norm in x_norms]
+    y_lengths = x_lengths if y_norms is x_norms else [math.sqrt(norm) for norm in y_norms]
+
+    def kernel(x_start: int, x_end: int, y_start: int, y_end: int) -> list:
+        y_block, y_block_lengths = y_rows[y_start:y_end], y_lengths[y_start:y_end]
+        block = []
+        for x, x_length in zip(x_rows[x_start:x_end], x_lengths[x_start:x_end]):
+            # Vectors without any length have no direction, so they are treated as orthogonal to everything.
+            block.append([
+                1 - _dot(x, y) / (x_length * y_length) if x_length and y_length else 1.0
+                for y, y_length in zip(y_block, y_block_lengths)
+            ])
+        return block
+    return kernel
+
+
+def _blocks(count: int, block_size: int) -> t.Iterator[t.Tuple[int, int]]:
+    for start in range(0, count, block_size):
+        yield start, min(start + block_size, count)
+
+
+def _prepare(x: Collection, y: t.Optional[Collection], block_size: int) -> t.Tuple[list, list]:
+    if not isinstance(block_size, int) or block_size < 1:
+        raise ValueError("The block size must be a positive integer.")
+
+    x_rows = _rows(x)
+    y_rows = x_rows if y is None else _rows(y)
+    if len(x_rows[0]) != len(y_rows[0]):
+        raise VectorDimensionError("The vectors of both the collections must have the same number of dimensions.")
+    return x_rows, y_rows
+
+
+def pairwise(
+        x: Collection, y: t.Optional[Collection] = None, metric: Metric = "euclidean",
+        block_size: int = DEFAULT_BLOCK_SIZE
+) -> "hm.Matrix":
+    """
+    Compute the distances between every pair of vectors from two collections.
+
+    Parameters
+    ----------
+    x: Collection
+        The first collection, as a matrix holding a vector in every row, or a sequence of vectors or lists.
+    y: t.Optional[Collection]
+        The second collection. The distances between the vectors of `x` are computed when it isn't specified.
+    metric: Metric
+        `"euclidean"`, `"cosine"` for one minus the cosine similarity, `"manhattan"`, or a function taking the values
+        of two vectors and returning their distance, or any other kernel value. Defaults to `"euclidean"`.
+    block_size: int
+        The number of vectors of each collection processed together in a block. Defaults to `256`.
+
+    Returns
+    -------
+    Matrix
+        The `len(x) x len(y)` matrix of the distances, the value at `[i, j]` being between `x[i]` and `y[j]`.
+
+    Raises
+    ------
+    VectorDimensionError
+        If the vectors don't have the same number of dimensions.
+
+    Examples
+    --------
+    >>> from hypemaths import Vector
+    >>> pairwise([Vector(0, 0), Vector(3, 4)], [Vector(0, 0)])
+    Matrix([[0.0], [5.0]])
+    """
+    x_rows, y_rows = _prepare(x, y, block_size)
+    kernel = _block_kernel(metric, x_rows, y_rows)
+
+    matrix = []
+    for x_start, x_end in _blocks(len(x_rows), block_size):
+        rows = [[] for _ in range(x_end - x_start)]
+        for y_start, y_end in _blocks(len(y_rows), block_size):
+            for row, values in zip(rows, kernel(x_start, x_end, y_start, y_end)):
+                row.extend(values)
+        matrix.extend(rows)
+
+    return hm.Matrix._from_rows(matrix)
+
+
+def top_k_neighbors(
+        x: Collection, y: t.Optional[Collection] = None, k: int = 1, metric: Metric = "euclidean",
+        block_size: int = DEFAULT_BLOCK_SIZE
+) -> t.List[t.List[t.Tuple[int, float]]]:
+    """
+    Find the `k` nearest vectors of `y` for every vector of `x`.
+
+    The distances are computed block by block like `pairwise`, and only a bounded heap of the `k` nearest vectors is
+    kept for every vector of `x`, so the full distance matrix is never stored.
+
+    Parameters
+    ----------
+    x: Collection
+        The query vectors, as a matrix holding a vector in every row, or a sequence of vectors or lists.
+    y: t.Optional[Collection]
+        The vectors to be searched. When it isn't specified, `x` is searched and every vector is skipped as its own
+        neighbour.
+    k: int
+        The number of neighbours to be found. Defaults to `1`.
+    metric: Metric
+        The distance metric, like for `pairwise`. Smaller values are nearer. Defaults to `"euclidean"`.
+    block_size: int
+        The number of vectors of each collection processed together in a block. Defaults to `256`.
+
+    Returns
+    -------
+    t.List[t.List[t.Tuple[int, float]]]
+        For every vector of `x`, the `(index, distance)` pairs of its neighbours, nearest first. Ties are broken by the
+        smaller index.
+
+    Examples
+    --------
+    >>> top_k_neighbors([[0, 0], [1, 0], [5, 5]], k=1)
+    [[(1, 1.0)], [(0, 1.0)], [(1, 6.4031242374328485)]]
+    """
+    if not isinstance(k, int) or k < 1:
+        raise ValueError("The number of neighbours must be a positive integer.")
+
+    x_rows, y_rows = _prepare(x, y, block_size)
+    kernel = _block_kernel(metric, x_rows, y_rows)
+    skip_self = y is None
+
+    # Max heaps of `(-distance, -index)`, so that the farthest kept neighbour is at the top and gets replaced first.
+    heaps = [[] for _ in x_rows]
+    for x_start, x_end in _blocks(len(x_rows), block_size):
+        for y_start, y_end in _blocks(len(y_rows), block_size):
+            block = kernel(x_start, x_end, y_start, y_end)
+            for x_index, distances in enumerate(block, x_start):
+                heap = heaps[x_index]
+                for y_index, distance in enumerate(distances, y_start):
+                    if skip_self and x_index == y_index:
+                        continue
+
+                    item = (-distance, -y_index)
+                    if len(heap) < k:
+                        heapq.heappush(heap, item)
+                    elif item > heap[0]:
+                        heapq.heapreplace(heap, item)
+
+    return [[(-index, -distance) for distance, index in sorted(heap, reverse=True)] for heap in heaps]
@@ -0,0 +1,203 @@
+"""
+The element types for the typed storage of matrices and vectors.
+
+A matrix or a vector created without a `dtype` keeps its values as the Python numbers passed, while a typed one stores
+each row in an `array.array` of the element type (or a list of `complex` for `complex128`), converting every value.
+
+The promotion rules for operations between two operands are:
+
+- An untyped operand takes the type of the other operand.
+- Integers with integers, or floats with floats, give the wider of the two types.
+- Integers with floats give `float64`.
+- Anything with `complex128` gives `complex128`.
+
+Python scalars don't widen the type, unless they are of a higher kind: a `float` with an integer type gives `float64`,
+and a `complex` with any type gives `complex128`.
+"""
+import array
+import typing as t
+
+Number = t.Union[int, float, complex]
+
+# The order of the kinds, from the narrowest to the widest.
+_KINDS = "ifc"
+
+
+class DType:
+    __slots__ = ("name", "typecode", "kind", "itemsize", "python_type")
+
+    def __init__(self, name: str, typecode: t.Optional[str], kind: str, itemsize: int, python_type: type) -> None:
+        """
+        An element type for the typed storage.
+
+        Parameters
+        ----------
+        name: str
+            The name of the type.
+        typecode: t.Optional[str]
+            The `array` typecode used for the storage, or `None` if a list is used.
+        kind: str
+            The kind of the type, `i` for integers, `f` for floats and `c` for complex numbers.
+        itemsize: int
+            The number of bytes taken by each element.
+        python_type: type
+            The Python type of the values stored.
+        """
+        self.name = name
+        self.typecode = typecode
+        self.kind = kind
+        self.itemsize = itemsize
+        self.python_type = python_type
+
+    def __repr__(self) -> str:
+        return self.name
+
+    def __reduce__(self) -> str:
+        return self.name
+
+    def cast(self, value: Number) -> Number:
+        """
+        Convert a value into this type. Floats are truncated when converted to integers, like `int`.
+
+        Raises
+        ------
+        TypeError
+            If the value cannot be converted, like complex numbers into real types.
+        """
+        if isinstance(value, complex) and self.kind != "c":
+            raise TypeError(f"Complex value {value} cannot be converted to {self.name}.")
+        return self.python_type(value)
+
+    def storage(self, values: t.Iterable[Number]) -> t.Union[array.array, list]:
+        """
+        Parameters
+        ----------
+        values: t.Iterable[Number]
+            The values to be stored.
+
+        Returns
+        -------
+        t.Union[array.array, list]
+            The typed storage holding the converted values.
+
+        Raises
+        ------
+        OverflowError
+            If an integer doesn't fit in the type.
+        """
+        values = [self.cast(value) for value in values]
+        if self.typecode is None:
+            return values
+        return array.array(self.typecode, values)
+
+
+float32 = DType("float32", "f", "f", 4, float)
+float64 = DType("float64", "d", "f", 8, float)
+int32 = DType("int32", "i", "i", 4, int)
+int64 = DType("int64", "q", "i", 8, int)
+complex128 = DType("complex128", None, "c", 16, complex)
+
+DTYPES = {dtype.name: dtype for dtype in (float32, float64, int32, int64, complex128)}
+
+_PYTHON_TYPES = {int: int64, float: float64, complex: complex128}
+
+
+def get_dtype(dtype: t.Union[DType, str, type, None]) -> t.Optional[DType]:
+    """
+    Parameters
+    ----------
+    dtype: t.Union[DType, str, type, None]
+        The type, its name, or the Python type `int`, `float` or `complex`.
+
+    Returns
+    -------
+    t.Optional[DType]
+        The element type, or `None` for untyped storage.
+
+    Raises
+    ------
+    TypeError
+        If the type isn't supported.
+    """
+    if dtype is None or isinstance(dtype, DType):
+        return dtype
+    if isinstance(dtype, str) and dtype in DTYPES:
+        return DTYPES[dtype]
+    if isinstance(dtype, type) and dtype in _PYTHON_TYPES:
+        return _PYTHON_TYPES[dtype]
+
+    raise TypeError(f"Unsupported dtype {dtype!r}, it must be one of {', '.join(DTYPES)}.")
+
+
+def promote(first: t.Optional[DType], second: t.Optional[DType]) -> t.Optional[DType]:
+    """
+    Parameters
+    ----------
+    first: t.Optional[DType]
+        The type of the first operand.
+    second: t.Optional[DType]
+        The type of the second operand.
+
+    Returns
+    -------
+    t.Optional[DType]
+        The type of the result of an operation between the operands.
+    """
+    if first is None or first is second:
+        return second
+    if second is None:
+        return first
+
+    if first.kind == second.kind:
+        return first if first.itemsize >= second.itemsize else second
+    if "c" in (first.kind, second.kind):
+        return complex128
+    return float64
+
+
+def promote_scalar(dtype: t.Optional[DType], scalar: Number) -> t.Optional[DType]:
+    """
+    Parameters
+    ----------
+    dtype: t.Optional[DType]
+        The type of the matrix or vector operand.
+    scalar: Number
+        The Python scalar operand.
+
+    Returns
+    -------
+    t.Optional[DType]
+        The type of the result of an operation between the operands.
+    """
+    if isinstance(scalar, complex):
+        # Complex values are always stored as `complex128`, even when the other operand is untyped.
+        return complex128 if dtype is None or dtype.kind != "c" else dtype
+    if dtype is None:
+        return None
+    if isinstance(scalar, float) and dtype.kind == "i":
+        return float64
+    return dtype
+
+
+def true_divide(dtype: t.Optional[DType]) -> t.Optional[DType]:
+    """
+    Returns
+    -------
+    t.Optional[DType]
+        The type of the result of a true division, which is `float64` for integer types.
+    """
+    if dtype is not None and dtype.kind == "i":
+        return float64
+    return dtype
+
+
+def infer(values: t.Iterable[Number]) -> t.Optional[DType]:
+    """
+    Returns
+    -------
+    t.Optional[DType]
+        `complex128` if there are any complex values, else `None` for keeping the values untyped.
+    """
+    if any(isinstance(value, complex) for value in values):
+        return complex128
+    return None
@@ -3,5 +3,6 @@ from hypemaths.exceptions.exceptions import (
     InvalidVectorError,
     MatrixDimensionError,
     MatrixNotSquare,
+    SingularMatrixError,
     VectorDimensionError
 )
@@ -16,3 +16,7 @@ class InvalidVectorError(Exception):
 
 class VectorDimensionError(Exception):
     pass
+
+
+class SingularMatrixError(Exception):
+    pass
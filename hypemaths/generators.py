@@ -0,0 +1,324 @@
+"""
+Bulk random generation of matrices and vectors.
+
+Every `RandomGenerator` owns its own `random.Random` instance, so generators never touch the global state of the
+`random` module and can be used from several threads. Independent streams for parallel workers are derived from a
+seed and a stream key by hashing, so the stream given to each worker only depends on its key and not on the order the
+workers run in.
+"""
+import hashlib
+import random
+import typing as t
+
+import hypemaths as hm
+
+Dimensions = t.Tuple[int, int]
+
+
+def _check_dims(dims: tuple) -> Dimensions:
+    if len(dims) != 2:
+        raise ValueError("You must pass the 2 DIMENSIONS for the Matrix fill.")
+
+    rows, cols = dims
+    if not (isinstance(rows, int) and isinstance(cols, int)) or rows < 1 or cols < 1:
+        raise ValueError("The dimensions of the matrix must be positive integers.")
+    return rows, cols
+
+
+def _check_number(value: t.Any) -> None:
+    if not isinstance(value, (int, float)):
+        raise TypeError(f"The values or value must be integer or float, but the given value is {type(value)}.")
+
+
+def _stream_seed(seed: int, stream: tuple) -> int:
+    """Derive the seed of an independent stream from the root seed and the stream key."""
+    if not stream:
+        return seed
+
+    key = ":".join(str(part) for part in (seed,) + stream).encode()
+    return int.from_bytes(hashlib.sha256(key).digest(), "big")
+
+
+class RandomGenerator:
+    def __init__(self, seed: t.Optional[int] = None, stream: t.Union[int, tuple] = (), use_numpy: bool = False) -> None:
+        """
+        A generator of random matrices and vectors, which fills the whole storage in bulk.
+
+        Parameters
+        ----------
+        seed: t.Optional[int]
+            The seed for the random number generation, which can be used to recreate the values later. A random seed
+            is picked when it isn't specified, and stored as `seed`.
+        stream: t.Union[int, tuple]
+            The key of the independent stream to be used. Generators with the same seed and different stream keys
+            produce independent values. Defaults to the root stream.
+        use_numpy: bool
+            If the values should be generated with a NumPy `Generator`, which requires NumPy to be installed.
+            Defaults to `False`.
+
+        Examples
+        --------
+        Generate reproducible values in parallel workers, using a stream for each worker.
+
+        >>> workers = RandomGenerator(seed=7).spawn(4)
+        >>> matrix = workers[0].uniform((2, 2), 0, 1)
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+
+        self.seed = seed
+        self.stream = stream if isinstance(stream, tuple) else (stream,)
+        self._random = random.Random(_stream_seed(seed, self.stream))
+        self._spawned = 0
+
+        self._numpy = None
+        if use_numpy:
+            try:
+                import numpy
+            except ImportError:
+                raise ImportError("NumPy is required for generating the values using NumPy.") from None
+
+            sequence = numpy.random.SeedSequence(entropy=seed, spawn_key=self.stream)
+            self._numpy = numpy.random.Generator(numpy.random.PCG64(sequence))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(seed={self.seed}, stream={self.stream})"
+
+    def spawn(self, count: int) -> t.List["RandomGenerator"]:
+        """
+        Create generators for independent child streams, one for each parallel worker.
+
+        Parameters
+        ----------
+        count: int
+            The number of generators to be created.
+
+        Returns
+        -------
+        t.List[RandomGenerator]
+            The generators, every one of them having a different stream key.
+        """
+        children = [
+            RandomGenerator(self.seed, self.stream + (self._spawned + index,), use_numpy=self._numpy is not None)
+            for index in range(count)
+        ]
+        self._spawned += count
+        return children
+
+    def _uniform_values(self, count: int, low: t.Union[int, float], high: t.Union[int, float]) -> list:
+        if self._numpy is not None:
+            return self._numpy.uniform(low, high, count).tolist()
+
+        rand = self._random.random
+        span = high - low
+        return [low + span * rand() for _ in range(count)]
+
+    def _normal_values(self, count: int, mean: t.Union[int, float], std: t.Union[int, float]) -> list:
+        if self._numpy is not None:
+            return self._numpy.normal(mean, std, count).tolist()
+
+        gauss = self._random.gauss
+        return [gauss(mean, std) for _ in range(count)]
+
+    def _integer_values(self, count: int, low: int, high: int) -> list:
+        if self._numpy is not None:
+            return self._numpy.integers(low, high, count, endpoint=True).tolist()
+        return self._random.choices(range(low, high + 1), k=count)
+
+    def _sparse_values(self, count: int, density: float, low: t.Union[int, float], high: t.Union[int, float]) -> list:
+        if not 0 <= density <= 1:
+            raise ValueError("The density must be between 0 and 1.")
+
+        values = [0] * count
+        filled = round(count * density)
+        positions = self._random.sample(range(count), filled)
+        for position, value in zip(positions, self._uniform_values(filled, low, high)):
+            values[position] = value
+        return values
+
+    @staticmethod
+    def _rounded(values: list, round_digits: t.Optional[int]) -> list:
+        if round_digits is None:
+            return values
+        if round_digits == 0:
+            return [round(value) for value in values]
+        return [round(value, round_digits) for value in values]
+
+    @staticmethod
+    def _matrix(values: list, dims: Dimensions, dtype: t.Union["hm.DType", str, type, None]) -> "hm.Matrix":
+        rows, cols = dims
+        return hm.Matrix._from_rows(
+            [values[row * cols:(row + 1) * cols] for row in range(rows)], hm.dtypes.get_dtype(dtype)
+        )
+
+    @staticmethod
+    def _vector(values: list, dtype: t.Union["hm.DType", str, type, None]) -> "hm.Vector":
+        return hm.Vector._from_points(values, hm.dtypes.get_dtype(dtype))
+
+    def uniform(
+            self, dims: tuple, low: t.Union[int, float] = 0.0, high: t.Union[int, float] = 1.0,
+            round_digits: t.Optional[int] = None, dtype: t.Union["hm.DType", str, type, None] = None
+    ) -> "hm.Matrix":
+        """
+        Generate a matrix with values drawn uniformly from `[low, high]`.
+
+        Parameters
+        ----------
+        dims: tuple
+            The dimensions for the matrix to be generated.
+        low: t.Union[int, float]
+            The minimum value. Defaults to `0.0`.
+        high: t.Union[int, float]
+            The maximum value. Defaults to `1.0`.
+        round_digits: t.Optional[int]
+            The number of digits to be in the number after decimal. Set it as `0` for integral values. The values are
+            not rounded by default.
+        dtype: t.Union[DType, str, type, None]
+            The element type of the matrix. The values are kept as they are generated by default.
+
+        Returns
+        -------
+        Matrix
+            The random matrix generated.
+        """
+        dims = _check_dims(dims)
+        _check_number(low)
+        _check_number(high)
+
+        return self._matrix(self._rounded(self._uniform_values(dims[0] * dims[1], low, high), round_digits), dims, dtype)
+
+    def normal(
+            self, dims: tuple, mean: t.Union[int, float] = 0.0, std: t.Union[int, float] = 1.0,
+            round_digits: t.Optional[int] = None, dtype: t.Union["hm.DType", str, type, None] = None
+    ) -> "hm.Matrix":
+        """
+        Generate a matrix with values drawn from the normal distribution.
+
+        Parameters
+        ----------
+        dims: tuple
+            The dimensions for the matrix to be generated.
+        mean: t.Union[int, float]
+            The mean of the distribution. Defaults to `0.0`.
+        std: t.Union[int, float]
+            The standard deviation of the distribution. Defaults to `1.0`.
+        round_digits: t.Optional[int]
+            The number of digits to be in the number after decimal. The values are not rounded by default.
+        dtype: t.Union[DType, str, type, None]
+            The element type of the matrix. The values are kept as they are generated by default.
+
+        Returns
+        -------
+        Matrix
+            The random matrix generated.
+        """
+        dims = _check_dims(dims)
+        _check_number(mean)
+        _check_number(std)
+
+        return self._matrix(self._rounded(self._normal_values(dims[0] * dims[1], mean, std), round_digits), dims, dtype)
+
+    def integers(
+            self, dims: tuple, low: int, high: int, dtype: t.Union["hm.DType", str, type, None] = None
+    ) -> "hm.Matrix":
+        """
+        Generate a matrix with integers drawn uniformly from `low` to `high`, both inclusive.
+
+        Parameters
+        ----------
+        dims: tuple
+            The dimensions for the matrix to be generated.
+        low: int
+            The minimum value.
+        high: int
+            The maximum value.
+        dtype: t.Union[DType, str, type, None]
+            The element type of the matrix. The values are kept as they are generated by default.
+
+        Returns
+        -------
+        Matrix
+            The random matrix generated.
+        """
+        dims = _check_dims(dims)
+        if not (isinstance(low, int) and isinstance(high, int)):
+            raise TypeError("The bounds for generating integers must be integers.")
+
+        return self._matrix(self._integer_values(dims[0] * dims[1], low, high), dims, dtype)
+
+    def sparse(
+            self, dims: tuple, density: float = 0.1, low: t.Union[int, float] = 0.0, high: t.Union[int, float] = 1.0,
+            round_digits: t.Optional[int] = None, dtype: t.Union["hm.DType", str, type, None] = None
+    ) -> "hm.Matrix":
+        """
+        Generate a matrix with only a fraction of its values being non zero, drawn uniformly from `[low, high]`.
+
+        Parameters
+        ----------
+        dims: tuple
+            The dimensions for the matrix to be generated.
+        density: float
+            The fraction of the values to be filled. Defaults to `0.1`.
+        low: t.Union[int, float]
+            The minimum of the filled values. Defaults to `0.0`.
+        high: t.Union[int, float]
+            The maximum of the filled values. Defaults to `1.0`.
+        round_digits: t.Optional[int]
+            The number of digits to be in the number after decimal. The values are not rounded by default.
+        dtype: t.Union[DType, str, type, None]
+            The element type of the matrix. The values are kept as they are generated by default.
+
+        Returns
+        -------
+        Matrix
+            The random matrix generated.
+        """
+        dims = _check_dims(dims)
+        _check_number(low)
+        _check_number(high)
+
+        values = self._sparse_values(dims[0] * dims[1], density, low, high)
+        return self._matrix(self._rounded(values, round_digits), dims, dtype)
+
+    def uniform_vector(
+            self, size: int, low: t.Union[int, float] = 0.0, high: t.Union[int, float] = 1.0,
+            round_digits: t.Optional[int] = None, dtype: t.Union["hm.DType", str, type, None] = None
+    ) -> "hm.Vector":
+        """
+        Generate a vector of the specified size, the same way as `uniform`.
+        """
+        _check_number(low)
+        _check_number(high)
+        return self._vector(self._rounded(self._uniform_values(size, low, high), round_digits), dtype)
+
+    def normal_vector(
+            self, size: int, mean: t.Union[int, float] = 0.0, std: t.Union[int, float] = 1.0,
+            round_digits: t.Optional[int] = None, dtype: t.Union["hm.DType", str, type, None] = None
+    ) -> "hm.Vector":
+        """
+        Generate a vector of the specified size, the same way as `normal`.
+        """
+        _check_number(mean)
+        _check_number(std)
+        return self._vector(self._rounded(self._normal_values(size, mean, std), round_digits), dtype)
+
+    def integers_vector(
+            self, size: int, low: int, high: int, dtype: t.Union["hm.DType", str, type, None] = None
+    ) -> "hm.Vector":
+        """
+        Generate a vector of the specified size, the same way as `integers`.
+        """
+        if not (isinstance(low, int) and isinstance(high, int)):
+            raise TypeError("The bounds for generating integers must be integers.")
+        return self._vector(self._integer_values(size, low, high), dtype)
+
+    def sparse_vector(
+            self, size: int, density: float = 0.1, low: t.Union[int, float] = 0.0, high: t.Union[int, float] = 1.0,
+            round_digits: t.Optional[int] = None, dtype: t.Union["hm.DType", str, type, None] = None
+    ) -> "hm.Vector":
+        """
+        Generate a vector of the specified size, the same way as `sparse`.
+        """
+        _check_number(low)
+        _check_number(high)
+        return self._vector(self._rounded(self._sparse_values(size, density, low, high), round_digits), dtype)
@@ -0,0 +1,370 @@
+"""
+Instrumentation of the hot `Matrix` and `Vector` operations.
+
+When enabled, the operations are replaced on their classes by recording wrappers, and the original methods are put
+back once disabled. This means that nothing at all is paid for instrumentation while it is disabled.
+
+Only the outermost instrumented call is recorded, so the operations used internally by another one, like `__mul__`
+called by `__matmul__`, are not counted twice. Their time and allocations are included in the outer operation.
+
+The instrumentation can be enabled with `hm.instrument()`, or by setting the `HYPEMATHS_INSTRUMENT` environment
+variable before importing `hypemaths`.
+"""
+import array
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import typing as t
+
+import hypemaths as hm
+
+ENVIRONMENT_VARIABLE = "HYPEMATHS_INSTRUMENT"
+
+# The operations recorded, whenever a class defines them directly.
+OPERATIONS = (
+    "__init__", "_cleaned_matrix", "_cleaned_vector",
+    "__add__", "__radd__", "__sub__", "__rsub__", "__mul__", "__rmul__", "__matmul__", "__rmatmul__", "__truediv__",
+    "__rtruediv__", "multiply", "__abs__", "__round__", "determinant", "transpose", "clone", "solve",
+)
+
+# The maximum number of distinct shape signatures kept for every operation.
+MAX_SHAPES = 32
+
+
+class OperationStats:
+    """The statistics recorded for a single operation."""
+    __slots__ = ("calls", "total_time", "elements", "bytes_allocated", "shapes")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_time = 0.0
+        self.elements = 0
+        self.bytes_allocated = 0
+        self.shapes = {}
+
+    def to_dict(self) -> dict:
+        """
+        Returns
+        -------
+        dict
+            The statistics, in a JSON serializable form.
+        """
+        return {
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.calls if self.calls else 0.0,
+            "elements": self.elements,
+            "bytes_allocated": self.bytes_allocated,
+            "shapes": dict(self.shapes),
+        }
+
+
+def _shape(obj: t.Any) -> t.Optional[tuple]:
+    """
+    Parameters
+    ----------
+    obj: t.Any
+        The operand or the result of an operation.
+
+    Returns
+    -------
+    t.Optional[tuple]
+        The shape of matrices, vectors and lists, or `None` for anything else.
+    """
+    if isinstance(obj, hm.Matrix):
+        return obj.rows, obj.cols
+    if isinstance(obj, hm.Vector):
+        return len(obj),
+    if isinstance(obj, list) and obj:
+        if isinstance(obj[0], list):
+            return len(obj), len(obj[0])
+        return len(obj),
+    return None
+
+
+def _storage_bytes(storage: t.Any) -> int:
+    """Measure nested lists, typed arrays and numbers, including every list and value they hold."""
+    if isinstance(storage, list):
+        return sys.getsizeof(storage) + sum(map(_storage_bytes, storage))
+    if isinstance(storage, (array.array, int, float, complex)):
+        return sys.getsizeof(storage)
+    return 0
+
+
+def _allocated_bytes(obj: t.Any) -> int:
+    """
+    Parameters
+    ----------
+    obj: t.Any
+        The result of an operation.
+
+    Returns
+    -------
+    int
+        An estimation of the memory taken by the storage owned by the result. A copy-on-write storage shared with
+        other matrices or vectors is not counted, as the result didn't allocate it, and structured matrices are
+        measured by their compact storage. Values shared with other objects, like small integers, are still counted.
+    """
+    if isinstance(obj, hm.models.structured.StructuredMatrix):
+        return sum(_storage_bytes(value) for value in obj.__dict__.values() if isinstance(value, list))
+
+    if isinstance(obj, (hm.Matrix, hm.Vector)):
+        refs = obj.__dict__.get("_refs")
+        if refs is not None and refs[0] > 1:
+            return 0
+        obj = obj._read()
+
+    if not isinstance(obj, list):
+        return sys.getsizeof(obj) if isinstance(obj, (int, float)) else 0
+    return _storage_bytes(obj)
+
+
+class Instrumentation:
+    """
+    The recorder collecting the statistics for every instrumented operation.
+
+    A single instance of this is used by the module level functions, and it can also be used as a context manager to
+    instrument a block of code.
+    """
+    def __init__(self) -> None:
+        self.enabled = False
+        self.stats = {}
+        self.callbacks = []
+        # The callbacks added by `enable`, which are removed again by `disable`.
+        self._session_callbacks = []
+        self._targets = []
+        self._originals = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def register(self, cls: type, *names: str) -> None:
+        """
+        Register extra operations of a class to be instrumented.
+
+        Parameters
+        ----------
+        cls: type
+            The class defining the operations.
+        names: str
+            The names of the methods to be instrumented.
+        """
+        self._targets.append((cls, names))
+        if self.enabled:
+            self._patch(cls, names)
+
+    def _default_targets(self) -> t.Iterator[t.Tuple[type, tuple]]:
+        classes = [hm.Matrix, hm.Vector]
+        pending = [hm.Matrix]
+        while pending:
+            for subclass in pending.pop().__subclasses__():
+                classes.append(subclass)
+                pending.append(subclass)
+
+        for cls in classes:
+            yield cls, tuple(name for name in OPERATIONS if name in cls.__dict__)
+
+    def _wrap(self, label: str, function: t.Callable) -> t.Callable:
+        is_init = function.__name__ == "__init__"
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs) -> t.Any:
+            depth = getattr(self._local, "depth", 0)
+            if depth:
+                return function(*args, **kwargs)
+
+            self._local.depth = 1
+            try:
+                start = time.perf_counter()
+                result = function(*args, **kwargs)
+                elapsed = time.perf_counter() - start
+            finally:
+                self._local.depth = 0
+
+            operands = args[:1] if is_init else args
+            shapes = tuple(shape for shape in map(_shape, operands) if shape is not None)
+            if not shapes and _shape(result) is not None:
+                shapes = _shape(result),
+            elements = 0
+            for shape in shapes:
+                count = 1
+                for dimension in shape:
+                    count *= dimension
+                elements += count
+
+            self._record(label, elapsed, elements, _allocated_bytes(args[0] if is_init else result), shapes)
+            return result
+
+        return wrapper
+
+    def _patch(self, cls: type, names: tuple) -> None:
+        for name in names:
+            original = cls.__dict__.get(name)
+            if original is None:
+                continue
+
+            label = f"{cls.__name__}.{name}"
+            if isinstance(original, staticmethod):
+                wrapped = staticmethod(self._wrap(label, original.__func__))
+            elif isinstance(original, classmethod):
+                wrapped = classmethod(self._wrap(label, original.__func__))
+            else:
+                wrapped = self._wrap(label, original)
+
+            self._originals.append((cls, name, original))
+            setattr(cls, name, wrapped)
+
+    def _record(self, label: str, elapsed: float, elements: int, allocated: int, shapes: tuple) -> None:
+        with self._lock:
+            stats = self.stats.get(label)
+            if stats is None:
+                stats = self.stats[label] = OperationStats()
+
+            stats.calls += 1
+            stats.total_time += elapsed
+            stats.elements += elements
+            stats.bytes_allocated += allocated
+
+            signature = " x ".join(str(shape) for shape in shapes)
+            if signature in stats.shapes or len(stats.shapes) < MAX_SHAPES:
+                stats.shapes[signature] = stats.shapes.get(signature, 0) + 1
+
+        if self.callbacks:
+            event = {
+                "operation": label,
+                "time": elapsed,
+                "elements": elements,
+                "bytes_allocated": allocated,
+                "shapes": shapes,
+            }
+            for callback in self.callbacks:
+                callback(event)
+
+    def enable(self, callback: t.Optional[t.Callable[[dict], None]] = None) -> "Instrumentation":
+        """
+        Start instrumenting the operations.
+
+        Parameters
+        ----------
+        callback: t.Optional[t.Callable[[dict], None]]
+            A function called with the event of every recorded operation call, until the instrumentation is disabled.
+
+        Returns
+        -------
+        Instrumentation
+            The recorder itself, so that it can be used as a context manager.
+        """
+        if callback is not None:
+            self.add_callback(callback)
+            self._session_callbacks.append(callback)
+
+        if not self.enabled:
+            for cls, names in list(self._default_targets()) + self._targets:
+                self._patch(cls, names)
+            self.enabled = True
+
+        return self
+
+    def disable(self) -> None:
+        """Stop instrumenting the operations, restore the original methods and remove the callbacks passed to `enable`."""
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+
+        for callback in self._session_callbacks:
+            if callback in self.callbacks:
+                self.callbacks.remove(callback)
+
+        self._session_callbacks.clear()
+        self._originals.clear()
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Clear all the statistics recorded."""
+        with self._lock:
+            self.stats.clear()
+
+    def add_callback(self, callback: t.Callable[[dict], None]) -> None:
+        """
+        Parameters
+        ----------
+        callback: t.Callable[[dict], None]
+            A function called with the event of every recorded operation call, used for exporting the metrics.
+        """
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback: t.Callable[[dict], None]) -> None:
+        self.callbacks.remove(callback)
+
+    def report(self) -> dict:
+        """
+        Returns
+        -------
+        dict
+            The statistics for every recorded operation, sorted by the total time spent in them.
+        """
+        with self._lock:
+            items = sorted(self.stats.items(), key=lambda item: item[1].total_time, reverse=True)
+            return {label: stats.to_dict() for label, stats in items}
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Returns
+        -------
+        str
+            The report serialized as JSON. The keyword arguments are passed to `json.dumps`.
+        """
+        return json.dumps(self.report(), **kwargs)
+
+    def __enter__(self) -> "Instrumentation":
+        return self.enable()
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+
+instrumentation = Instrumentation()
+
+register = instrumentation.register
+disable = instrumentation.disable
+reset = instrumentation.reset
+report = instrumentation.report
+to_json = instrumentation.to_json
+add_callback = instrumentation.add_callback
+remove_callback = instrumentation.remove_callback
+
+
+def instrument(callback: t.Optional[t.Callable[[dict], None]] = None) -> Instrumentation:
+    """
+    Enable the instrumentation of the `Matrix` and `Vector` operations.
+
+    Parameters
+    ----------
+    callback: t.Optional[t.Callable[[dict], None]]
+        A function called with the event of every recorded operation call, until the instrumentation is disabled.
+
+    Returns
+    -------
+    Instrumentation
+        The recorder, which can also be used as a context manager to disable the instrumentation on exit.
+
+    Examples
+    --------
+    >>> import hypemaths as hm
+    >>> with hm.instrument() as recorder:
+    ...     _ = hm.Matrix([[1, 2], [3, 4]]) * hm.Matrix([[1, 0], [0, 1]])
+    >>> recorder.report()["Matrix.__mul__"]["calls"]
+    1
+    """
+    return instrumentation.enable(callback)
+
+
+def is_enabled() -> bool:
+    return instrumentation.enabled
+
+
+def enable_from_environment() -> None:
+    """Enable the instrumentation if the `HYPEMATHS_INSTRUMENT` environment variable is set to a truthy value."""
+    if os.environ.get(ENVIRONMENT_VARIABLE, "").strip().lower() not in ("", "0", "false", "no", "off"):
+        instrument()
@@ -1,2 +1,16 @@
+from hypemaths.models.block import BlockMatrix
+from hypemaths.models.inverse import MatrixInverse
+from hypemaths.models.kronecker import KroneckerOperator
 from hypemaths.models.matrix import Matrix
+from hypemaths.models.modular import ModMatrix
+from hypemaths.models.structured import (
+    BandedMatrix,
+    CirculantMatrix,
+    DiagonalMatrix,
+    Identity,
+    SymmetricMatrix,
+    ToeplitzMatrix,
+    TriangularMatrix,
+    detect_structure
+)
 from hypemaths.models.vector import Vector
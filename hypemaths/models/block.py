@@ -0,0 +1,240 @@
+import typing as t
+
+import hypemaths as hm
+from hypemaths.exceptions import MatrixDimensionError, SingularMatrixError
+from hypemaths.models.matrix import Matrix
+
+
+def _slice(matrix: Matrix, rows: t.Optional[slice] = None, cols: t.Optional[slice] = None) -> Matrix:
+    """Copy a rectangular part of a matrix into a new matrix, all the rows or columns being taken by default."""
+    rows = slice(None) if rows is None else rows
+    cols = slice(None) if cols is None else cols
+    return Matrix._from_rows([list(row[cols]) for row in matrix._read()[rows]])
+
+
+def _offsets(sizes: list) -> list:
+    offsets = [0]
+    for size in sizes:
+        offsets.append(offsets[-1] + size)
+    return offsets
+
+
+class BlockMatrix:
+    def __init__(self, blocks: t.Sequence[t.Sequence[Matrix]]) -> None:
+        """
+        A lazy matrix made of a 2D grid of blocks, which are never assembled unless `to_matrix` is called.
+
+        Operations between block matrices with the same partitioning, and matrix products and linear systems, are
+        computed block by block.
+
+        Parameters
+        ----------
+        blocks: t.Sequence[t.Sequence[Matrix]]
+            The blocks, as a list of block rows. The blocks in a block row must have the same number of rows, and the
+            blocks in a block column the same number of columns.
+
+        Examples
+        --------
+        Solve a saddle point system without assembling it.
+
+        >>> from hypemaths import Vector
+        >>> a = Matrix([[2, 0], [0, 2]])
+        >>> b = Matrix([[1], [1]])
+        >>> kkt = BlockMatrix([[a, b], [b.transpose(), Matrix([[0]])]])
+        >>> kkt.solve(Vector(3, 3, 2))
+        Vector([1.0, 1.0, 1.0])
+        """
+        self.row_sizes, self.col_sizes = Matrix._block_layout(blocks)
+        self.blocks = [list(block_row) for block_row in blocks]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.blocks})"
+
+    @property
+    def rows(self) -> int:
+        return sum(self.row_sizes)
+
+    @property
+    def cols(self) -> int:
+        return sum(self.col_sizes)
+
+    @property
+    def dims(self) -> tuple:
+        return self.rows, self.cols
+
+    def __getitem__(self, index: tuple) -> t.Union[int, float]:
+        row, col = index
+        if row < 0:
+            row += self.rows
+        if col < 0:
+            col += self.cols
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError("Matrix index out of range.")
+
+        for block_row, size in zip(self.blocks, self.row_sizes):
+            if row < size:
+                for block in block_row:
+                    if col < block.cols:
+                        return block[row, col]
+                    col -= block.cols
+            row -= size
+
+    def to_matrix(self) -> Matrix:
+        """
+        Assemble the blocks into a dense `Matrix`.
+
+        Returns
+        -------
+        Matrix
+            The dense matrix.
+        """
+        return Matrix.block(self.blocks)
+
+    def _same_partition(self, other: "BlockMatrix", operation: str) -> None:
+        if (self.row_sizes, self.col_sizes) != (other.row_sizes, other.col_sizes):
+            raise MatrixDimensionError(f"These block matrices cannot be {operation} due to different partitioning.")
+
+    def __add__(self, other: "BlockMatrix") -> "BlockMatrix":
+        if not isinstance(other, BlockMatrix):
+            raise TypeError(f"Block matrix can only be added with other block matrix. Not {type(other)}")
+
+        self._same_partition(other, "added")
+        return BlockMatrix([
+            [a + b for a, b in zip(self_row, other_row)] for self_row, other_row in zip(self.blocks, other.blocks)
+        ])
+
+    def __sub__(self, other: "BlockMatrix") -> "BlockMatrix":
+        if not isinstance(other, BlockMatrix):
+            raise TypeError(f"Block matrix can only be subtracted with other block matrix. Not {type(other)}")
+
+        self._same_partition(other, "subtracted")
+        return BlockMatrix([
+            [a - b for a, b in zip(self_row, other_row)] for self_row, other_row in zip(self.blocks, other.blocks)
+        ])
+
+    def _block_product(self, parts: list) -> list:
+        """Multiply every block row by the parts of the other operand, which are split along the block columns."""
+        products = []
+        for block_row in self.blocks:
+            total = block_row[0] * parts[0]
+            for block, part in zip(block_row[1:], parts[1:]):
+                total = total + block * part
+            products.append(total)
+        return products
+
+    def __mul__(self, other: t.Union["BlockMatrix", Matrix, "hm.Vector", int, float]) -> t.Union["BlockMatrix", Matrix, "hm.Vector"]:
+        if isinstance(other, (int, float, complex)):
+            return BlockMatrix([[block * other for block in block_row] for block_row in self.blocks])
+
+        if isinstance(other, BlockMatrix):
+            if self.col_sizes != other.row_sizes:
+                if self.cols != other.rows:
+                    raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+                return self.to_matrix() * other.to_matrix()
+
+            columns = [self._block_product(list(block_col)) for block_col in zip(*other.blocks)]
+            return BlockMatrix([list(block_row) for block_row in zip(*columns)])
+
+        if isinstance(other, hm.Vector):
+            if len(other) != self.cols:
+                raise MatrixDimensionError("The vector must have the same length as the number of columns in the matrix.")
+            result = self * Matrix.from_vector(other)
+            return hm.Vector._from_points([row[0] for row in result._read()], result.dtype)
+
+        if not isinstance(other, Matrix):
+            raise TypeError(f"Matrix can only be multiplied with other matrix. Not {type(other)}")
+
+        if self.cols != other.rows:
+            raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+
+        offsets = _offsets(self.col_sizes)
+        parts = [_slice(other, slice(start, end)) for start, end in zip(offsets, offsets[1:])]
+        return Matrix.vstack(self._block_product(parts))
+
+    def __rmul__(self, other: t.Union[int, float]) -> "BlockMatrix":
+        if not isinstance(other, (int, float, complex)):
+            return NotImplemented
+        return self.__mul__(other)
+
+    def __matmul__(self, other: t.Union["BlockMatrix", Matrix, "hm.Vector"]) -> t.Union["BlockMatrix", Matrix, "hm.Vector"]:
+        return self.__mul__(other)
+
+    def transpose(self) -> "BlockMatrix":
+        """
+        Transpose the block matrix, by transposing the grid and every block in it.
+
+        Returns
+        -------
+        BlockMatrix
+            The transposed block matrix.
+        """
+        return BlockMatrix([[block.transpose() for block in block_col] for block_col in zip(*self.blocks)])
+
+    def _schur_solve(self, other: Matrix) -> Matrix:
+        """
+        Solve a 2 x 2 block system using the Schur complement `S = D - C A^-1 B` of the leading block `A`.
+
+        `A` is factorized only once, for both `A^-1 B` and `A^-1 b1`.
+        """
+        (a, b), (c, d) = self.blocks
+        size = self.row_sizes[0]
+
+        top, bottom = _slice(other, slice(None, size)), _slice(other, slice(size, None))
+        solved = a.solve(Matrix.hstack([b, top]))
+        a_inv_b, a_inv_top = _slice(solved, cols=slice(None, b.cols)), _slice(solved, cols=slice(b.cols, None))
+
+        schur = d - c * a_inv_b
+        bottom_solution = schur.solve(bottom - c * a_inv_top)
+        top_solution = a_inv_top - a_inv_b * bottom_solution
+        return Matrix.vstack([top_solution, bottom_solution])
+
+    def solve(self, other: t.Union[Matrix, "hm.Vector"]) -> t.Union[Matrix, "hm.Vector"]:
+        """
+        Solve the linear system `A x = b`, where `A` is the current block matrix.
+
+        A 2 x 2 grid with square diagonal blocks is solved block wise through the Schur complement of its leading
+        block, which only factorizes matrices of the block sizes. Any other grid, or a singular leading block, is
+        solved on the assembled matrix.
+
+        Parameters
+        ----------
+        other: t.Union[Matrix, Vector]
+            The right hand side `b`.
+
+        Returns
+        -------
+        t.Union[Matrix, Vector]
+            The solution, having the same type as the right hand side.
+
+        Raises
+        ------
+        MatrixDimensionError
+            If the right hand side doesn't have as many rows as the matrix.
+        SingularMatrixError
+            If the matrix is singular.
+        """
+        is_vector = isinstance(other, hm.Vector)
+        if is_vector:
+            if len(other) != self.rows:
+                raise MatrixDimensionError("The vector must have the same length as the number of rows in the matrix.")
+            rhs = Matrix.from_vector(other)
+        elif isinstance(other, Matrix):
+            if other.rows != self.rows:
+                raise MatrixDimensionError("The right hand side must have the same number of rows as the matrix.")
+            rhs = other
+        else:
+            raise TypeError(f"Linear system can only be solved for a Matrix or Vector. Not {type(other)}")
+
+        solution = None
+        if len(self.blocks) == 2 and len(self.blocks[0]) == 2 and self.row_sizes == self.col_sizes:
+            try:
+                solution = self._schur_solve(rhs)
+            except SingularMatrixError:
+                pass
+
+        if solution is None:
+            solution = self.to_matrix().solve(rhs)
+
+        if is_vector:
+            return hm.Vector._from_points([row[0] for row in solution._read()])
+        return solution
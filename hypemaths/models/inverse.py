@@ -0,0 +1,223 @@
+import operator
+import typing as t
+
+import hypemaths as hm
+from hypemaths.exceptions import MatrixDimensionError, MatrixNotSquare, SingularMatrixError
+from hypemaths.models.matrix import Matrix
+from hypemaths.models.utils.linalg import lu_decompose, lu_determinant, lu_inverse, lu_solve
+
+
+def _dot(first: t.Iterable, second: t.Iterable) -> t.Union[int, float, complex]:
+    return sum(map(operator.mul, first, second))
+
+
+class MatrixInverse:
+    def __init__(self, matrix: Matrix) -> None:
+        """
+        The inverse and the determinant of a square matrix, which can be updated in `O(n^2 k)` when the matrix changes
+        by a rank `k` term, instead of being computed again in `O(n^3)`.
+
+        The inverse is updated using the Sherman–Morrison and Woodbury formulas, and the determinant using the matrix
+        determinant lemma.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            The square matrix to be inverted.
+
+        Raises
+        ------
+        MatrixNotSquare
+            If the number of columns and rows are not equal in the `Matrix`.
+        SingularMatrixError
+            If the matrix is singular.
+
+        Examples
+        --------
+        >>> from hypemaths import Vector
+        >>> inverse = MatrixInverse(Matrix([[2, 0], [0, 2]]))
+        >>> inverse.update_rank1(Vector(1, 0), Vector(0, 2)).determinant()
+        4.0
+        >>> inverse.solve(Vector(4, 2))
+        Vector([1.0, 1.0])
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError(f"Only matrices can be inverted. Not {type(matrix)}")
+        if matrix.rows != matrix.cols:
+            raise MatrixNotSquare("Only square matrices can be inverted.")
+
+        lu, permutation, sign = lu_decompose(matrix._read())
+        self.size = matrix.rows
+        self._inverse = lu_inverse(lu, permutation)
+        self._determinant = lu_determinant(lu, sign)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_matrix()})"
+
+    def to_matrix(self) -> Matrix:
+        """
+        Returns
+        -------
+        Matrix
+            A copy of the current inverse.
+        """
+        return Matrix._from_rows([list(row) for row in self._inverse])
+
+    def determinant(self) -> t.Union[int, float, complex]:
+        """
+        Returns
+        -------
+        t.Union[int, float, complex]
+            The determinant of the current matrix, which is kept up to date by the updates.
+        """
+        return self._determinant
+
+    def solve(self, other: t.Union[Matrix, "hm.Vector"]) -> t.Union[Matrix, "hm.Vector"]:
+        """
+        Solve the linear system `A x = b` for the current matrix `A`, by multiplying with the inverse in `O(n^2)`.
+
+        Parameters
+        ----------
+        other: t.Union[Matrix, Vector]
+            The right hand side `b`.
+
+        Returns
+        -------
+        t.Union[Matrix, Vector]
+            The solution, having the same type as the right hand side.
+        """
+        if isinstance(other, hm.Vector):
+            points = self._points(other, "right hand side")
+            return hm.Vector._from_points([_dot(row, points) for row in self._inverse])
+
+        if not isinstance(other, Matrix):
+            raise TypeError(f"Linear system can only be solved for a Matrix or Vector. Not {type(other)}")
+        if other.rows != self.size:
+            raise MatrixDimensionError("The right hand side must have the same number of rows as the matrix.")
+
+        columns = list(zip(*other._read()))
+        return Matrix._from_rows([[_dot(row, column) for column in columns] for row in self._inverse])
+
+    def _points(self, vector: t.Union["hm.Vector", list], name: str) -> list:
+        points = list(vector._read() if isinstance(vector, hm.Vector) else vector)
+        if len(points) != self.size:
+            raise MatrixDimensionError(f"The {name} must have the same length as the size of the matrix.")
+        return points
+
+    def _columns(self, matrix: Matrix, name: str) -> list:
+        if not isinstance(matrix, Matrix):
+            raise TypeError(f"The {name} of a rank k update must be a matrix. Not {type(matrix)}")
+        if matrix.rows != self.size:
+            raise MatrixDimensionError(f"The {name} must have the same number of rows as the size of the matrix.")
+        return [list(column) for column in zip(*matrix._read())]
+
+    def update_rank1(self, u: t.Union["hm.Vector", list], v: t.Union["hm.Vector", list]) -> "MatrixInverse":
+        """
+        Update the inverse and the determinant in place, for the matrix changing into `A + u v^T`, in `O(n^2)`.
+
+        Parameters
+        ----------
+        u: t.Union[Vector, list]
+            The column vector of the update.
+        v: t.Union[Vector, list]
+            The row vector of the update.
+
+        Returns
+        -------
+        MatrixInverse
+            The same object, for chaining the updates.
+
+        Raises
+        ------
+        SingularMatrixError
+            If the updated matrix is singular. The object is left unchanged.
+        """
+        u, v = self._points(u, "vector u"), self._points(v, "vector v")
+        inverse = self._inverse
+
+        inverse_u = [_dot(row, u) for row in inverse]
+        v_inverse = [_dot(v, column) for column in zip(*inverse)]
+        denominator = 1 + _dot(v, inverse_u)
+        if denominator == 0:
+            raise SingularMatrixError("The rank 1 update makes the matrix singular.")
+
+        for index, row in enumerate(inverse):
+            scaler = inverse_u[index] / denominator
+            if scaler:
+                inverse[index] = [element - scaler * value for element, value in zip(row, v_inverse)]
+
+        self._determinant *= denominator
+        return self
+
+    def update_row(self, index: int, delta: t.Union["hm.Vector", list]) -> "MatrixInverse":
+        """
+        Update the inverse and the determinant in place, for `delta` being added to a row of the matrix.
+        """
+        u = [0] * self.size
+        u[index] = 1
+        return self.update_rank1(u, delta)
+
+    def update_column(self, index: int, delta: t.Union["hm.Vector", list]) -> "MatrixInverse":
+        """
+        Update the inverse and the determinant in place, for `delta` being added to a column of the matrix.
+        """
+        v = [0] * self.size
+        v[index] = 1
+        return self.update_rank1(delta, v)
+
+    def update_rank_k(self, u: Matrix, v: Matrix) -> "MatrixInverse":
+        """
+        Update the inverse and the determinant in place, for the matrix changing into `A + U V^T`, in `O(n^2 k)`.
+
+        The Woodbury formula only needs the `k x k` capacitance matrix `I + V^T A^-1 U` to be factorized.
+
+        Parameters
+        ----------
+        u: Matrix
+            The `n x k` matrix `U`.
+        v: Matrix
+            The `n x k` matrix `V`.
+
+        Returns
+        -------
+        MatrixInverse
+            The same object, for chaining the updates.
+
+        Raises
+        ------
+        MatrixDimensionError
+            If `U` and `V` don't have the same shape, with as many rows as the size of the matrix.
+        SingularMatrixError
+            If the updated matrix is singular. The object is left unchanged.
+        """
+        u_columns, v_columns = self._columns(u, "matrix U"), self._columns(v, "matrix V")
+        if len(u_columns) != len(v_columns):
+            raise MatrixDimensionError("The matrices U and V must have the same number of columns.")
+
+        inverse = self._inverse
+        rank = len(u_columns)
+
+        # The columns of A^-1 U, and the rows of V^T A^-1.
+        inverse_u = [[_dot(row, column) for row in inverse] for column in u_columns]
+        inverse_columns = list(zip(*inverse))
+        v_inverse = [[_dot(column, inverse_column) for inverse_column in inverse_columns] for column in v_columns]
+
+        capacitance = [
+            [(1 if row == col else 0) + _dot(v_columns[row], inverse_u[col]) for col in range(rank)]
+            for row in range(rank)
+        ]
+        try:
+            lu, permutation, sign = lu_decompose(capacitance)
+        except SingularMatrixError:
+            raise SingularMatrixError("The rank k update makes the matrix singular.") from None
+
+        # The columns of C^-1 V^T A^-1, solved one column of the n x k right hand side at a time.
+        solved = [lu_solve(lu, permutation, list(column)) for column in zip(*v_inverse)]
+
+        for index, row in enumerate(inverse):
+            scalers = [inverse_u[col][index] for col in range(rank)]
+            correction = [_dot(scalers, column) for column in solved]
+            inverse[index] = [element - value for element, value in zip(row, correction)]
+
+        self._determinant *= lu_determinant(lu, sign)
+        return self
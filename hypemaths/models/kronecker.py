@@ -0,0 +1,207 @@
+import functools
+import operator
+import typing as t
+
+import hypemaths as hm
+from hypemaths import dtypes
+from hypemaths.exceptions import MatrixDimensionError, MatrixNotSquare
+from hypemaths.models.matrix import Matrix
+
+
+def _dot(first: t.Iterable, second: t.Iterable) -> t.Union[int, float, complex]:
+    return sum(map(operator.mul, first, second))
+
+
+def _product(values: t.Iterable[int]) -> int:
+    return functools.reduce(operator.mul, values, 1)
+
+
+def _apply(factors: list, points: list) -> list:
+    """
+    Multiply `A ⊗ R` with a vector, where `A` is the first factor and `R` the Kronecker product of the others.
+
+    With the vector reshaped row major into the `n x q` matrix `X`, the product is `A X R^T` flattened row major. The
+    rows of `X R^T` are products of `R` with the rows of `X`, computed recursively, so `R` is never materialized.
+    """
+    first, rest = factors[0], factors[1:]
+    if not rest:
+        return [_dot(row, points) for row in first]
+
+    size = len(points) // len(first[0])
+    products = [_apply(rest, points[start:start + size]) for start in range(0, len(points), size)]
+
+    columns = list(zip(*products))
+    result = []
+    for row in first:
+        result.extend(_dot(row, column) for column in columns)
+    return result
+
+
+class KroneckerOperator:
+    def __init__(self, *factors: Matrix) -> None:
+        """
+        A lazy Kronecker product `A ⊗ B ⊗ ...` of matrices, which is never materialized unless `to_matrix` is called.
+
+        Products with vectors use the vec trick `(A ⊗ B) vec(X) = vec(A X B^T)`, which for two `n x n` factors costs
+        `O(n^3)` instead of the `O(n^4)` of the dense `n^2 x n^2` product, and only stores the factors. Inverses and
+        determinants are computed from the factors too.
+
+        Parameters
+        ----------
+        factors: Matrix
+            The factors of the product, from left to right.
+
+        Examples
+        --------
+        >>> from hypemaths import Vector
+        >>> product = KroneckerOperator(Matrix([[1, 2], [3, 4]]), Matrix([[0, 1], [1, 0]]))
+        >>> product * Vector(1, 2, 3, 4)
+        Vector([10, 7, 22, 15])
+        """
+        if not factors:
+            raise ValueError("At least one factor is needed for a Kronecker product.")
+        for factor in factors:
+            if not isinstance(factor, Matrix):
+                raise TypeError(f"The factors of a Kronecker product must be matrices. Not {type(factor)}")
+
+        self.factors = list(factors)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(map(repr, self.factors))})"
+
+    @property
+    def rows(self) -> int:
+        return _product(factor.rows for factor in self.factors)
+
+    @property
+    def cols(self) -> int:
+        return _product(factor.cols for factor in self.factors)
+
+    @property
+    def dims(self) -> tuple:
+        return self.rows, self.cols
+
+    @property
+    def dtype(self) -> t.Optional[dtypes.DType]:
+        return functools.reduce(dtypes.promote, (factor.dtype for factor in self.factors))
+
+    def to_matrix(self) -> Matrix:
+        """
+        Materialize the Kronecker product into a dense `Matrix`.
+
+        Returns
+        -------
+        Matrix
+            The dense matrix.
+        """
+        return functools.reduce(Matrix.kron, self.factors)
+
+    def _matvec(self, points: t.Sequence) -> list:
+        return _apply([factor._read() for factor in self.factors], list(points))
+
+    def __mul__(
+            self, other: t.Union["KroneckerOperator", Matrix, "hm.Vector", dtypes.Number]
+    ) -> t.Union["KroneckerOperator", Matrix, "hm.Vector"]:
+        if isinstance(other, (int, float, complex)):
+            return KroneckerOperator(self.factors[0] * other, *self.factors[1:])
+
+        if isinstance(other, KroneckerOperator):
+            # The mixed product property `(A ⊗ B)(C ⊗ D) = AC ⊗ BD`, when the factors can be multiplied pairwise.
+            if len(self.factors) == len(other.factors) and all(
+                    factor.cols == other_factor.rows for factor, other_factor in zip(self.factors, other.factors)
+            ):
+                return KroneckerOperator(*(factor * other_factor for factor, other_factor in zip(self.factors, other.factors)))
+            other = other.to_matrix()
+
+        if isinstance(other, hm.Vector):
+            if len(other) != self.cols:
+                raise MatrixDimensionError("The vector must have the same length as the number of columns in the matrix.")
+            return hm.Vector._from_points(self._matvec(other._read()), dtypes.promote(self.dtype, other.dtype))
+
+        if not isinstance(other, Matrix):
+            raise TypeError(f"Kronecker operator can only be multiplied with a matrix or vector. Not {type(other)}")
+        if self.cols != other.rows:
+            raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+
+        columns = [self._matvec(column) for column in zip(*other._read())]
+        return Matrix._from_rows([list(row) for row in zip(*columns)], dtypes.promote(self.dtype, other.dtype))
+
+    def __rmul__(self, other: dtypes.Number) -> "KroneckerOperator":
+        if not isinstance(other, (int, float, complex)):
+            return NotImplemented
+        return self.__mul__(other)
+
+    def __matmul__(
+            self, other: t.Union["KroneckerOperator", Matrix, "hm.Vector"]
+    ) -> t.Union["KroneckerOperator", Matrix, "hm.Vector"]:
+        return self.__mul__(other)
+
+    def transpose(self) -> "KroneckerOperator":
+        """
+        Returns
+        -------
+        KroneckerOperator
+            The transpose `A^T ⊗ B^T ⊗ ...`.
+        """
+        return KroneckerOperator(*(factor.transpose() for factor in self.factors))
+
+    def _check_square(self, operation: str) -> None:
+        for factor in self.factors:
+            if factor.rows != factor.cols:
+                raise MatrixNotSquare(f"The factors must be square matrices for the {operation}.")
+
+    def inverse(self) -> "KroneckerOperator":
+        """
+        Compute the inverse `A^-1 ⊗ B^-1 ⊗ ...`, by inverting only the factors.
+
+        Returns
+        -------
+        KroneckerOperator
+            The inverse, which is also lazy.
+
+        Raises
+        ------
+        MatrixNotSquare
+            If any factor isn't square.
+        SingularMatrixError
+            If any factor is singular.
+        """
+        self._check_square("inverse")
+        return KroneckerOperator(*(factor.inverse() for factor in self.factors))
+
+    def solve(self, other: t.Union[Matrix, "hm.Vector"]) -> t.Union[Matrix, "hm.Vector"]:
+        """
+        Solve the linear system `A x = b`, where `A` is the current Kronecker product, by multiplying with the
+        inverse of the factors.
+
+        Parameters
+        ----------
+        other: t.Union[Matrix, Vector]
+            The right hand side `b`.
+
+        Returns
+        -------
+        t.Union[Matrix, Vector]
+            The solution, having the same type as the right hand side.
+        """
+        return self.inverse() * other
+
+    def determinant(self) -> t.Union[int, float, complex]:
+        """
+        Compute the determinant from the factors, as `det(A ⊗ B) = det(A)^q det(B)^n` for an `n x n` `A` and a
+        `q x q` `B`.
+
+        Returns
+        -------
+        t.Union[int, float, complex]
+            The determinant of the Kronecker product.
+
+        Raises
+        ------
+        MatrixNotSquare
+            If any factor isn't square.
+        """
+        self._check_square("determinant")
+
+        size = self.rows
+        return _product(factor.determinant() ** (size // factor.rows) for factor in self.factors)
@@ -1,32 +1,124 @@
-import copy
+import array
+import itertools
 import math
-import random
+import operator
 import typing as t
 
 import hypemaths as hm
+from hypemaths import dtypes
 from hypemaths.exceptions import (
     InvalidMatrixError,
     MatrixDimensionError,
     MatrixNotSquare,
 )
+from hypemaths.generators import RandomGenerator
+from hypemaths.models.utils import reductions, serialization
+from hypemaths.models.utils.linalg import (
+    determinant_steps,
+    lu_decompose,
+    lu_inverse,
+    matmul_steps,
+    run_steps,
+    solve_columns
+)
 
 
 class Matrix:
+    # The element type of the typed storage, `None` for matrices storing the Python numbers as passed.
+    dtype = None
+
     def __init__(
             self,
-            matrix: t.Union[int, float, list] = None,
+            matrix: t.Union[int, float, complex, list] = None,
+            dtype: t.Union[dtypes.DType, str, type, None] = None
     ) -> None:
         """
         Parameters
         ----------
-        matrix : t.Union[int, float, list]
+        matrix : t.Union[int, float, complex, list]
             This is the nested 2D lists which will be converted into an efficient `Matrix` object capable of several
             calculations and features. Defaults to `None`.
+        dtype : t.Union[DType, str, type, None]
+            The element type, like `hm.float32` or `"int64"`, used for storing the values in typed storage. The values
+            are kept as they are passed by default, unless there are complex values which use `complex128`.
         """
         if not matrix:
             raise ValueError("You need to pass the 2D for the matrix object!")
         else:
-            self.matrix = self._cleaned_matrix(matrix)
+            matrix = self._cleaned_matrix(matrix)
+
+            dtype = dtypes.get_dtype(dtype)
+            if dtype is None:
+                dtype = dtypes.infer(value for row in matrix for value in row)
+
+            self._store(self._typed_rows(matrix, dtype))
+            self.dtype = dtype
+
+    @staticmethod
+    def _typed_rows(rows: t.Iterable, dtype: t.Optional[dtypes.DType]) -> list:
+        """
+        Parameters
+        ----------
+        rows: t.Iterable
+            The rows of values to be stored.
+        dtype: t.Optional[dtypes.DType]
+            The element type of the storage.
+
+        Returns
+        -------
+        list
+            The list of new rows, converted into the typed storage if a type is given. The rows passed are never used as
+            the storage, so that they can't be changed by the caller.
+        """
+        if dtype is None:
+            return [list(row) for row in rows]
+        return [dtype.storage(row) for row in rows]
+
+    @property
+    def matrix(self) -> list:
+        """
+        Returns
+        -------
+        list
+            The nested 2D list storing the values. As it can be modified by the caller, a storage shared with clones
+            is copied before being returned, and the clones made afterwards get a copy of their own.
+        """
+        self._own()
+        self._exposed = True
+        return self._matrix
+
+    @matrix.setter
+    def matrix(self, matrix: list) -> None:
+        self._store(matrix)
+        # The caller still holds the list, so it is treated like a storage returned by `matrix`.
+        self._exposed = True
+
+    def _store(self, matrix: list) -> None:
+        """Use a new nested 2D list as the storage, which must not be referenced anywhere else."""
+        self._matrix = matrix
+        self._refs = [1]
+        # If the storage, or any of its rows, has been handed out and can be modified outside of `_own`.
+        self._exposed = False
+
+    def _read(self) -> list:
+        """
+        Returns
+        -------
+        list
+            The nested 2D list storing the values, without copying a shared storage. It must never be modified.
+        """
+        return self._matrix
+
+    def _own(self) -> None:
+        """Copy the storage if it is shared with any clones, so that it can be modified safely."""
+        if self._refs[0] > 1:
+            self._refs[0] -= 1
+            self._store([row[:] for row in self._matrix])
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        return serialization.reduce(
+            self, serialization.MATRIX_MAGIC, self.dims, self._read(), protocol, _rebuild_matrix, self.dtype
+        )
 
     @property
     def rows(self) -> int:
@@ -36,7 +128,7 @@ class Matrix:
         int
             The number of rows in the 2D matrix created.
         """
-        return len(self.matrix)
+        return len(self._read())
 
     @property
     def cols(self) -> int:
@@ -46,7 +138,7 @@ class Matrix:
         int
             The number of the columns in the 2D matrix created.
         """
-        return len(self.matrix[0])
+        return len(self._read()[0])
 
     @property
     def dims(self) -> tuple:
@@ -56,10 +148,12 @@ class Matrix:
         tuple
             The tuple containing the shape or the rows and columns in the matrix created.
         """
-        return tuple(self._get_mat_dimension(self.matrix))
+        return self.rows, self.cols
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({self.matrix})"
+        if self.dtype is None:
+            return f"{self.__class__.__name__}({self._read()})"
+        return f"{self.__class__.__name__}({[list(row) for row in self._read()]}, dtype={self.dtype})"
 
     def __eq__(self, other: "Matrix") -> bool:
         if not isinstance(other, Matrix):
@@ -67,124 +161,301 @@ class Matrix:
                 f"Equality comparison with Matrix can only be performed with another Matrix, got {type(other)}"
             )
 
-        return self.matrix == other.matrix
+        if self.dtype is None and other.dtype is None:
+            return self._read() == other._read()
+        return [list(row) for row in self._read()] == [list(row) for row in other._read()]
 
-    def __getitem__(self, index: t.Union[int, tuple]) -> t.Union[int, float, list]:
+    def __getitem__(self, index: t.Union[int, tuple]) -> t.Union[int, float, complex, list]:
         if isinstance(index, int):
             return self.matrix[index]
         else:
-            return self.matrix[index[0]][index[1]]
+            return self._read()[index[0]][index[1]]
+
+    def __iter__(self) -> t.Iterator[list]:
+        return iter(self.matrix)
 
-    def __setitem__(self, index: t.Union[int, tuple], value: t.Union[int, float]) -> None:
-        if isinstance(value, (int, float)):
+    def __setitem__(self, index: t.Union[int, tuple], value: t.Union[int, float, complex]) -> None:
+        if isinstance(value, (int, float, complex)):
+            if self.dtype is not None:
+                value = self.dtype.cast(value)
+            elif isinstance(value, complex):
+                raise TypeError("Complex values can only be stored in matrices with a complex dtype.")
+
+            self._own()
             if isinstance(index, int):
-                self.matrix[index] = value
+                self._matrix[index] = value
             else:
-                self.matrix[index[0]][index[1]] = value
+                self._matrix[index[0]][index[1]] = value
         else:
             raise TypeError(
-                f"All values must be integers or floats, but value[{value}] is {type(value)}."
+                f"All values must be integers, floats or complex numbers, but value[{value}] is {type(value)}."
             )
 
-    def __add__(self, other: "Matrix") -> "Matrix":
-        cls = self.__class__
+    def _broadcast_rows(self, other: t.Union["Matrix", "hm.Vector"], operation: str) -> list:
+        """
+        Get the rows of the other operand of an elementwise operation. A `Vector` is used as a row when its size matches
+        the columns of this matrix, else as a column when its size matches the rows.
+        """
+        if isinstance(other, Matrix):
+            return other._read()
+
+        if isinstance(other, hm.Vector):
+            points = other._read()
+            if len(points) == self.cols:
+                return [points]
+            if len(points) == self.rows:
+                return [[point] for point in points]
+            raise MatrixDimensionError(f"The vector cannot be {operation} due to wrong dimensions.")
+
+        raise TypeError(f"Matrix can only be {operation} with other matrix, vector or scalar. Not {type(other)}")
+
+    def _broadcast(
+            self, other: t.Union["Matrix", "hm.Vector", dtypes.Number], function: t.Callable, operation: str,
+            reflected: bool = False
+    ) -> "Matrix":
+        """
+        Apply an elementwise operation, broadcasting a scalar, a single row or a single column over the other operand.
 
-        if not isinstance(other, cls):
-            raise TypeError(f"Matrix can only be added with other matrix. Not {type(other)}")
+        The smaller operand is never expanded, its row or value is reused for every row of the result.
 
-        if not (self.rows, self.cols) == (other.rows, other.cols):
-            raise MatrixDimensionError("These matrices cannot be added due to wrong dimensions.")
+        Parameters
+        ----------
+        other: t.Union[Matrix, Vector, Number]
+            The other operand.
+        function: t.Callable
+            The binary function applied on the elements, like `operator.add`.
+        operation: str
+            The name of the operation for the error messages, like `"added"`.
+        reflected: bool
+            If the other operand is the left operand of the operation. Defaults to `False`.
 
-        matrix = [[self[row][cols] + other[row][cols] for cols in range(self.cols)] for row in range(self.rows)]
+        Returns
+        -------
+        Matrix
+            The result of the operation.
 
-        return cls(matrix)
+        Raises
+        ------
+        MatrixDimensionError
+            If the shapes of the operands cannot be broadcast together.
+        """
+        cls = self.__class__
 
-    def __sub__(self, other: "Matrix") -> "Matrix":
+        if isinstance(other, (int, float, complex)):
+            if reflected:
+                matrix = [list(map(function, itertools.repeat(other, len(row)), row)) for row in self._read()]
+            else:
+                matrix = [list(map(function, row, itertools.repeat(other))) for row in self._read()]
+            dtype = dtypes.promote_scalar(self.dtype, other)
+        else:
+            left, right = self._read(), self._broadcast_rows(other, operation)
+            if reflected:
+                left, right = right, left
+
+            left_rows, left_cols, right_rows, right_cols = len(left), len(left[0]), len(right), len(right[0])
+            rows = right_rows if left_rows == 1 else left_rows
+            cols = right_cols if left_cols == 1 else left_cols
+            if right_rows not in (1, rows) or right_cols not in (1, cols):
+                raise MatrixDimensionError(f"These matrices cannot be {operation} due to wrong dimensions.")
+
+            matrix = []
+            for index in range(rows):
+                left_row = left[index if left_rows > 1 else 0]
+                right_row = right[index if right_rows > 1 else 0]
+                if left_cols == right_cols:
+                    matrix.append(list(map(function, left_row, right_row)))
+                elif left_cols == 1:
+                    matrix.append(list(map(function, itertools.repeat(left_row[0], cols), right_row)))
+                else:
+                    matrix.append(list(map(function, left_row, itertools.repeat(right_row[0]))))
+            dtype = dtypes.promote(self.dtype, other.dtype)
+
+        if function is operator.truediv:
+            dtype = dtypes.true_divide(dtype)
+        return cls._from_rows(matrix, dtype)
+
+    def __add__(self, other: t.Union["Matrix", "hm.Vector", dtypes.Number]) -> "Matrix":
+        return self._broadcast(other, operator.add, "added")
+
+    def __sub__(self, other: t.Union["Matrix", "hm.Vector", dtypes.Number]) -> "Matrix":
+        return self._broadcast(other, operator.sub, "subtracted")
+
+    def __mul__(self, other: t.Union["Matrix", "hm.Vector", dtypes.Number]) -> "Matrix":
         cls = self.__class__
 
+        if isinstance(other, (int, float, complex, hm.Vector)):
+            return self._broadcast(other, operator.mul, "multiplied")
+
         if not isinstance(other, cls):
-            raise TypeError(f"Matrix can only be subtracted with other matrix. Not {type(other)}")
+            raise TypeError(f"Matrix can only be multiplied with other matrix. Not {type(other)}")
 
-        if not (self.rows, self.cols) == (other.rows, other.cols):
-            raise MatrixDimensionError("These matrices cannot be subtracted due to wrong dimensions.")
+        if self.cols != other.rows:
+            raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
 
-        matrix = [[self[row][cols] - other[row][cols] for cols in range(self.cols)] for row in range(self.rows)]
+        matrix = run_steps(matmul_steps(self._read(), other._read()))
 
-        return cls(matrix)
+        return cls._from_rows(matrix, dtypes.promote(self.dtype, other.dtype))
 
-    def __mul__(self, other: t.Union["Matrix"]) -> "Matrix":
-        cls = self.__class__
+    def __truediv__(self, other: t.Union["Matrix", "hm.Vector", dtypes.Number]) -> "Matrix":
+        return self._broadcast(other, operator.truediv, "divided")
 
-        if isinstance(other, (int, float)):
-            matrix = [[element * other for element in row] for row in self]
-            return cls(matrix)
+    def __radd__(self, other: t.Union["hm.Vector", dtypes.Number]) -> "Matrix":
+        return self._broadcast(other, operator.add, "added", reflected=True)
 
-        if not isinstance(other, cls):
-            raise TypeError(f"Matrix can only be multiplied with other matrix. Not {type(other)}")
+    def __rsub__(self, other: t.Union["hm.Vector", dtypes.Number]) -> "Matrix":
+        return self._broadcast(other, operator.sub, "subtracted", reflected=True)
 
-        if self.cols != other.rows:
-            raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+    def __rmul__(self, other: t.Union["hm.Vector", dtypes.Number]) -> "Matrix":
+        return self._broadcast(other, operator.mul, "multiplied", reflected=True)
 
-        matrix = [[
-            sum(a * b for a, b in zip(self_row, other_col)) for other_col in zip(*other)] for self_row in self
-        ]
+    def __rtruediv__(self, other: t.Union["hm.Vector", dtypes.Number]) -> "Matrix":
+        return self._broadcast(other, operator.truediv, "divided", reflected=True)
 
-        return cls(matrix)
+    def __matmul__(self, other: "Matrix") -> "Matrix":
+        return self.__mul__(other)
 
-    def __truediv__(self, other: "Matrix") -> "Matrix":
-        cls = self.__class__
+    def multiply(self, other: t.Union["Matrix", "hm.Vector", dtypes.Number]) -> "Matrix":
+        """
+        Multiply the matrices elementwise, as `*` between two matrices is the matrix multiplication.
 
-        if isinstance(other, (int, float)):
-            matrix = [[element / other for element in row] for row in self]
-            return cls(matrix)
+        The operands are broadcast like with `+`, `-` and `/`: a scalar, a `1 x n` row, an `n x 1` column or a `Vector`
+        is applied to every row or column without being expanded.
 
-        if not isinstance(other, cls):
-            raise TypeError(f"Matrix can only be divided with other matrix. Not {type(other)}")
+        Parameters
+        ----------
+        other: t.Union[Matrix, Vector, Number]
+            The other operand.
 
-        if self.cols != other.rows:
-            raise MatrixDimensionError("These matrices cannot be divided due to wrong dimensions.")
+        Returns
+        -------
+        Matrix
+            The elementwise product.
 
-        matrix = [[
-            sum(a / b for a, b in zip(self_row, other_col)) for other_col in zip(*other)] for self_row in self
-        ]
+        Examples
+        --------
+        >>> Matrix([[1, 2], [3, 4]]).multiply(Matrix([[10], [100]]))
+        Matrix([[10, 20], [300, 400]])
+        """
+        return self._broadcast(other, operator.mul, "multiplied")
 
-        return cls(matrix)
+    def hadamard(self, other: "Matrix") -> "Matrix":
+        """
+        Compute the Hadamard product, the elementwise product of two matrices of the same shape.
 
-    def __radd__(self, other: "Matrix") -> "Matrix":
-        return self.__add__(other)
+        Unlike `multiply`, the operands are not broadcast.
 
-    def __rmul__(self, other: "Matrix") -> "Matrix":
-        return self.__mul__(other)
+        Parameters
+        ----------
+        other: Matrix
+            The other matrix.
 
-    def __matmul__(self, other: "Matrix") -> "Matrix":
-        return self.__mul__(other)
+        Returns
+        -------
+        Matrix
+            The Hadamard product.
+
+        Raises
+        ------
+        MatrixDimensionError
+            If the matrices don't have the same shape.
+
+        Examples
+        --------
+        >>> Matrix([[1, 2], [3, 4]]).hadamard(Matrix([[5, 6], [7, 8]]))
+        Matrix([[5, 12], [21, 32]])
+        """
+        if not isinstance(other, Matrix):
+            raise TypeError(f"Hadamard product can only be computed with other matrix. Not {type(other)}")
+        if self.dims != other.dims:
+            raise MatrixDimensionError("These matrices must have the same shape for the Hadamard product.")
+
+        return self._broadcast(other, operator.mul, "multiplied")
+
+    def kron(self, other: "Matrix") -> "Matrix":
+        """
+        Compute the Kronecker product `A ⊗ B`, the block matrix made of `B` scaled by every element of `A`.
+
+        The product of an `m x n` and a `p x q` matrix is `mp x nq`. Use `KroneckerOperator` to multiply with it
+        without materializing it.
+
+        Parameters
+        ----------
+        other: Matrix
+            The right factor `B`.
+
+        Returns
+        -------
+        Matrix
+            The Kronecker product.
+
+        Examples
+        --------
+        >>> Matrix([[1, 2]]).kron(Matrix([[1], [10]]))
+        Matrix([[1, 2], [10, 20]])
+        """
+        if not isinstance(other, Matrix):
+            raise TypeError(f"Kronecker product can only be computed with other matrix. Not {type(other)}")
+
+        other_rows = other._read()
+        matrix = [
+            [element * value for element in row for value in other_row]
+            for row in self._read() for other_row in other_rows
+        ]
+        return Matrix._from_rows(matrix, dtypes.promote(self.dtype, other.dtype))
 
     def __abs__(self) -> "Matrix":
         cls = self.__class__
 
-        matrix = [[abs(self[row][cols]) for cols in range(self.cols)] for row in range(self.rows)]
-        return cls(matrix)
+        matrix = [[abs(element) for element in row] for row in self._read()]
+        dtype = dtypes.float64 if self.dtype is dtypes.complex128 else self.dtype
+        return cls._from_rows(matrix, dtype)
 
     def __round__(self, n: t.Optional[int] = None) -> "Matrix":
         cls = self.__class__
 
-        matrix = [[round(self[row][cols], ndigits=n) for cols in range(self.cols)] for row in range(self.rows)]
-        return cls(matrix)
+        matrix = [[round(element, ndigits=n) for element in row] for row in self._read()]
+        return cls._from_rows(matrix, self.dtype)
 
     def __int__(self) -> "Matrix":
         cls = self.__class__
 
-        matrix = [[int(self[row][cols]) for cols in range(self.cols)] for row in range(self.rows)]
+        matrix = [[int(element) for element in row] for row in self._read()]
         return cls(matrix)
 
     def __float__(self) -> "Matrix":
         cls = self.__class__
 
-        matrix = [[float(self[row][cols]) for cols in range(self.cols)] for row in range(self.rows)]
+        matrix = [[float(element) for element in row] for row in self._read()]
         return cls(matrix)
 
+    def astype(self, dtype: t.Union[dtypes.DType, str, type, None]) -> "Matrix":
+        """
+        Convert the matrix to another element type.
+
+        Parameters
+        ----------
+        dtype: t.Union[DType, str, type, None]
+            The element type to be converted to. `None` gives a matrix with untyped storage.
+
+        Returns
+        -------
+        Matrix
+            The converted, general matrix. Floats are truncated when converted into integers.
+
+        Examples
+        --------
+        >>> Matrix([[1.5, 2.5]]).astype("int64")
+        Matrix([[1, 2]], dtype=int64)
+        """
+        dtype = dtypes.get_dtype(dtype)
+        if dtype is None:
+            return Matrix._from_rows([list(row) for row in self._read()])
+        return Matrix._from_rows(self._read(), dtype)
+
     @classmethod
-    def get_filled_matrix(cls, dims: tuple, fill: t.Union[int, float]) -> "Matrix":
+    def get_filled_matrix(
+            cls, dims: tuple, fill: t.Union[int, float], dtype: t.Union[dtypes.DType, str, type, None] = None
+    ) -> "Matrix":
         """
         Create a Matrix object with dimension specified containing fill value specified.
 
@@ -196,6 +467,8 @@ class Matrix:
         fill : t.Union[int, float]
             This is the fill value, which works with the `dims` parameter to create a filled matrix with the given
             value. Defaults to `None`.
+        dtype : t.Union[DType, str, type, None]
+            The element type of the matrix. The values are kept as they are by default.
 
         Returns
         -------
@@ -216,7 +489,7 @@ class Matrix:
         >>> matrix
         Matrix([[9, 9, 9], [9, 9, 9], [9, 9, 9], [9, 9, 9]])
         """
-        return cls(cls._create_filled_matrix(dims, fill))
+        return cls(cls._create_filled_matrix(dims, fill), dtype=dtype)
 
     @classmethod
     def get_randomized_matrix(
@@ -225,6 +498,9 @@ class Matrix:
         """
         Generate a random matrix object with the specified parameters.
 
+        The values are generated in bulk using a `RandomGenerator` of its own, so the global state of the `random`
+        module is never modified. Use `RandomGenerator` directly for other distributions, or parallel streams.
+
         Parameters
         ----------
         dims: tuple
@@ -263,34 +539,30 @@ class Matrix:
         >>> matrix
         Matrix([[5.82294, 4.2912], [1.52199, 5.56692]])
         """
-        def is_float_or_int(value: t.Any) -> bool:
-            if not isinstance(value, (int, float)):
-                raise TypeError(
-                    f"The values or value must be integer or float, but the given fill value is {type(value)}."
-                )
-            return True
+        generator = RandomGenerator(seed)
+        return cls._from_rows(generator.uniform(dims, min_value, max_value, round_digits=round_digits or 0)._read())
 
-        if len(dims) != 2:
-            raise ValueError("You must pass the 2 DIMENSIONS for the Matrix fill.")
+    @classmethod
+    def _from_rows(cls, rows: list, dtype: t.Optional[dtypes.DType] = None) -> "Matrix":
+        """
+        Create the matrix directly from a nested 2D list which is known to be valid, skipping the validation.
 
-        if is_float_or_int(min_value) and is_float_or_int(max_value):
-            if seed is not None:
-                random.seed(seed)
-
-            if not round_digits:
-                matrix = [
-                    [
-                        round(random.uniform(min_value, max_value)) for _ in range(dims[1])
-                    ] for _ in range(dims[0])
-                ]
-                return cls(matrix)
-            else:
-                matrix = [
-                    [
-                        round(random.uniform(min_value, max_value), ndigits=round_digits) for _ in range(dims[1])
-                    ] for _ in range(dims[0])
-                ]
-                return cls(matrix)
+        Parameters
+        ----------
+        rows: list
+            The valid nested 2D list, which is used as the storage without copying when no `dtype` is given.
+        dtype: t.Optional[dtypes.DType]
+            The element type, for converting the rows into the typed storage.
+
+        Returns
+        -------
+        Matrix
+            The matrix created.
+        """
+        matrix = cls.__new__(cls)
+        matrix._store(rows if dtype is None else cls._typed_rows(rows, dtype))
+        matrix.dtype = dtype
+        return matrix
 
     @staticmethod
     def _cleaned_matrix(matrix: list) -> list:
@@ -310,7 +582,7 @@ class Matrix:
         Raises
         ------
         TypeError
-            If the matrix contains any datatype other than `int` or `float`.
+            If the matrix contains any datatype other than `int`, `float` or `complex`.
         InvalidMatrixError
             If the matrix has invalid size or cannot be validated.
         """
@@ -326,7 +598,7 @@ class Matrix:
             bool
                 If the matrix passed contains sublist.
             """
-            return all(isinstance(element, list) for element in mat)
+            return all(isinstance(element, (list, array.array)) for element in mat)
 
         def value_check(mat: list) -> bool:
             """
@@ -338,22 +610,23 @@ class Matrix:
             Returns
             -------
             bool
-                If the matrix contains any datatypes other than `int` or `float`.
+                If the matrix contains any datatypes other than `int`, `float` or `complex`.
 
             Raises
             ------
             TypeError
-                Raised if the matrix consists of value which is not a `int` or `float`.
+                Raised if the matrix consists of value which is not a `int`, `float` or `complex`.
             """
             for row, row_values in enumerate(mat):
                 for col, value in enumerate(row_values):
-                    if not isinstance(value, (int, float)):
+                    if not isinstance(value, (int, float, complex)):
                         raise TypeError(
-                            f"All values must be integers or floats, but value[{row}][{col}] is {type(value)}"
+                            f"All values must be integers, floats or complex numbers, but value[{row}][{col}] is "
+                            f"{type(value)}"
                         )
             return True
 
-        if isinstance(matrix, (int, float)):
+        if isinstance(matrix, (int, float, complex)):
             return [[matrix]]
 
         matrix = [matrix] if not contains_sublist(matrix) else matrix
@@ -425,6 +698,10 @@ class Matrix:
         """
         Returns the copy of the matrix.
 
+        The copy is a copy-on-write snapshot, which takes constant time as the storage is shared until either of the
+        matrices is modified. A storage whose rows have been handed out, by `matrix`, indexing with a single index or
+        iterating, is copied right away instead, as the rows can still be modified through those references.
+
         Returns
         -------
         Matrix
@@ -438,7 +715,42 @@ class Matrix:
         >>> matrix.clone()
         Matrix([[1, 2], [3, 4]])
         """
-        return copy.deepcopy(self)
+        cls = self.__class__
+
+        clone = cls.__new__(cls)
+        clone.__dict__.update(self.__dict__)
+        if self._exposed:
+            clone._store([row[:] for row in self._read()])
+        else:
+            self._refs[0] += 1
+
+        return clone
+
+    def copy(self, deep: bool = False) -> "Matrix":
+        """
+        Returns the copy of the matrix.
+
+        Parameters
+        ----------
+        deep: bool
+            If the storage should be copied right away, instead of returning a copy-on-write snapshot like `clone`.
+            Defaults to `False`.
+
+        Returns
+        -------
+        Matrix
+            The copy of the present matrix.
+        """
+        if not deep:
+            return self.clone()
+
+        cls = self.__class__
+
+        copied = cls.__new__(cls)
+        copied.__dict__.update(self.__dict__)
+        copied._store([row[:] for row in self._read()])
+
+        return copied
 
     def trace(self) -> t.Union[int, float]:
         """
@@ -466,8 +778,8 @@ class Matrix:
             raise MatrixNotSquare("Cannot retrieve the sum of diagonals as the row and column count are not same.")
 
         total = 0
-        for i in range(self.rows):
-            total += self[i, i]
+        for i, row in enumerate(self._read()):
+            total += row[i]
         return total
 
     def transpose(self) -> "Matrix":
@@ -489,9 +801,9 @@ class Matrix:
         """
         cls = self.__class__
 
-        matrix = [[self[cols][row] for cols in range(self.rows)] for row in range(self.cols)]
+        matrix = [list(column) for column in zip(*self._read())]
 
-        return cls(matrix)
+        return cls._from_rows(matrix, self.dtype)
 
     def frobenius_norm(self) -> float:
         """
@@ -506,11 +818,204 @@ class Matrix:
             The computed frobenius norm.
         """
         sum_of_squares = 0
-        for column in self.matrix:
+        for column in self._read():
             for elem in column:
-                sum_of_squares += elem ** 2
+                sum_of_squares += abs(elem) ** 2
         return math.sqrt(sum_of_squares)
 
+    @staticmethod
+    def _check_axis(axis: t.Optional[int]) -> None:
+        if axis not in (None, 0, 1):
+            raise ValueError(f"The axis must be None, 0 for the columns or 1 for the rows, got {axis!r}.")
+
+    def sum(self, axis: t.Optional[int] = None) -> t.Union["hm.Vector", dtypes.Number]:
+        """
+        Sum the elements of the matrix.
+
+        Parameters
+        ----------
+        axis: t.Optional[int]
+            `None` for summing all the elements, `0` for the sum of every column and `1` for the sum of every row.
+            Defaults to `None`.
+
+        Returns
+        -------
+        t.Union[Vector, Number]
+            The sum of all the elements, or a vector with the sum of every column or row.
+
+        Examples
+        --------
+        >>> matrix = Matrix([[1, 2], [3, 4]])
+        >>> matrix.sum()
+        10
+        >>> matrix.sum(axis=0)
+        Vector([4, 6])
+        """
+        self._check_axis(axis)
+
+        rows = self._read()
+        if axis is None:
+            return sum(map(sum, rows))
+        if axis == 0:
+            return hm.Vector._from_points(reductions.column_totals(rows, operator.add), self.dtype)
+        return hm.Vector._from_points([sum(row) for row in rows], self.dtype)
+
+    def mean(self, axis: t.Optional[int] = None) -> t.Union["hm.Vector", dtypes.Number]:
+        """
+        Compute the arithmetic mean of the elements of the matrix.
+
+        Parameters
+        ----------
+        axis: t.Optional[int]
+            `None` for the mean of all the elements, `0` for the mean of every column and `1` for the mean of every
+            row. Defaults to `None`.
+
+        Returns
+        -------
+        t.Union[Vector, Number]
+            The mean of all the elements, or a vector with the mean of every column or row.
+        """
+        self._check_axis(axis)
+
+        total = self.sum(axis)
+        if axis is None:
+            return total / (self.rows * self.cols)
+        return total / (self.rows if axis == 0 else self.cols)
+
+    def _extreme(self, axis: t.Optional[int], function: t.Callable) -> t.Union["hm.Vector", dtypes.Number]:
+        self._check_axis(axis)
+
+        rows = self._read()
+        if axis is None:
+            return function(map(function, rows))
+        if axis == 0:
+            return hm.Vector._from_points(reductions.column_totals(rows, function), self.dtype)
+        return hm.Vector._from_points([function(row) for row in rows], self.dtype)
+
+    def min(self, axis: t.Optional[int] = None) -> t.Union["hm.Vector", dtypes.Number]:
+        """
+        Find the minimum of the elements of the matrix.
+
+        Parameters
+        ----------
+        axis: t.Optional[int]
+            `None` for the minimum of all the elements, `0` for the minimum of every column and `1` for the minimum of
+            every row. Defaults to `None`.
+
+        Returns
+        -------
+        t.Union[Vector, Number]
+            The minimum of all the elements, or a vector with the minimum of every column or row.
+        """
+        return self._extreme(axis, min)
+
+    def max(self, axis: t.Optional[int] = None) -> t.Union["hm.Vector", dtypes.Number]:
+        """
+        Find the maximum of the elements of the matrix, the same way as `min`.
+        """
+        return self._extreme(axis, max)
+
+    def _arg_extreme(self, axis: t.Optional[int], better: t.Callable) -> t.Union["hm.Vector", int]:
+        self._check_axis(axis)
+
+        rows = self._read()
+        if axis == 0:
+            return hm.Vector._from_points(reductions.column_arg_best(rows, better)[0])
+
+        row_indices = [reductions.arg_best(row, better) for row in rows]
+        if axis == 1:
+            return hm.Vector._from_points(row_indices)
+
+        row = reductions.arg_best([row[index] for row, index in zip(rows, row_indices)], better)
+        return row * self.cols + row_indices[row]
+
+    def argmin(self, axis: t.Optional[int] = None) -> t.Union["hm.Vector", int]:
+        """
+        Find the position of the minimum of the elements of the matrix. The first position is used for ties.
+
+        Parameters
+        ----------
+        axis: t.Optional[int]
+            `None` for the position in all the elements, `0` for the row of the minimum in every column and `1` for
+            the column of the minimum in every row. Defaults to `None`.
+
+        Returns
+        -------
+        t.Union[Vector, int]
+            The row major index of the minimum in all the elements, which is `row * cols + col`, or a vector with the
+            index of the minimum in every column or row.
+
+        Examples
+        --------
+        >>> matrix = Matrix([[3, 1], [0, 4]])
+        >>> matrix.argmin()
+        2
+        >>> matrix.argmin(axis=1)
+        Vector([1, 0])
+        """
+        return self._arg_extreme(axis, operator.lt)
+
+    def argmax(self, axis: t.Optional[int] = None) -> t.Union["hm.Vector", int]:
+        """
+        Find the position of the maximum of the elements of the matrix, the same way as `argmin`.
+        """
+        return self._arg_extreme(axis, operator.gt)
+
+    def var(self, axis: t.Optional[int] = None, ddof: int = 0) -> t.Union["hm.Vector", float]:
+        """
+        Compute the variance of the elements of the matrix.
+
+        The variance is computed in a single pass using Welford's algorithm, which doesn't lose precision like
+        subtracting the squared mean from the mean of the squares does.
+
+        Parameters
+        ----------
+        axis: t.Optional[int]
+            `None` for the variance of all the elements, `0` for the variance of every column and `1` for the variance
+            of every row. Defaults to `None`.
+        ddof: int
+            The delta degrees of freedom, the sum of the squared deviations is divided by `n - ddof`. Use `1` for the
+            sample variance. Defaults to `0`.
+
+        Returns
+        -------
+        t.Union[Vector, float]
+            The variance of all the elements, or a vector with the variance of every column or row.
+
+        Raises
+        ------
+        ValueError
+            If there are not more than `ddof` values in each reduction.
+
+        Examples
+        --------
+        >>> Matrix([[1, 2], [3, 4]]).var(axis=0)
+        Vector([1.0, 1.0])
+        """
+        self._check_axis(axis)
+
+        count = {None: self.rows * self.cols, 0: self.rows, 1: self.cols}[axis]
+        if count <= ddof:
+            raise ValueError(f"The variance needs more than {ddof} values, but only {count} are reduced.")
+
+        rows = self._read()
+        dtype = dtypes.true_divide(self.dtype)
+        if axis is None:
+            return reductions.welford(value for row in rows for value in row)[2] / (count - ddof)
+        if axis == 0:
+            m2s = reductions.column_welford(rows)[2]
+            return hm.Vector._from_points([m2 / (count - ddof) for m2 in m2s], dtype)
+        return hm.Vector._from_points([reductions.welford(row)[2] / (count - ddof) for row in rows], dtype)
+
+    def std(self, axis: t.Optional[int] = None, ddof: int = 0) -> t.Union["hm.Vector", float]:
+        """
+        Compute the standard deviation of the elements of the matrix, which is the square root of `var`.
+        """
+        variance = self.var(axis, ddof)
+        if axis is None:
+            return math.sqrt(variance)
+        return hm.Vector._from_points([math.sqrt(value) for value in variance._read()], variance.dtype)
+
     def determinant(self) -> float:
         """
         Get the determinant of a matrix.
@@ -524,24 +1029,181 @@ class Matrix:
         float:
             The determinant of the matrix.
         """
-        matrix_size = len(self.matrix)
-        matrix_copy = self.clone()
+        return run_steps(determinant_steps(self._read()))
+
+    def inverse(self) -> "Matrix":
+        """
+        Compute the inverse of the matrix, using LU factorization with partial pivoting.
+
+        Use `MatrixInverse` instead when the matrix changes by low rank terms, as its inverse can be updated without
+        being computed again.
+
+        Returns
+        -------
+        Matrix
+            The inverse of the matrix.
+
+        Raises
+        ------
+        MatrixNotSquare
+            If the number of columns and rows are not equal in the `Matrix`.
+        SingularMatrixError
+            If the matrix is singular.
+
+        Examples
+        --------
+        >>> Matrix([[2, 0], [0, 4]]).inverse()
+        Matrix([[0.5, 0.0], [0.0, 0.25]])
+        """
+        if self.rows != self.cols:
+            raise MatrixNotSquare("Only square matrices can be inverted.")
+
+        lu, permutation, _ = lu_decompose(self._read())
+        return Matrix._from_rows(lu_inverse(lu, permutation), dtypes.true_divide(self.dtype))
+
+    def solve(self, other: t.Union["Matrix", "hm.Vector"]) -> t.Union["Matrix", "hm.Vector"]:
+        """
+        Solve the linear system `A x = b`, where `A` is the current matrix.
+
+        The system is solved using LU factorization with partial pivoting, and all the columns of a `Matrix` right hand
+        side share the same factorization.
+
+        Parameters
+        ----------
+        other: t.Union[Matrix, Vector]
+            The right hand side `b`. A `Vector` gives a single system, and a `Matrix` solves for each of its columns.
+
+        Returns
+        -------
+        t.Union[Matrix, Vector]
+            The solution, having the same type as the right hand side.
+
+        Raises
+        ------
+        MatrixNotSquare
+            If the number of columns and rows are not equal in the `Matrix`.
+        MatrixDimensionError
+            If the right hand side doesn't have as many rows as the matrix.
+        SingularMatrixError
+            If the matrix is singular.
+
+        Examples
+        --------
+        >>> from hypemaths import Vector
+        >>> mat = Matrix([[2, 0], [0, 4]])
+        >>> mat.solve(Vector(2, 2))
+        Vector([1.0, 0.5])
+        """
+        if self.rows != self.cols:
+            raise MatrixNotSquare("Only square matrices can be used for solving a linear system.")
+
+        if isinstance(other, hm.Vector):
+            if len(other) != self.rows:
+                raise MatrixDimensionError("The vector must have the same length as the number of rows in the matrix.")
+            return hm.Vector(solve_columns(self._read(), [other._read()])[0])
+
+        if not isinstance(other, Matrix):
+            raise TypeError(f"Linear system can only be solved for a Matrix or Vector. Not {type(other)}")
+
+        if other.rows != self.rows:
+            raise MatrixDimensionError("The right hand side must have the same number of rows as the matrix.")
+
+        columns = solve_columns(self._read(), [list(column) for column in zip(*other._read())])
+        return Matrix([list(row) for row in zip(*columns)])
+
+    async def matmul_async(
+            self, other: t.Union["Matrix", "hm.Vector", dtypes.Number], runner: t.Optional["hm.aio.AsyncRunner"] = None
+    ) -> "Matrix":
+        """
+        Compute `self * other` without blocking the event loop, see `hypemaths.aio`.
+
+        Parameters
+        ----------
+        other: t.Union[Matrix, Vector, Number]
+            The other operand.
+        runner: t.Optional[AsyncRunner]
+            The runner of the operation. The default one set with `hypemaths.aio.configure` is used when it isn't
+            specified.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> asyncio.run(Matrix([[1, 2], [3, 4]]).matmul_async(Matrix([[1, 0], [0, 1]])))
+        Matrix([[1, 2], [3, 4]])
+        """
+        return await hm.aio.matmul(self, other, runner)
 
-        for fd in range(matrix_size):  # FD - The focus diagonal.
-            for i in range(fd + 1, matrix_size):
-                if matrix_copy[fd][fd] == 0:
-                    matrix_copy[fd][fd] = 1.0e-18
+    async def determinant_async(self, runner: t.Optional["hm.aio.AsyncRunner"] = None) -> float:
+        """
+        Compute the determinant without blocking the event loop, see `hypemaths.aio`.
+        """
+        return await hm.aio.determinant(self, runner)
 
-                current_row_scaler = matrix_copy[i][fd] / matrix_copy[fd][fd]
+    async def solve_async(
+            self, other: t.Union["Matrix", "hm.Vector"], runner: t.Optional["hm.aio.AsyncRunner"] = None
+    ) -> t.Union["Matrix", "hm.Vector"]:
+        """
+        Solve the linear system `A x = b` without blocking the event loop, see `hypemaths.aio`.
+        """
+        return await hm.aio.solve(self, other, runner)
 
-                for j in range(matrix_size):
-                    matrix_copy[i][j] = matrix_copy[i][j] - current_row_scaler * matrix_copy[fd][j]
+    async def inverse_async(self, runner: t.Optional["hm.aio.AsyncRunner"] = None) -> "Matrix":
+        """
+        Compute the inverse without blocking the event loop, see `hypemaths.aio`.
+        """
+        return await hm.aio.inverse(self, runner)
 
-        product = 1.0
-        for i in range(matrix_size):
-            product *= matrix_copy[i][i]
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the matrix into a compact binary payload.
+
+        The payload contains a versioned header with the storage type and the dimensions, followed by the raw values,
+        taking 8 bytes for each element, or the size of the element type for typed matrices.
 
-        return product
+        Returns
+        -------
+        bytes
+            The serialized matrix.
+
+        Examples
+        --------
+        >>> payload = Matrix([[1, 2], [3, 4]]).to_bytes()
+        >>> Matrix.from_bytes(payload)
+        Matrix([[1, 2], [3, 4]])
+        """
+        return serialization.encode(serialization.MATRIX_MAGIC, self.dims, self._read(), self.dtype)
+
+    @classmethod
+    def from_bytes(cls, data: t.Union[bytes, bytearray, memoryview]) -> "Matrix":
+        """
+        Create a matrix from a payload serialized by `to_bytes`.
+
+        Parameters
+        ----------
+        data: t.Union[bytes, bytearray, memoryview]
+            The serialized payload.
+
+        Returns
+        -------
+        Matrix
+            The deserialized matrix.
+
+        Raises
+        ------
+        ValueError
+            If the payload is invalid, truncated or written by an unsupported version of the format.
+        """
+        return cls._from_flat_values(*serialization.decode(data, serialization.MATRIX_MAGIC))
+
+    @classmethod
+    def _from_flat_values(cls, shape: tuple, values: t.Any, dtype: t.Optional[dtypes.DType]) -> "Matrix":
+        if len(shape) != 2 or 0 in shape:
+            raise ValueError(f"The payload has invalid dimensions for a matrix: {shape}.")
+
+        rows, cols = shape
+        matrix = cls._from_rows([values[row * cols:(row + 1) * cols] for row in range(rows)])
+        matrix.dtype = dtype
+        return matrix
 
     @classmethod
     def from_vector(cls, vector: "hm.Vector") -> "Matrix":
@@ -568,4 +1230,139 @@ class Matrix:
         Matrix([[1], [2], [3], [4]])
         """
         matrix_list = [[value] for value in vector]
-        return cls(matrix_list)
+        return cls(matrix_list, dtype=vector.dtype)
+
+    @staticmethod
+    def _block_layout(blocks: t.Sequence[t.Sequence["Matrix"]]) -> t.Tuple[list, list]:
+        """
+        Validate a 2D grid of blocks and compute the sizes of its block rows and block columns.
+
+        Returns
+        -------
+        t.Tuple[list, list]
+            The number of rows in every block row, and the number of columns in every block column.
+
+        Raises
+        ------
+        TypeError
+            If any of the blocks isn't a matrix.
+        MatrixDimensionError
+            If the blocks don't line up into a grid.
+        """
+        if not blocks or not all(blocks):
+            raise MatrixDimensionError("The blocks must be a non empty 2D list of matrices.")
+
+        for block_row in blocks:
+            for block in block_row:
+                if not isinstance(block, Matrix):
+                    raise TypeError(f"All the blocks must be matrices, but got {type(block)}.")
+
+        col_sizes = [block.cols for block in blocks[0]]
+        row_sizes = []
+        for block_row in blocks:
+            if [block.cols for block in block_row] != col_sizes:
+                raise MatrixDimensionError("Every block row must have blocks with the same number of columns.")
+            if len({block.rows for block in block_row}) != 1:
+                raise MatrixDimensionError("All the blocks in a block row must have the same number of rows.")
+            row_sizes.append(block_row[0].rows)
+
+        return row_sizes, col_sizes
+
+    @classmethod
+    def block(cls, blocks: t.Sequence[t.Sequence["Matrix"]]) -> "Matrix":
+        """
+        Assemble a matrix from a 2D grid of blocks.
+
+        The shape of the result is computed up front, and every block row is copied straight into its place in the
+        preallocated rows.
+
+        Parameters
+        ----------
+        blocks: t.Sequence[t.Sequence[Matrix]]
+            The blocks, as a list of block rows. The blocks in a block row must have the same number of rows, and the
+            blocks in a block column the same number of columns.
+
+        Returns
+        -------
+        Matrix
+            The assembled matrix.
+
+        Raises
+        ------
+        MatrixDimensionError
+            If the blocks don't line up into a grid.
+
+        Examples
+        --------
+        >>> a = Matrix([[1, 2], [3, 4]])
+        >>> Matrix.block([[a, Matrix([[5], [6]])], [Matrix([[7, 8]]), Matrix([[9]])]])
+        Matrix([[1, 2, 5], [3, 4, 6], [7, 8, 9]])
+        """
+        _, col_sizes = cls._block_layout(blocks)
+
+        cols = sum(col_sizes)
+        matrix = []
+        dtype = None
+        for block_row in blocks:
+            block_rows = [block._read() for block in block_row]
+            for index in range(block_row[0].rows):
+                row = [0] * cols
+                offset = 0
+                for block, size in zip(block_rows, col_sizes):
+                    row[offset:offset + size] = block[index]
+                    offset += size
+                matrix.append(row)
+
+            for block in block_row:
+                dtype = dtypes.promote(dtype, block.dtype)
+
+        return cls._from_rows(matrix, dtype)
+
+    @classmethod
+    def hstack(cls, matrices: t.Sequence["Matrix"]) -> "Matrix":
+        """
+        Join matrices horizontally, side by side.
+
+        Parameters
+        ----------
+        matrices: t.Sequence[Matrix]
+            The matrices to be joined, which must have the same number of rows.
+
+        Returns
+        -------
+        Matrix
+            The joined matrix.
+
+        Examples
+        --------
+        >>> Matrix.hstack([Matrix([[1], [2]]), Matrix([[3], [4]])])
+        Matrix([[1, 3], [2, 4]])
+        """
+        return cls.block([list(matrices)])
+
+    @classmethod
+    def vstack(cls, matrices: t.Sequence["Matrix"]) -> "Matrix":
+        """
+        Join matrices vertically, one below the other.
+
+        Parameters
+        ----------
+        matrices: t.Sequence[Matrix]
+            The matrices to be joined, which must have the same number of columns.
+
+        Returns
+        -------
+        Matrix
+            The joined matrix.
+
+        Examples
+        --------
+        >>> Matrix.vstack([Matrix([[1, 2]]), Matrix([[3, 4]])])
+        Matrix([[1, 2], [3, 4]])
+        """
+        return cls.block([[matrix] for matrix in matrices])
+
+
+def _rebuild_matrix(cls: type, header: bytes, data: t.Any) -> Matrix:
+    """Rebuild a pickled matrix, from its header and the buffer holding the values."""
+    return cls._from_flat_values(*serialization.rebuild_values(header, data, serialization.MATRIX_MAGIC))
@@ -0,0 +1,380 @@
+import operator
+import typing as t
+
+import hypemaths as hm
+from hypemaths.exceptions import MatrixDimensionError, MatrixNotSquare, SingularMatrixError
+from hypemaths.models.matrix import Matrix
+
+# The Miller–Rabin bases which are enough for a deterministic test of every number below 3.3 * 10^24.
+_PRIME_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def _is_prime(number: int) -> bool:
+    if number < 2:
+        return False
+    for base in _PRIME_BASES:
+        if number % base == 0:
+            return number == base
+
+    exponent, shift = number - 1, 0
+    while exponent % 2 == 0:
+        exponent //= 2
+        shift += 1
+
+    for base in _PRIME_BASES:
+        value = pow(base, exponent, number)
+        if value in (1, number - 1):
+            continue
+        for _ in range(shift - 1):
+            value = value * value % number
+            if value == number - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _check_int(value: t.Any) -> None:
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError(f"All values of a modular matrix must be integers, but value[{value}] is {type(value)}.")
+
+
+def _eliminate(rows: list, modulus: int, cols: int, reduced: bool = True) -> t.Tuple[list, int, int]:
+    """
+    Run an exact Gaussian elimination mod a prime on the leading `cols` columns of the rows.
+
+    Parameters
+    ----------
+    rows: list
+        The rows to be eliminated, which are not modified. Any columns after `cols` are carried along, like the right
+        hand sides of a linear system.
+    modulus: int
+        The prime modulus.
+    cols: int
+        The number of columns to be eliminated.
+    reduced: bool
+        If the rows above the pivots should be eliminated too, giving the reduced row echelon form with unit pivots.
+        Only the entries below the pivots are eliminated otherwise, which is enough for the rank and the determinant.
+
+    Returns
+    -------
+    t.Tuple[list, int, int]
+        The eliminated rows, the rank and the determinant of the leading square part.
+    """
+    rows = [list(row) for row in rows]
+    size = len(rows)
+    rank = 0
+    determinant = 1
+
+    for col in range(cols):
+        pivot = next((row for row in range(rank, size) if rows[row][col]), None)
+        if pivot is None:
+            determinant = 0
+            continue
+
+        if pivot != rank:
+            rows[rank], rows[pivot] = rows[pivot], rows[rank]
+            determinant = -determinant
+
+        pivot_value = rows[rank][col]
+        determinant = determinant * pivot_value % modulus
+
+        # The inverse using Fermat's little theorem, as the modulus is prime.
+        pivot_inverse = pow(pivot_value, modulus - 2, modulus)
+        pivot_row = [value * pivot_inverse % modulus for value in rows[rank]]
+        rows[rank] = pivot_row
+
+        for row in range(0 if reduced else rank + 1, size):
+            scaler = rows[row][col]
+            if row != rank and scaler:
+                rows[row] = [(value - scaler * pivot) % modulus for value, pivot in zip(rows[row], pivot_row)]
+        rank += 1
+
+    return rows, rank, determinant % modulus
+
+
+class ModMatrix(Matrix):
+    def __init__(self, matrix: t.Union[Matrix, list], p: int) -> None:
+        """
+        A matrix of integers modulo a prime `p`, which are the elements of the finite field `GF(p)`.
+
+        Every value is kept reduced to `[0, p)`, and the operations are exact: as Python integers never overflow,
+        products reduce every dot product once at its end, and the determinant, rank, inverse and solve use Gaussian
+        elimination mod `p`.
+
+        Parameters
+        ----------
+        matrix: t.Union[Matrix, list]
+            The integer matrix, or the nested 2D list of integers. The values are reduced mod `p`.
+        p: int
+            The prime modulus.
+
+        Raises
+        ------
+        ValueError
+            If the modulus isn't a prime.
+
+        Examples
+        --------
+        >>> matrix = ModMatrix([[1, 1], [1, 0]], 7)
+        >>> matrix ** 10
+        ModMatrix([[5, 6], [6, 6]], p=7)
+        >>> matrix.inverse()
+        ModMatrix([[0, 1], [1, 6]], p=7)
+        """
+        if not isinstance(p, int) or not _is_prime(p):
+            raise ValueError(f"The modulus must be a prime, got {p!r}.")
+
+        rows = matrix._read() if isinstance(matrix, Matrix) else self._cleaned_matrix(matrix)
+        for row in rows:
+            for value in row:
+                _check_int(value)
+
+        self._store([[value % p for value in row] for row in rows])
+        self.modulus = p
+
+    @classmethod
+    def _new(cls, rows: list, modulus: int) -> "ModMatrix":
+        """Create the matrix directly from rows which are already reduced, skipping the validation."""
+        matrix = cls._from_rows(rows)
+        matrix.modulus = modulus
+        return matrix
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._read()}, p={self.modulus})"
+
+    def __eq__(self, other: Matrix) -> bool:
+        if isinstance(other, ModMatrix) and other.modulus != self.modulus:
+            return False
+        return super().__eq__(other)
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        return self.__class__, ([list(row) for row in self._read()], self.modulus)
+
+    @classmethod
+    def from_bytes(cls, data: t.Union[bytes, bytearray, memoryview]) -> Matrix:
+        """The payload doesn't hold the modulus, so it is always deserialized as a general `Matrix`."""
+        return Matrix.from_bytes(data)
+
+    def to_matrix(self) -> Matrix:
+        """
+        Returns
+        -------
+        Matrix
+            The values as a general integer `Matrix`.
+        """
+        return Matrix._from_rows([list(row) for row in self._read()])
+
+    def __setitem__(self, index: tuple, value: int) -> None:
+        _check_int(value)
+        super().__setitem__(index, value % self.modulus)
+
+    def _check_modulus(self, other: t.Any) -> None:
+        if isinstance(other, ModMatrix) and other.modulus != self.modulus:
+            raise ValueError(f"Matrices mod {self.modulus} and mod {other.modulus} cannot be combined.")
+
+    def _inverted(self, values: list) -> list:
+        modulus = self.modulus
+        for value in values:
+            if value % modulus == 0:
+                raise ZeroDivisionError(f"Division by a multiple of {modulus} in a modular matrix.")
+        return [pow(value, modulus - 2, modulus) for value in values]
+
+    def _broadcast(
+            self, other: t.Union[Matrix, "hm.Vector", int], function: t.Callable, operation: str, reflected: bool = False
+    ) -> "ModMatrix":
+        """
+        Apply an elementwise operation like `Matrix._broadcast`, reducing the result. Division multiplies by the
+        inverses of the divisor mod `p`.
+        """
+        self._check_modulus(other)
+        if isinstance(other, Matrix):
+            for row in other._read():
+                for value in row:
+                    _check_int(value)
+        elif isinstance(other, hm.Vector):
+            for value in other._read():
+                _check_int(value)
+        else:
+            _check_int(other)
+
+        plain = Matrix._from_rows(self._read())
+        if function is operator.truediv:
+            function = operator.mul
+            if reflected:
+                plain = Matrix._from_rows([self._inverted(row) for row in self._read()])
+            elif isinstance(other, int):
+                other = self._inverted([other])[0]
+            elif isinstance(other, hm.Vector):
+                other = hm.Vector._from_points(self._inverted(other._read()))
+            elif isinstance(other, Matrix):
+                other = Matrix._from_rows([self._inverted(row) for row in other._read()])
+
+        result = Matrix._broadcast(plain, other, function, operation, reflected)
+        modulus = self.modulus
+        return self._new([[value % modulus for value in row] for row in result._read()], modulus)
+
+    def __mul__(self, other: t.Union[Matrix, "hm.Vector", int]) -> "ModMatrix":
+        if not isinstance(other, Matrix):
+            return self._broadcast(other, operator.mul, "multiplied")
+
+        self._check_modulus(other)
+        if self.cols != other.rows:
+            raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+
+        rows = other._read()
+        for row in rows:
+            for value in row:
+                _check_int(value)
+
+        modulus = self.modulus
+        columns = [[value % modulus for value in column] for column in zip(*rows)]
+        matrix = [
+            [sum(map(operator.mul, row, column)) % modulus for column in columns]
+            for row in self._read()
+        ]
+
+        return self._new(matrix, modulus)
+
+    # The reflected operations are defined here, so that Python tries them before the ones of a plain `Matrix` on the
+    # left, and the result is reduced.
+    def __radd__(self, other: t.Union[Matrix, "hm.Vector", int]) -> "ModMatrix":
+        return self._broadcast(other, operator.add, "added", reflected=True)
+
+    def __rsub__(self, other: t.Union[Matrix, "hm.Vector", int]) -> "ModMatrix":
+        return self._broadcast(other, operator.sub, "subtracted", reflected=True)
+
+    def __rtruediv__(self, other: t.Union[Matrix, "hm.Vector", int]) -> "ModMatrix":
+        return self._broadcast(other, operator.truediv, "divided", reflected=True)
+
+    def __rmul__(self, other: t.Union[Matrix, "hm.Vector", int]) -> "ModMatrix":
+        if isinstance(other, Matrix):
+            return ModMatrix(other, self.modulus).__mul__(self)
+        return self._broadcast(other, operator.mul, "multiplied", reflected=True)
+
+    def __matmul__(self, other: Matrix) -> "ModMatrix":
+        return self.__mul__(other)
+
+    def __rmatmul__(self, other: Matrix) -> "ModMatrix":
+        return self.__rmul__(other)
+
+    def __pow__(self, exponent: int) -> "ModMatrix":
+        """
+        Raise the matrix to an integer power using repeated squaring, which takes `O(log k)` multiplications. Negative
+        exponents raise the inverse.
+        """
+        if not isinstance(exponent, int):
+            raise TypeError(f"Modular matrices can only be raised to integer powers, not to {type(exponent)}")
+        if self.rows != self.cols:
+            raise MatrixNotSquare("Only square matrices can be raised to a power.")
+
+        base = self.inverse() if exponent < 0 else self
+        exponent = abs(exponent)
+
+        result = self._new([[int(row == col) for col in range(self.cols)] for row in range(self.rows)], self.modulus)
+        while exponent:
+            if exponent & 1:
+                result = result * base
+            exponent >>= 1
+            if exponent:
+                base = base * base
+        return result
+
+    def __abs__(self) -> "ModMatrix":
+        return self.clone()
+
+    def __round__(self, n: t.Optional[int] = None) -> "ModMatrix":
+        return self.clone()
+
+    def transpose(self) -> "ModMatrix":
+        return self._new([list(column) for column in zip(*self._read())], self.modulus)
+
+    def determinant(self) -> int:
+        """
+        Get the exact determinant mod `p`, using Gaussian elimination.
+
+        Returns
+        -------
+        int
+            The determinant, in `[0, p)`.
+        """
+        if self.rows != self.cols:
+            raise MatrixNotSquare("Cannot calculate the determinant of a matrix which isn't square.")
+        return _eliminate(self._read(), self.modulus, self.cols, reduced=False)[2]
+
+    def rank(self) -> int:
+        """
+        Returns
+        -------
+        int
+            The rank of the matrix over `GF(p)`.
+        """
+        return _eliminate(self._read(), self.modulus, self.cols, reduced=False)[1]
+
+    def _solve_augmented(self, columns: list) -> list:
+        """Solve for the columns appended to the rows, returning the rows of the solution."""
+        if self.rows != self.cols:
+            raise MatrixNotSquare("Only square matrices can be used for solving a linear system.")
+
+        size = self.rows
+        augmented = [list(row) + [column[index] for column in columns] for index, row in enumerate(self._read())]
+        rows, rank, _ = _eliminate(augmented, self.modulus, size)
+        if rank < size:
+            raise SingularMatrixError(f"The matrix is singular mod {self.modulus}.")
+        return [row[size:] for row in rows]
+
+    def inverse(self) -> "ModMatrix":
+        """
+        Compute the exact inverse mod `p`, using Gauss–Jordan elimination.
+
+        Returns
+        -------
+        ModMatrix
+            The inverse of the matrix.
+
+        Raises
+        ------
+        SingularMatrixError
+            If the matrix is singular mod `p`.
+        """
+        size = self.rows
+        identity = [[int(row == col) for row in range(size)] for col in range(size)]
+        return self._new(self._solve_augmented(identity), self.modulus)
+
+    def solve(self, other: t.Union[Matrix, "hm.Vector"]) -> t.Union["ModMatrix", "hm.Vector"]:
+        """
+        Solve the linear system `A x = b` exactly mod `p`.
+
+        Parameters
+        ----------
+        other: t.Union[Matrix, Vector]
+            The integer right hand side `b`.
+
+        Returns
+        -------
+        t.Union[ModMatrix, Vector]
+            The solution, as a `Vector` of integers for a vector right hand side, else as a `ModMatrix`.
+
+        Raises
+        ------
+        SingularMatrixError
+            If the matrix is singular mod `p`.
+        """
+        self._check_modulus(other)
+        modulus = self.modulus
+
+        if isinstance(other, hm.Vector):
+            if len(other) != self.rows:
+                raise MatrixDimensionError("The vector must have the same length as the number of rows in the matrix.")
+            points = list(other._read())
+            for point in points:
+                _check_int(point)
+            return hm.Vector._from_points([row[0] for row in self._solve_augmented([[point % modulus for point in points]])])
+
+        if not isinstance(other, Matrix):
+            raise TypeError(f"Linear system can only be solved for a Matrix or Vector. Not {type(other)}")
+        if other.rows != self.rows:
+            raise MatrixDimensionError("The right hand side must have the same number of rows as the matrix.")
+
+        columns = [[value % modulus for value in column] for column in zip(*other._read())]
+        return self._new(self._solve_augmented(columns), modulus)
@@ -0,0 +1,1334 @@
+import abc
+import math
+import operator
+import typing as t
+
+import hypemaths as hm
+from hypemaths import dtypes
+from hypemaths.exceptions import (
+    InvalidMatrixError,
+    MatrixDimensionError,
+    MatrixNotSquare,
+    SingularMatrixError,
+)
+from hypemaths.models.matrix import Matrix
+from hypemaths.models.utils.fft import EXACT_BITS, circular_convolve, fft, next_power_of_two, realize, rounds_exactly
+from hypemaths.models.utils.linalg import lu_decompose, lu_determinant
+
+# The eigenvalues smaller than this, relative to the largest one, are treated as zeros by the circulant matrices.
+SINGULAR_TOLERANCE = 1e-12
+
+
+def _square_rows(matrix: t.Union[Matrix, list]) -> list:
+    """
+    Parameters
+    ----------
+    matrix: t.Union[Matrix, list]
+        The dense matrix or 2D list used for creating a structured matrix.
+
+    Returns
+    -------
+    list
+        The validated, square 2D list.
+
+    Raises
+    ------
+    MatrixNotSquare
+        If the number of columns and rows are not equal.
+    """
+    rows = matrix._read() if isinstance(matrix, Matrix) else Matrix._cleaned_matrix(matrix)
+    if any(len(row) != len(rows) for row in rows):
+        raise MatrixNotSquare("Structured matrices can only be created from square matrices.")
+    return rows
+
+
+def _check_value(value: t.Any) -> None:
+    if not isinstance(value, (int, float)):
+        raise TypeError(f"All values must be integers or floats, but value[{value}] is {type(value)}.")
+
+
+class StructuredMatrix(Matrix, abc.ABC):
+    """
+    The base for square matrices which store only the values allowed by their structure.
+
+    The dense 2D list is never stored, `matrix` builds it on request, so any operation without a specialized kernel
+    falls back to the general `Matrix` implementation.
+    """
+    _size: int
+
+    @classmethod
+    def _new(cls, size: int, **attributes) -> "StructuredMatrix":
+        """Create the matrix directly from already packed storage, skipping the validation."""
+        obj = cls.__new__(cls)
+        obj._size = size
+        for name, value in attributes.items():
+            setattr(obj, name, value)
+        return obj
+
+    @property
+    def matrix(self) -> list:
+        """
+        Returns
+        -------
+        list
+            The dense 2D list equivalent to the structured matrix. It is freshly built on every access.
+        """
+        return self.to_dense()
+
+    @classmethod
+    def _from_rows(cls, rows: list, dtype: t.Optional[dtypes.DType] = None) -> Matrix:
+        """The dense results of the inherited operations can't be stored in the structure, so a `Matrix` is created."""
+        return Matrix._from_rows(rows, dtype)
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        # The compact storage is pickled as it is, instead of the dense payload used for `Matrix`.
+        return object.__reduce_ex__(self, protocol)
+
+    @classmethod
+    def from_bytes(cls, data: t.Union[bytes, bytearray, memoryview]) -> Matrix:
+        """The payload holds the dense values, so it is always deserialized as a general `Matrix`."""
+        return Matrix.from_bytes(data)
+
+    def _read(self) -> list:
+        return self.to_dense()
+
+    def clone(self) -> "StructuredMatrix":
+        """
+        Returns the copy of the matrix. The compact storage is small, so it is always copied right away.
+        """
+        return self.copy(deep=True)
+
+    def copy(self, deep: bool = False) -> "StructuredMatrix":
+        cls = self.__class__
+
+        copied = cls.__new__(cls)
+        for name, value in self.__dict__.items():
+            if isinstance(value, list):
+                value = [item.copy() if isinstance(item, list) else item for item in value]
+            setattr(copied, name, value)
+
+        return copied
+
+    @property
+    def rows(self) -> int:
+        return self._size
+
+    @property
+    def cols(self) -> int:
+        return self._size
+
+    @property
+    def dims(self) -> tuple:
+        return self._size, self._size
+
+    @abc.abstractmethod
+    def _get(self, row: int, col: int) -> t.Union[int, float]:
+        """Get the value at a valid, non negative index."""
+
+    @abc.abstractmethod
+    def _set(self, row: int, col: int, value: t.Union[int, float]) -> None:
+        """Set the value at a valid, non negative index, raising `InvalidMatrixError` if it breaks the structure."""
+
+    def _row_entries(self, row: int) -> t.Iterator[t.Tuple[int, t.Union[int, float]]]:
+        """Yield the `(column, value)` pairs of a row which can be non zero because of the structure."""
+        for col in range(self._size):
+            yield col, self._get(row, col)
+
+    def _normalize_index(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Matrix index out of range.")
+        return index
+
+    def to_dense(self) -> list:
+        """
+        Returns
+        -------
+        list
+            The dense 2D list representing this matrix.
+        """
+        return [[self._get(row, col) for col in range(self._size)] for row in range(self._size)]
+
+    def to_matrix(self) -> Matrix:
+        """
+        Convert the structured matrix into a general, dense `Matrix`.
+
+        Returns
+        -------
+        Matrix
+            The dense matrix.
+        """
+        return Matrix(self.to_dense())
+
+    def __getitem__(self, index: t.Union[int, tuple]) -> t.Union[int, float, list]:
+        if isinstance(index, int):
+            row = self._normalize_index(index)
+            return [self._get(row, col) for col in range(self._size)]
+        return self._get(self._normalize_index(index[0]), self._normalize_index(index[1]))
+
+    def __setitem__(self, index: t.Union[int, tuple], value: t.Union[int, float]) -> None:
+        if isinstance(index, int):
+            raise TypeError(f"{self.__class__.__name__} only supports setting single elements, like `matrix[0, 0]`.")
+
+        _check_value(value)
+        self._set(self._normalize_index(index[0]), self._normalize_index(index[1]), value)
+
+    def _check_same_dims(self, other: Matrix, operation: str) -> None:
+        if self.dims != other.dims:
+            raise MatrixDimensionError(f"These matrices cannot be {operation} due to wrong dimensions.")
+
+    def _add_same(self, other: "StructuredMatrix", sign: int) -> t.Optional["StructuredMatrix"]:
+        """Add or subtract a matrix of the same structure, returning `None` when the structure isn't preserved."""
+        return None
+
+    @abc.abstractmethod
+    def _scale(self, scalar: t.Union[int, float]) -> "StructuredMatrix":
+        """Multiply every value by a scalar, returning a matrix of the same structure."""
+
+    def __add__(self, other: Matrix) -> Matrix:
+        if isinstance(other, StructuredMatrix):
+            self._check_same_dims(other, "added")
+            result = self._add_same(other, 1)
+            if result is not None:
+                return result
+        return Matrix.__add__(self.to_matrix(), other)
+
+    def __radd__(self, other: Matrix) -> Matrix:
+        return self.__add__(other)
+
+    def __sub__(self, other: Matrix) -> Matrix:
+        if isinstance(other, StructuredMatrix):
+            self._check_same_dims(other, "subtracted")
+            result = self._add_same(other, -1)
+            if result is not None:
+                return result
+        return Matrix.__sub__(self.to_matrix(), other)
+
+    def __rsub__(self, other: t.Union[Matrix, "hm.Vector", dtypes.Number]) -> Matrix:
+        if not isinstance(other, Matrix):
+            return Matrix.__rsub__(self.to_matrix(), other)
+        return Matrix.__sub__(other, self)
+
+    def _mul_same(self, other: "StructuredMatrix") -> t.Optional["StructuredMatrix"]:
+        """Multiply by a matrix of the same structure, returning `None` when the structure isn't preserved."""
+        return None
+
+    def _left_multiply(self, other: Matrix) -> Matrix:
+        """Compute `self * other`, visiting only the entries that the structure allows to be non zero."""
+        if self.cols != other.rows:
+            raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+
+        other_rows = other._read()
+        matrix = []
+        for row in range(self._size):
+            result_row = [0] * other.cols
+            for col, value in self._row_entries(row):
+                if value:
+                    for index, element in enumerate(other_rows[col]):
+                        result_row[index] += value * element
+            matrix.append(result_row)
+        return Matrix(matrix)
+
+    def _right_multiply(self, other: Matrix) -> Matrix:
+        """Compute `other * self`, visiting only the entries that the structure allows to be non zero."""
+        if other.cols != self.rows:
+            raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+
+        row_entries = [list(self._row_entries(row)) for row in range(self._size)]
+        matrix = []
+        for other_row in other._read():
+            result_row = [0] * self._size
+            for index, element in enumerate(other_row):
+                if element:
+                    for col, value in row_entries[index]:
+                        result_row[col] += element * value
+            matrix.append(result_row)
+        return Matrix(matrix)
+
+    def __mul__(self, other: t.Union[Matrix, "hm.Vector", dtypes.Number]) -> Matrix:
+        if isinstance(other, (int, float)):
+            return self._scale(other)
+
+        # The structured storage holds only real values, so complex scalars give a dense `complex128` matrix.
+        if isinstance(other, (complex, hm.Vector)):
+            return Matrix.__mul__(self.to_matrix(), other)
+
+        if not isinstance(other, Matrix):
+            raise TypeError(f"Matrix can only be multiplied with other matrix. Not {type(other)}")
+
+        if isinstance(other, StructuredMatrix) and type(other) is type(self):
+            self._check_same_dims(other, "multiplied")
+            result = self._mul_same(other)
+            if result is not None:
+                return result
+        return self._left_multiply(other)
+
+    def __rmul__(self, other: t.Union[Matrix, "hm.Vector", dtypes.Number]) -> Matrix:
+        if isinstance(other, (int, float)):
+            return self._scale(other)
+
+        if isinstance(other, (complex, hm.Vector)):
+            return Matrix.__rmul__(self.to_matrix(), other)
+
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self._right_multiply(other)
+
+    def __matmul__(self, other: Matrix) -> Matrix:
+        return self.__mul__(other)
+
+    def __rmatmul__(self, other: Matrix) -> Matrix:
+        return self.__rmul__(other)
+
+    def __truediv__(self, other: t.Union[Matrix, dtypes.Number]) -> Matrix:
+        if isinstance(other, (int, float)):
+            return self._scale(1 / other)
+        return Matrix.__truediv__(self.to_matrix(), other)
+
+    def __rtruediv__(self, other: t.Union["hm.Vector", dtypes.Number]) -> Matrix:
+        return Matrix.__rtruediv__(self.to_matrix(), other)
+
+    def multiply(self, other: t.Union[Matrix, "hm.Vector", dtypes.Number]) -> Matrix:
+        return self.to_matrix().multiply(other)
+
+    def __abs__(self) -> Matrix:
+        return abs(self.to_matrix())
+
+    def __round__(self, n: t.Optional[int] = None) -> Matrix:
+        return round(self.to_matrix(), n)
+
+    def transpose(self) -> Matrix:
+        return self.to_matrix().transpose()
+
+    def determinant(self) -> float:
+        try:
+            lu, _, sign = lu_decompose(self.to_dense())
+        except SingularMatrixError:
+            return 0.0
+        return lu_determinant(lu, sign)
+
+    def trace(self) -> t.Union[int, float]:
+        return sum(self._get(index, index) for index in range(self._size))
+
+    @staticmethod
+    def _rhs_columns(other: t.Union[Matrix, "hm.Vector"], size: int) -> t.Tuple[list, bool]:
+        """Split the right hand side of a linear system into its columns."""
+        if isinstance(other, hm.Vector):
+            if len(other) != size:
+                raise MatrixDimensionError("The vector must have the same length as the number of rows in the matrix.")
+            return [list(other._read())], True
+
+        if not isinstance(other, Matrix):
+            raise TypeError(f"Linear system can only be solved for a Matrix or Vector. Not {type(other)}")
+
+        if other.rows != size:
+            raise MatrixDimensionError("The right hand side must have the same number of rows as the matrix.")
+        return [list(column) for column in zip(*other._read())], False
+
+    @staticmethod
+    def _pack_solution(columns: list, is_vector: bool) -> t.Union[Matrix, "hm.Vector"]:
+        if is_vector:
+            return hm.Vector(columns[0])
+        return Matrix([list(row) for row in zip(*columns)])
+
+    def solve(self, other: t.Union[Matrix, "hm.Vector"]) -> t.Union[Matrix, "hm.Vector"]:
+        return self.to_matrix().solve(other)
+
+
+class DiagonalMatrix(StructuredMatrix):
+    def __init__(self, diagonal: t.Union[list, "hm.Vector"]) -> None:
+        """
+        A square matrix having non zero values only on its main diagonal, which is the only part stored.
+
+        Parameters
+        ----------
+        diagonal: t.Union[list, Vector]
+            The values of the main diagonal.
+
+        Examples
+        --------
+        >>> DiagonalMatrix([1, 2])
+        DiagonalMatrix([1, 2])
+        >>> DiagonalMatrix([1, 2]).matrix
+        [[1, 0], [0, 2]]
+        """
+        diagonal = list(diagonal)
+        if not diagonal:
+            raise ValueError("You need to pass the values of the diagonal!")
+
+        for value in diagonal:
+            _check_value(value)
+
+        self._size = len(diagonal)
+        self.diagonal = diagonal
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.diagonal})"
+
+    def _get(self, row: int, col: int) -> t.Union[int, float]:
+        return self.diagonal[row] if row == col else 0
+
+    def _set(self, row: int, col: int, value: t.Union[int, float]) -> None:
+        if row != col:
+            if value != 0:
+                raise InvalidMatrixError("Only the diagonal elements of a diagonal matrix can be non zero.")
+            return
+        self.diagonal[row] = value
+
+    def _row_entries(self, row: int) -> t.Iterator[t.Tuple[int, t.Union[int, float]]]:
+        yield row, self.diagonal[row]
+
+    def to_dense(self) -> list:
+        matrix = []
+        for index, value in enumerate(self.diagonal):
+            row = [0] * self._size
+            row[index] = value
+            matrix.append(row)
+        return matrix
+
+    def _scale(self, scalar: t.Union[int, float]) -> "DiagonalMatrix":
+        return DiagonalMatrix([value * scalar for value in self.diagonal])
+
+    def _add_same(self, other: StructuredMatrix, sign: int) -> t.Optional[StructuredMatrix]:
+        if not isinstance(other, DiagonalMatrix):
+            return None
+        return DiagonalMatrix([a + sign * b for a, b in zip(self.diagonal, other.diagonal)])
+
+    def __mul__(self, other: t.Union[Matrix, int, float]) -> Matrix:
+        if isinstance(other, DiagonalMatrix):
+            self._check_same_dims(other, "multiplied")
+            return DiagonalMatrix([a * b for a, b in zip(self.diagonal, other.diagonal)])
+
+        if isinstance(other, Matrix) and not isinstance(other, StructuredMatrix):
+            if self.cols != other.rows:
+                raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+            return Matrix([[value * element for element in row] for value, row in zip(self.diagonal, other._read())])
+
+        return super().__mul__(other)
+
+    def __rmul__(self, other: t.Union[Matrix, int, float]) -> Matrix:
+        if isinstance(other, Matrix) and not isinstance(other, StructuredMatrix):
+            if other.cols != self.rows:
+                raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+            return Matrix([[element * value for element, value in zip(row, self.diagonal)] for row in other._read()])
+
+        return super().__rmul__(other)
+
+    def transpose(self) -> "DiagonalMatrix":
+        return DiagonalMatrix(self.diagonal.copy())
+
+    def determinant(self) -> t.Union[int, float]:
+        product = 1
+        for value in self.diagonal:
+            product *= value
+        return product
+
+    def trace(self) -> t.Union[int, float]:
+        return sum(self.diagonal)
+
+    def solve(self, other: t.Union[Matrix, "hm.Vector"]) -> t.Union[Matrix, "hm.Vector"]:
+        if any(value == 0 for value in self.diagonal):
+            raise SingularMatrixError("The diagonal matrix has a zero on its diagonal, and is singular.")
+
+        columns, is_vector = self._rhs_columns(other, self._size)
+        columns = [[element / value for element, value in zip(column, self.diagonal)] for column in columns]
+        return self._pack_solution(columns, is_vector)
+
+
+class Identity(DiagonalMatrix):
+    def __init__(self, size: int) -> None:
+        """
+        The identity matrix, having ones on the main diagonal and zeros everywhere else.
+
+        Parameters
+        ----------
+        size: int
+            The number of rows and columns in the matrix.
+
+        Examples
+        --------
+        >>> Identity(2).matrix
+        [[1, 0], [0, 1]]
+        """
+        if not isinstance(size, int) or size < 1:
+            raise ValueError("The size of the identity matrix must be a positive integer.")
+
+        super().__init__([1] * size)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._size})"
+
+    def _set(self, row: int, col: int, value: t.Union[int, float]) -> None:
+        if value != (1 if row == col else 0):
+            raise InvalidMatrixError("The elements of the identity matrix cannot be modified.")
+
+    def __mul__(self, other: t.Union[Matrix, int, float]) -> Matrix:
+        if isinstance(other, Matrix):
+            if self.cols != other.rows:
+                raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+            return other.clone()
+        return super().__mul__(other)
+
+    def __rmul__(self, other: t.Union[Matrix, int, float]) -> Matrix:
+        if isinstance(other, Matrix):
+            if other.cols != self.rows:
+                raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+            return other.clone()
+        return super().__rmul__(other)
+
+    def transpose(self) -> "Identity":
+        return Identity(self._size)
+
+    def determinant(self) -> int:
+        return 1
+
+    def trace(self) -> int:
+        return self._size
+
+    def solve(self, other: t.Union[Matrix, "hm.Vector"]) -> t.Union[Matrix, "hm.Vector"]:
+        columns, is_vector = self._rhs_columns(other, self._size)
+        return self._pack_solution(columns, is_vector)
+
+
+class TriangularMatrix(StructuredMatrix):
+    def __init__(self, matrix: t.Union[Matrix, list], lower: bool = True) -> None:
+        """
+        A square matrix with zeros either above (lower triangular) or below (upper triangular) the main diagonal.
+
+        Only the triangle containing the values is stored, row by row.
+
+        Parameters
+        ----------
+        matrix: t.Union[Matrix, list]
+            The dense matrix, or the nested 2D list, to be converted.
+        lower: bool
+            If the matrix is lower triangular. Set it to `False` for upper triangular matrices. Defaults to `True`.
+
+        Raises
+        ------
+        InvalidMatrixError
+            If there are non zero values in the triangle that must only contain zeros.
+
+        Examples
+        --------
+        >>> TriangularMatrix([[1, 0], [2, 3]]).determinant()
+        3
+        """
+        rows = _square_rows(matrix)
+        for row, values in enumerate(rows):
+            for col, value in enumerate(values):
+                if value != 0 and (col > row if lower else col < row):
+                    raise InvalidMatrixError(
+                        f"The {'lower' if lower else 'upper'} triangular matrix has a non zero value at [{row}][{col}]."
+                    )
+
+        self._size = len(rows)
+        self.lower = lower
+        self._data = self._pack(rows, lower)
+
+    @staticmethod
+    def _pack(rows: list, lower: bool) -> list:
+        if lower:
+            return [list(values[:row + 1]) for row, values in enumerate(rows)]
+        return [list(values[row:]) for row, values in enumerate(rows)]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_dense()}, lower={self.lower})"
+
+    def _in_triangle(self, row: int, col: int) -> bool:
+        return col <= row if self.lower else col >= row
+
+    def _get(self, row: int, col: int) -> t.Union[int, float]:
+        if not self._in_triangle(row, col):
+            return 0
+        return self._data[row][col] if self.lower else self._data[row][col - row]
+
+    def _set(self, row: int, col: int, value: t.Union[int, float]) -> None:
+        if not self._in_triangle(row, col):
+            if value != 0:
+                raise InvalidMatrixError("Only the values of the stored triangle can be non zero.")
+            return
+
+        if self.lower:
+            self._data[row][col] = value
+        else:
+            self._data[row][col - row] = value
+
+    def _row_entries(self, row: int) -> t.Iterator[t.Tuple[int, t.Union[int, float]]]:
+        start = 0 if self.lower else row
+        return enumerate(self._data[row], start)
+
+    def _diagonal(self) -> list:
+        if self.lower:
+            return [values[row] for row, values in enumerate(self._data)]
+        return [values[0] for values in self._data]
+
+    def to_dense(self) -> list:
+        if self.lower:
+            return [values + [0] * (self._size - row - 1) for row, values in enumerate(self._data)]
+        return [[0] * row + values for row, values in enumerate(self._data)]
+
+    def _scale(self, scalar: t.Union[int, float]) -> "TriangularMatrix":
+        data = [[value * scalar for value in values] for values in self._data]
+        return TriangularMatrix._new(self._size, lower=self.lower, _data=data)
+
+    def _add_same(self, other: StructuredMatrix, sign: int) -> t.Optional[StructuredMatrix]:
+        if not isinstance(other, TriangularMatrix) or other.lower != self.lower:
+            return None
+
+        data = [[a + sign * b for a, b in zip(first, second)] for first, second in zip(self._data, other._data)]
+        return TriangularMatrix._new(self._size, lower=self.lower, _data=data)
+
+    def _mul_same(self, other: StructuredMatrix) -> t.Optional[StructuredMatrix]:
+        if other.lower != self.lower:
+            return None
+
+        size = self._size
+        data = []
+        for row in range(size):
+            cols = range(row + 1) if self.lower else range(row, size)
+            values = []
+            for col in cols:
+                inner = range(col, row + 1) if self.lower else range(row, col + 1)
+                values.append(sum(self._get(row, k) * other._get(k, col) for k in inner))
+            data.append(values)
+        return TriangularMatrix._new(size, lower=self.lower, _data=data)
+
+    def transpose(self) -> "TriangularMatrix":
+        size = self._size
+        if self.lower:
+            data = [[self._data[row][col] for row in range(col, size)] for col in range(size)]
+        else:
+            data = [[self._data[row][col - row] for row in range(col + 1)] for col in range(size)]
+        return TriangularMatrix._new(size, lower=not self.lower, _data=data)
+
+    def determinant(self) -> t.Union[int, float]:
+        product = 1
+        for value in self._diagonal():
+            product *= value
+        return product
+
+    def trace(self) -> t.Union[int, float]:
+        return sum(self._diagonal())
+
+    def solve(self, other: t.Union[Matrix, "hm.Vector"]) -> t.Union[Matrix, "hm.Vector"]:
+        """
+        Solve the system by forward substitution for lower, or back substitution for upper triangular matrices.
+        """
+        diagonal = self._diagonal()
+        if any(value == 0 for value in diagonal):
+            raise SingularMatrixError("The triangular matrix has a zero on its diagonal, and is singular.")
+
+        columns, is_vector = self._rhs_columns(other, self._size)
+        order = range(self._size) if self.lower else range(self._size - 1, -1, -1)
+
+        for column in columns:
+            for row in order:
+                total = column[row]
+                for col, value in self._row_entries(row):
+                    if col != row:
+                        total -= value * column[col]
+                column[row] = total / diagonal[row]
+
+        return self._pack_solution(columns, is_vector)
+
+
+class SymmetricMatrix(StructuredMatrix):
+    def __init__(self, matrix: t.Union[Matrix, list]) -> None:
+        """
+        A square matrix equal to its transpose, stored in packed form by keeping only the upper triangle.
+
+        Parameters
+        ----------
+        matrix: t.Union[Matrix, list]
+            The dense matrix, or the nested 2D list, to be converted.
+
+        Raises
+        ------
+        InvalidMatrixError
+            If the matrix isn't symmetric.
+
+        Examples
+        --------
+        >>> SymmetricMatrix([[1, 2], [2, 1]]).transpose()
+        SymmetricMatrix([[1, 2], [2, 1]])
+        """
+        rows = _square_rows(matrix)
+        for row in range(len(rows)):
+            for col in range(row + 1, len(rows)):
+                if rows[row][col] != rows[col][row]:
+                    raise InvalidMatrixError(f"The matrix is not symmetric, [{row}][{col}] != [{col}][{row}].")
+
+        self._size = len(rows)
+        self._data = self._pack(rows)
+
+    @staticmethod
+    def _pack(rows: list) -> list:
+        return [list(values[row:]) for row, values in enumerate(rows)]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_dense()})"
+
+    def _get(self, row: int, col: int) -> t.Union[int, float]:
+        if col >= row:
+            return self._data[row][col - row]
+        return self._data[col][row - col]
+
+    def _set(self, row: int, col: int, value: t.Union[int, float]) -> None:
+        if col >= row:
+            self._data[row][col - row] = value
+        else:
+            self._data[col][row - col] = value
+
+    def to_dense(self) -> list:
+        size = self._size
+        matrix = [[0] * size for _ in range(size)]
+        for row, values in enumerate(self._data):
+            for offset, value in enumerate(values):
+                matrix[row][row + offset] = value
+                matrix[row + offset][row] = value
+        return matrix
+
+    def _scale(self, scalar: t.Union[int, float]) -> "SymmetricMatrix":
+        data = [[value * scalar for value in values] for values in self._data]
+        return SymmetricMatrix._new(self._size, _data=data)
+
+    def _add_same(self, other: StructuredMatrix, sign: int) -> t.Optional[StructuredMatrix]:
+        if not isinstance(other, SymmetricMatrix):
+            return None
+
+        data = [[a + sign * b for a, b in zip(first, second)] for first, second in zip(self._data, other._data)]
+        return SymmetricMatrix._new(self._size, _data=data)
+
+    def transpose(self) -> "SymmetricMatrix":
+        return SymmetricMatrix._new(self._size, _data=[values.copy() for values in self._data])
+
+    def trace(self) -> t.Union[int, float]:
+        return sum(values[0] for values in self._data)
+
+
+class BandedMatrix(StructuredMatrix):
+    def __init__(
+            self, matrix: t.Union[Matrix, list], lower_bandwidth: int = None, upper_bandwidth: int = None
+    ) -> None:
+        """
+        A square matrix whose non zero values lie within a band around the main diagonal.
+
+        Each row stores only the values from `lower_bandwidth` columns left of the diagonal, to `upper_bandwidth`
+        columns right of it.
+
+        Parameters
+        ----------
+        matrix: t.Union[Matrix, list]
+            The dense matrix, or the nested 2D list, to be converted.
+        lower_bandwidth: int
+            The number of sub diagonals in the band. It is detected from the matrix when not specified.
+        upper_bandwidth: int
+            The number of super diagonals in the band. It is detected from the matrix when not specified.
+
+        Raises
+        ------
+        InvalidMatrixError
+            If there are non zero values outside of the band.
+
+        Examples
+        --------
+        >>> tridiagonal = BandedMatrix([[2, 1, 0], [1, 2, 1], [0, 1, 2]])
+        >>> tridiagonal.lower_bandwidth, tridiagonal.upper_bandwidth
+        (1, 1)
+        """
+        rows = _square_rows(matrix)
+        detected_lower, detected_upper = _bandwidths(rows)
+
+        lower_bandwidth = detected_lower if lower_bandwidth is None else lower_bandwidth
+        upper_bandwidth = detected_upper if upper_bandwidth is None else upper_bandwidth
+        if lower_bandwidth < detected_lower or upper_bandwidth < detected_upper:
+            raise InvalidMatrixError("The matrix has non zero values outside of the specified band.")
+
+        self._size = len(rows)
+        self.lower_bandwidth = lower_bandwidth
+        self.upper_bandwidth = upper_bandwidth
+        self._data = self._pack(rows, lower_bandwidth, upper_bandwidth)
+
+    @staticmethod
+    def _pack(rows: list, lower_bandwidth: int, upper_bandwidth: int) -> list:
+        size = len(rows)
+        return [
+            list(values[max(0, row - lower_bandwidth):min(size, row + upper_bandwidth + 1)])
+            for row, values in enumerate(rows)
+        ]
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.to_dense()}, "
+            f"lower_bandwidth={self.lower_bandwidth}, upper_bandwidth={self.upper_bandwidth})"
+        )
+
+    def _start(self, row: int) -> int:
+        return max(0, row - self.lower_bandwidth)
+
+    def _in_band(self, row: int, col: int) -> bool:
+        return -self.lower_bandwidth <= col - row <= self.upper_bandwidth
+
+    def _get(self, row: int, col: int) -> t.Union[int, float]:
+        if not self._in_band(row, col):
+            return 0
+        return self._data[row][col - self._start(row)]
+
+    def _set(self, row: int, col: int, value: t.Union[int, float]) -> None:
+        if not self._in_band(row, col):
+            if value != 0:
+                raise InvalidMatrixError("Only the values within the band can be non zero.")
+            return
+        self._data[row][col - self._start(row)] = value
+
+    def _row_entries(self, row: int) -> t.Iterator[t.Tuple[int, t.Union[int, float]]]:
+        return enumerate(self._data[row], self._start(row))
+
+    def to_dense(self) -> list:
+        matrix = []
+        for row, values in enumerate(self._data):
+            start = self._start(row)
+            matrix.append([0] * start + values + [0] * (self._size - start - len(values)))
+        return matrix
+
+    def _scale(self, scalar: t.Union[int, float]) -> "BandedMatrix":
+        data = [[value * scalar for value in values] for values in self._data]
+        return BandedMatrix._new(
+            self._size, lower_bandwidth=self.lower_bandwidth, upper_bandwidth=self.upper_bandwidth, _data=data
+        )
+
+    def _from_band(self, lower_bandwidth: int, upper_bandwidth: int, value: t.Callable) -> "BandedMatrix":
+        """Create a banded matrix of the same size, computing each value within the band using `value(row, col)`."""
+        size = self._size
+        data = [
+            [value(row, col) for col in range(max(0, row - lower_bandwidth), min(size, row + upper_bandwidth + 1))]
+            for row in range(size)
+        ]
+        return BandedMatrix._new(size, lower_bandwidth=lower_bandwidth, upper_bandwidth=upper_bandwidth, _data=data)
+
+    def _add_same(self, other: StructuredMatrix, sign: int) -> t.Optional[StructuredMatrix]:
+        if not isinstance(other, BandedMatrix):
+            return None
+
+        return self._from_band(
+            max(self.lower_bandwidth, other.lower_bandwidth),
+            max(self.upper_bandwidth, other.upper_bandwidth),
+            lambda row, col: self._get(row, col) + sign * other._get(row, col)
+        )
+
+    def _mul_same(self, other: StructuredMatrix) -> t.Optional[StructuredMatrix]:
+        size = self._size
+        lower_bandwidth = min(size - 1, self.lower_bandwidth + other.lower_bandwidth)
+        upper_bandwidth = min(size - 1, self.upper_bandwidth + other.upper_bandwidth)
+
+        data = []
+        for row in range(size):
+            start = max(0, row - lower_bandwidth)
+            values = [0] * (min(size, row + upper_bandwidth + 1) - start)
+            for inner, value in self._row_entries(row):
+                if value:
+                    for col, element in other._row_entries(inner):
+                        values[col - start] += value * element
+            data.append(values)
+        return BandedMatrix._new(size, lower_bandwidth=lower_bandwidth, upper_bandwidth=upper_bandwidth, _data=data)
+
+    def transpose(self) -> "BandedMatrix":
+        return self._from_band(self.upper_bandwidth, self.lower_bandwidth, lambda row, col: self._get(col, row))
+
+    def trace(self) -> t.Union[int, float]:
+        return sum(values[row - self._start(row)] for row, values in enumerate(self._data))
+
+    def _eliminate(self, columns: list) -> t.Optional[t.Tuple[t.Union[int, float], list]]:
+        """
+        Run gaussian elimination without pivoting, restricted to the band.
+
+        Returns the determinant and the solved columns, or `None` if a zero pivot is met and pivoting is required.
+        """
+        size, upper = self._size, self.upper_bandwidth
+        data = [values.copy() for values in self._data]
+        starts = [self._start(row) for row in range(size)]
+
+        determinant = 1
+        for fd in range(size):  # FD - The focus diagonal.
+            pivot_row = data[fd]
+            pivot = pivot_row[fd - starts[fd]]
+            if pivot == 0:
+                return None
+
+            determinant *= pivot
+            last = min(size, fd + upper + 1)
+            for row in range(fd + 1, min(size, fd + self.lower_bandwidth + 1)):
+                current_row, start = data[row], starts[row]
+                scaler = current_row[fd - start] / pivot
+                if scaler == 0:
+                    continue
+
+                for col in range(fd, last):
+                    current_row[col - start] -= scaler * pivot_row[col - starts[fd]]
+                for column in columns:
+                    column[row] -= scaler * column[fd]
+
+        for column in columns:
+            for row in range(size - 1, -1, -1):
+                start = starts[row]
+                total = column[row]
+                for col in range(row + 1, min(size, row + upper + 1)):
+                    total -= data[row][col - start] * column[col]
+                column[row] = total / data[row][row - start]
+
+        return determinant, columns
+
+    def determinant(self) -> t.Union[int, float]:
+        result = self._eliminate([])
+        if result is None:
+            return super().determinant()
+        return result[0]
+
+    def solve(self, other: t.Union[Matrix, "hm.Vector"]) -> t.Union[Matrix, "hm.Vector"]:
+        """
+        Solve the system using band limited elimination, only falling back to pivoting on a zero pivot.
+        """
+        columns, is_vector = self._rhs_columns(other, self._size)
+        result = self._eliminate(columns)
+        if result is None:
+            return super().solve(other)
+        return self._pack_solution(result[1], is_vector)
+
+
+def _is_integral(*sequences: t.Iterable) -> bool:
+    return all(isinstance(value, int) for values in sequences for value in values)
+
+
+def _exact_product(rows: list, column: t.Sequence[int]) -> list:
+    """
+    Multiply the rows with an integer column in `O(n^2)`, for the products whose exact values could be too large to be
+    rounded back from the FFTs.
+    """
+    return [sum(map(operator.mul, row, column)) for row in rows]
+
+
+class ToeplitzMatrix(StructuredMatrix):
+    def __init__(
+            self, first_column: t.Union[list, "hm.Vector"], first_row: t.Union[list, "hm.Vector"] = None,
+            use_numpy: bool = False
+    ) -> None:
+        """
+        A square matrix whose values are constant along every diagonal, `T[i][j] = t[i - j]`, which is stored only as
+        its first column and first row.
+
+        Products with vectors and matrices embed the matrix into a circulant matrix of twice the size, and are computed
+        with FFTs in `O(n log n)` for every column. Integer products whose values could be too large to be recovered
+        exactly from the float64 FFTs are computed with integers in `O(n^2)` instead. Linear systems and the determinant are solved with Levinson
+        recursion in `O(n^2)`.
+
+        Parameters
+        ----------
+        first_column: t.Union[list, Vector]
+            The values of the first column, `t[0], t[1], ..., t[n - 1]`.
+        first_row: t.Union[list, Vector]
+            The values of the first row, `t[0], t[-1], ..., t[-(n - 1)]`. The matrix is symmetric when it isn't
+            specified.
+        use_numpy: bool
+            If NumPy should be used for computing the FFTs. Defaults to `False`.
+
+        Raises
+        ------
+        InvalidMatrixError
+            If the first column and row don't have the same first value.
+
+        Examples
+        --------
+        >>> from hypemaths import Vector
+        >>> toeplitz = ToeplitzMatrix([1, 2, 3], [1, 4, 5])
+        >>> toeplitz.matrix
+        [[1, 4, 5], [2, 1, 4], [3, 2, 1]]
+        >>> toeplitz.matvec(Vector(1, 0, 1))
+        Vector([6, 6, 4])
+        """
+        first_column = list(first_column)
+        first_row = first_column.copy() if first_row is None else list(first_row)
+        if not first_column:
+            raise ValueError("You need to pass the values of the first column!")
+        if len(first_row) != len(first_column):
+            raise MatrixNotSquare("The first column and the first row must have the same length.")
+
+        for value in first_column + first_row:
+            _check_value(value)
+        if first_row[0] != first_column[0]:
+            raise InvalidMatrixError("The first column and the first row must start with the same value.")
+
+        self._size = len(first_column)
+        self.first_column = first_column
+        self.first_row = first_row
+        self.use_numpy = use_numpy
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.first_column}, {self.first_row})"
+
+    def _get(self, row: int, col: int) -> t.Union[int, float]:
+        return self.first_column[row - col] if row >= col else self.first_row[col - row]
+
+    def _set(self, row: int, col: int, value: t.Union[int, float]) -> None:
+        if value != self._get(row, col):
+            raise InvalidMatrixError(
+                f"The elements of a {self.__class__.__name__} can only be changed through its first column and row."
+            )
+
+    def to_dense(self) -> list:
+        column, row = self.first_column, self.first_row
+        return [column[index::-1] + row[1:self._size - index] for index in range(self._size)]
+
+    def _scale(self, scalar: t.Union[int, float]) -> "ToeplitzMatrix":
+        return ToeplitzMatrix._new(
+            self._size, first_column=[value * scalar for value in self.first_column],
+            first_row=[value * scalar for value in self.first_row], use_numpy=self.use_numpy
+        )
+
+    def _add_same(self, other: StructuredMatrix, sign: int) -> t.Optional[StructuredMatrix]:
+        if not isinstance(other, ToeplitzMatrix):
+            return None
+
+        return ToeplitzMatrix._new(
+            self._size, first_column=[a + sign * b for a, b in zip(self.first_column, other.first_column)],
+            first_row=[a + sign * b for a, b in zip(self.first_row, other.first_row)], use_numpy=self.use_numpy
+        )
+
+    def _multiply_columns(self, columns: list) -> list:
+        """
+        Multiply the matrix with every column, through the circulant matrix of a power of two size, whose top left
+        block is this matrix.
+        """
+        size = self._size
+        padded = next_power_of_two(2 * size - 1)
+        embedding = self.first_column + [0] * (padded - 2 * size + 1) + self.first_row[:0:-1]
+        transformed = fft(embedding, use_numpy=self.use_numpy)
+
+        products = []
+        for column in columns:
+            integral = _is_integral(embedding, column)
+            if integral and not rounds_exactly(embedding, column):
+                products.append(_exact_product(self.to_dense(), column))
+                continue
+
+            values = fft(list(column) + [0] * (padded - size), use_numpy=self.use_numpy)
+            result = fft([a * b for a, b in zip(transformed, values)], inverse=True, use_numpy=self.use_numpy)
+            products.append(realize(result[:size], integral))
+        return products
+
+    def _left_multiply(self, other: Matrix) -> Matrix:
+        if self.cols != other.rows:
+            raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+
+        columns = self._multiply_columns(list(zip(*other._read())))
+        return Matrix([list(row) for row in zip(*columns)])
+
+    def _right_multiply(self, other: Matrix) -> Matrix:
+        if other.cols != self.rows:
+            raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+
+        # The rows of `other * self` are the columns of `self^T * other^T`.
+        return Matrix(self.transpose()._multiply_columns(other._read()))
+
+    def matvec(self, vector: "hm.Vector") -> "hm.Vector":
+        """
+        Compute the matrix vector product with FFTs in `O(n log n)`. `*` with a `Vector` broadcasts elementwise, like
+        for every `Matrix`.
+
+        Parameters
+        ----------
+        vector: Vector
+            The vector to be multiplied, as a column.
+
+        Returns
+        -------
+        Vector
+            The product.
+
+        Raises
+        ------
+        MatrixDimensionError
+            If the vector doesn't have as many points as the number of columns in the matrix.
+        """
+        if not isinstance(vector, hm.Vector):
+            raise TypeError(f"Matrix vector product can only be computed with a Vector. Not {type(vector)}")
+        if len(vector) != self.cols:
+            raise MatrixDimensionError("The vector must have the same length as the number of columns in the matrix.")
+        return hm.Vector(self._multiply_columns([vector._read()])[0])
+
+    def transpose(self) -> "ToeplitzMatrix":
+        return ToeplitzMatrix._new(
+            self._size, first_column=self.first_row.copy(), first_row=self.first_column.copy(), use_numpy=self.use_numpy
+        )
+
+    def trace(self) -> t.Union[int, float]:
+        return self._size * self.first_column[0]
+
+    def _levinson(self, columns: list) -> t.Optional[t.Tuple[t.Union[int, float], list]]:
+        """
+        Solve the system with Levinson recursion, growing the forward and backward vectors, which solve for the first
+        and last unit vectors, along with the solutions of the leading principal submatrices.
+
+        Returns the determinant and the solved columns, or `None` if a leading principal submatrix is singular.
+        """
+        column, row = self.first_column, self.first_row
+        if column[0] == 0:
+            return None
+
+        forward, backward = [1 / column[0]], [1 / column[0]]
+        solutions = [[values[0] / column[0]] for values in columns]
+        determinant = column[0]
+
+        for size in range(1, self._size):
+            # The values left over in the last row of `T [f; 0]`, and in the first row of `T [0; b]`.
+            forward_error = sum(column[size - index] * value for index, value in enumerate(forward))
+            backward_error = sum(row[index + 1] * value for index, value in enumerate(backward))
+            denominator = 1 - forward_error * backward_error
+            if denominator == 0:
+                return None
+
+            padded_forward, padded_backward = forward + [0], [0] + backward
+            forward = [(f - forward_error * b) / denominator for f, b in zip(padded_forward, padded_backward)]
+            backward = [(b - backward_error * f) / denominator for f, b in zip(padded_forward, padded_backward)]
+
+            # The top left element of the inverse is `det(T_size) / det(T_size + 1)`, as the submatrices are Toeplitz.
+            determinant /= forward[0]
+
+            for solution, values in zip(solutions, columns):
+                error = values[size] - sum(column[size - index] * value for index, value in enumerate(solution))
+                solution.append(0)
+                for index, value in enumerate(backward):
+                    solution[index] += error * value
+
+        return determinant, solutions
+
+    def determinant(self) -> t.Union[int, float]:
+        result = self._levinson([])
+        if result is None:
+            return super().determinant()
+        return result[0]
+
+    def solve(self, other: t.Union[Matrix, "hm.Vector"]) -> t.Union[Matrix, "hm.Vector"]:
+        """
+        Solve the system with Levinson recursion in `O(n^2)`, only falling back to pivoting when a leading principal
+        submatrix is singular.
+        """
+        columns, is_vector = self._rhs_columns(other, self._size)
+        result = self._levinson(columns)
+        if result is None:
+            return super().solve(other)
+        return self._pack_solution(result[1], is_vector)
+
+
+class CirculantMatrix(ToeplitzMatrix):
+    def __init__(self, first_column: t.Union[list, "hm.Vector"], use_numpy: bool = False) -> None:
+        """
+        A Toeplitz matrix whose every column is the previous one rotated down by one, `C[i][j] = c[(i - j) mod n]`,
+        which is stored only as its first column.
+
+        A circulant matrix is diagonalized by the Fourier transform, its eigenvalues being the FFT of the first column.
+        So products, linear systems, the inverse and the determinant are all computed with FFTs in `O(n log n)`. Like
+        for `ToeplitzMatrix`, integer products too large for the float64 FFTs are computed with integers instead, and
+        such determinants are returned as floats.
+
+        Parameters
+        ----------
+        first_column: t.Union[list, Vector]
+            The values of the first column.
+        use_numpy: bool
+            If NumPy should be used for computing the FFTs. Defaults to `False`.
+
+        Examples
+        --------
+        >>> from hypemaths import Vector
+        >>> circulant = CirculantMatrix([2, 1, 0, 0])
+        >>> circulant.matrix
+        [[2, 0, 0, 1], [1, 2, 0, 0], [0, 1, 2, 0], [0, 0, 1, 2]]
+        >>> circulant.solve(Vector(2, 3, 1, 0))
+        Vector([1.0, 1.0, 0.0, 0.0])
+        """
+        first_column = list(first_column)
+        if not first_column:
+            raise ValueError("You need to pass the values of the first column!")
+        for value in first_column:
+            _check_value(value)
+
+        self._size = len(first_column)
+        self.first_column = first_column
+        self.use_numpy = use_numpy
+
+    @property
+    def first_row(self) -> list:
+        return self.first_column[:1] + self.first_column[:0:-1]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.first_column})"
+
+    def _get(self, row: int, col: int) -> t.Union[int, float]:
+        return self.first_column[row - col]
+
+    def _scale(self, scalar: t.Union[int, float]) -> "CirculantMatrix":
+        return CirculantMatrix._new(
+            self._size, first_column=[value * scalar for value in self.first_column], use_numpy=self.use_numpy
+        )
+
+    def _add_same(self, other: StructuredMatrix, sign: int) -> t.Optional[StructuredMatrix]:
+        if not isinstance(other, CirculantMatrix):
+            return super()._add_same(other, sign)
+
+        return CirculantMatrix._new(
+            self._size, first_column=[a + sign * b for a, b in zip(self.first_column, other.first_column)],
+            use_numpy=self.use_numpy
+        )
+
+    def _eigenvalues(self) -> t.List[complex]:
+        return fft(self.first_column, use_numpy=self.use_numpy)
+
+    def _multiply_columns(self, columns: list) -> list:
+        eigenvalues = self._eigenvalues()
+
+        products = []
+        for column in columns:
+            integral = _is_integral(self.first_column, column)
+            if integral and not rounds_exactly(self.first_column, column):
+                products.append(_exact_product(self.to_dense(), column))
+                continue
+
+            values = fft(column, use_numpy=self.use_numpy)
+            result = fft([a * b for a, b in zip(eigenvalues, values)], inverse=True, use_numpy=self.use_numpy)
+            products.append(realize(result, integral))
+        return products
+
+    def _mul_same(self, other: StructuredMatrix) -> t.Optional[StructuredMatrix]:
+        # The product of circulant matrices is circulant, its first column being their circular convolution.
+        first, second = self.first_column, other.first_column
+        integral = _is_integral(first, second)
+        if integral and not rounds_exactly(first, second):
+            column = _exact_product(self.to_dense(), second)
+        else:
+            column = realize(circular_convolve(first, second, use_numpy=self.use_numpy), integral)
+        return CirculantMatrix._new(self._size, first_column=column, use_numpy=self.use_numpy)
+
+    def transpose(self) -> "CirculantMatrix":
+        return CirculantMatrix._new(self._size, first_column=self.first_row, use_numpy=self.use_numpy)
+
+    def _nonsingular_eigenvalues(self) -> t.List[complex]:
+        eigenvalues = self._eigenvalues()
+        largest = max(map(abs, eigenvalues))
+        if any(abs(value) <= SINGULAR_TOLERANCE * largest for value in eigenvalues):
+            raise SingularMatrixError("The circulant matrix has a zero eigenvalue, and is singular.")
+        return eigenvalues
+
+    def determinant(self) -> t.Union[int, float]:
+        product = 1
+        for value in self._eigenvalues():
+            product *= value
+
+        # Every eigenvalue is bounded by `sum|c|`, so the determinant is only rounded back to an integer while
+        # `sum|c| ** n` is small enough for it to be exact.
+        column = self.first_column
+        integral = _is_integral(column) and self._size * math.log2(max(1, sum(map(abs, column)))) < EXACT_BITS
+        return realize([product], integral)[0]
+
+    def inverse(self) -> "CirculantMatrix":
+        """
+        Compute the inverse, which is also circulant, from the reciprocals of the eigenvalues.
+        """
+        eigenvalues = self._nonsingular_eigenvalues()
+        column = fft([1 / value for value in eigenvalues], inverse=True, use_numpy=self.use_numpy)
+        return CirculantMatrix._new(self._size, first_column=realize(column), use_numpy=self.use_numpy)
+
+    def solve(self, other: t.Union[Matrix, "hm.Vector"]) -> t.Union[Matrix, "hm.Vector"]:
+        """
+        Solve the system in `O(n log n)` for every column, by dividing by the eigenvalues in the Fourier domain.
+        """
+        eigenvalues = self._nonsingular_eigenvalues()
+        columns, is_vector = self._rhs_columns(other, self._size)
+
+        solutions = []
+        for column in columns:
+            values = fft(column, use_numpy=self.use_numpy)
+            result = fft([a / b for a, b in zip(values, eigenvalues)], inverse=True, use_numpy=self.use_numpy)
+            solutions.append(realize(result))
+        return self._pack_solution(solutions, is_vector)
+
+
+def _bandwidths(rows: list, tolerance: float = 0) -> t.Tuple[int, int]:
+    """
+    Parameters
+    ----------
+    rows: list
+        The square 2D list to be checked.
+    tolerance: float
+        The values whose absolute value doesn't exceed the tolerance are treated as zeros.
+
+    Returns
+    -------
+    t.Tuple[int, int]
+        The lower and the upper bandwidth of the matrix.
+    """
+    lower = upper = 0
+    for row, values in enumerate(rows):
+        for col, value in enumerate(values):
+            if abs(value) > tolerance:
+                if col < row:
+                    lower = max(lower, row - col)
+                else:
+                    upper = max(upper, col - row)
+    return lower, upper
+
+
+def detect_structure(matrix: Matrix, tolerance: float = 0) -> Matrix:
+    """
+    Check a dense matrix for structure, and convert it into the most specialized matrix type.
+
+    The checks go from the most to the least specific type, identity, diagonal, triangular, symmetric and then banded.
+    A banded matrix is only used when the band takes less than half of the matrix.
+
+    Parameters
+    ----------
+    matrix: Matrix
+        The matrix to be checked.
+    tolerance: float
+        The values whose absolute value doesn't exceed this are treated as zeros, and symmetric entries may differ by
+        up to this value. Defaults to `0`.
+
+    Returns
+    -------
+    Matrix
+        The structured matrix, or the matrix passed if no structure was found.
+
+    Examples
+    --------
+    >>> detect_structure(Matrix([[1, 0], [0, 1]]))
+    Identity(2)
+    >>> detect_structure(Matrix([[1, 0], [3, 1]]))
+    TriangularMatrix([[1, 0], [3, 1]], lower=True)
+    """
+    if isinstance(matrix, StructuredMatrix) or matrix.rows != matrix.cols:
+        return matrix
+
+    rows = matrix._read()
+    size = len(rows)
+    lower, upper = _bandwidths(rows, tolerance)
+
+    if lower == upper == 0:
+        diagonal = [rows[index][index] for index in range(size)]
+        if all(abs(value - 1) <= tolerance for value in diagonal):
+            return Identity(size)
+        return DiagonalMatrix(diagonal)
+
+    if upper == 0 or lower == 0:
+        lower_triangle = upper == 0
+        return TriangularMatrix._new(size, lower=lower_triangle, _data=TriangularMatrix._pack(rows, lower_triangle))
+
+    if all(abs(rows[row][col] - rows[col][row]) <= tolerance for row in range(size) for col in range(row + 1, size)):
+        return SymmetricMatrix._new(size, _data=SymmetricMatrix._pack(rows))
+
+    if lower + upper + 1 <= size // 2:
+        return BandedMatrix._new(
+            size, lower_bandwidth=lower, upper_bandwidth=upper, _data=BandedMatrix._pack(rows, lower, upper)
+        )
+
+    return matrix
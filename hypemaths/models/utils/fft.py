@@ -0,0 +1,161 @@
+"""
+Fast Fourier transforms of any length, and the convolutions built on them.
+
+Lengths which are powers of two use the iterative radix-2 Cooley-Tukey algorithm, and every other length is turned
+into a power of two convolution with Bluestein's chirp z-transform, so every transform takes `O(n log n)`. NumPy can be
+used instead of the pure Python transforms, when it is installed.
+"""
+import cmath
+import math
+import typing as t
+
+Values = t.Sequence[t.Union[int, float, complex]]
+
+# The exact integer results rounded back from the float64 transforms must stay below `2 ** EXACT_BITS`. This is well
+# within the 53 bit mantissa, leaving room for the rounding errors of the transforms.
+EXACT_BITS = 42
+
+
+def _numpy() -> t.Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required for computing the FFT using NumPy.") from None
+    return numpy
+
+
+def next_power_of_two(size: int) -> int:
+    """
+    Returns
+    -------
+    int
+        The smallest power of two which is at least `size`.
+    """
+    return 1 << max(0, size - 1).bit_length()
+
+
+def _radix2(values: list, sign: int) -> list:
+    """The iterative, in place radix-2 transform, for a length which is a power of two."""
+    size = len(values)
+
+    # Reorder the values by the bit reversal of their indices.
+    swap = 0
+    for index in range(1, size):
+        bit = size >> 1
+        while swap & bit:
+            swap ^= bit
+            bit >>= 1
+        swap |= bit
+        if index < swap:
+            values[index], values[swap] = values[swap], values[index]
+
+    length = 2
+    while length <= size:
+        half = length // 2
+        twiddles = [cmath.exp(sign * 2j * math.pi * k / length) for k in range(half)]
+        for start in range(0, size, length):
+            for k, twiddle in enumerate(twiddles):
+                even, odd = values[start + k], values[start + k + half] * twiddle
+                values[start + k] = even + odd
+                values[start + k + half] = even - odd
+        length <<= 1
+
+    return values
+
+
+def _bluestein(values: list, sign: int) -> list:
+    """
+    The chirp z-transform, writing the transform of any length as a convolution, which is computed with radix-2
+    transforms of a padded power of two length.
+    """
+    size = len(values)
+    padded = next_power_of_two(2 * size - 1)
+
+    # `k^2` is taken mod `2n`, as the chirp has that period, which keeps the angles small and accurate.
+    chirp = [cmath.exp(sign * 1j * math.pi * (k * k % (2 * size)) / size) for k in range(size)]
+
+    first = [value * factor for value, factor in zip(values, chirp)] + [0] * (padded - size)
+    second = [0] * padded
+    for k in range(size):
+        second[k] = chirp[k].conjugate()
+        if k:
+            second[padded - k] = second[k]
+
+    first, second = _radix2(first, -1), _radix2(second, -1)
+    convolution = _radix2([a * b for a, b in zip(first, second)], 1)
+    return [convolution[k] / padded * chirp[k] for k in range(size)]
+
+
+def fft(values: Values, inverse: bool = False, use_numpy: bool = False) -> t.List[complex]:
+    """
+    Compute the discrete Fourier transform `X[k] = sum(x[j] exp(-2 pi i j k / n))` of the values.
+
+    Parameters
+    ----------
+    values: Values
+        The values to be transformed, which can have any length.
+    inverse: bool
+        If the inverse transform should be computed, including the division by the length. Defaults to `False`.
+    use_numpy: bool
+        If NumPy should be used for computing the transform. Defaults to `False`.
+
+    Returns
+    -------
+    t.List[complex]
+        The transformed values.
+
+    Raises
+    ------
+    ImportError
+        If `use_numpy` is set, but NumPy isn't installed.
+    """
+    size = len(values)
+    if size == 0:
+        return []
+
+    if use_numpy:
+        numpy = _numpy()
+        return (numpy.fft.ifft(values) if inverse else numpy.fft.fft(values)).tolist()
+
+    sign = 1 if inverse else -1
+    values = [complex(value) for value in values]
+    if size & (size - 1) == 0:
+        result = _radix2(values, sign)
+    else:
+        result = _bluestein(values, sign)
+
+    if inverse:
+        return [value / size for value in result]
+    return result
+
+
+def circular_convolve(first: Values, second: Values, use_numpy: bool = False) -> t.List[complex]:
+    """
+    Compute the circular convolution `y[k] = sum(first[j] second[(k - j) mod n])` of two sequences of the same length.
+    """
+    if len(first) != len(second):
+        raise ValueError("Both the sequences must have the same length for a circular convolution.")
+
+    transformed = [a * b for a, b in zip(fft(first, use_numpy=use_numpy), fft(second, use_numpy=use_numpy))]
+    return fft(transformed, inverse=True, use_numpy=use_numpy)
+
+
+def rounds_exactly(first: t.Sequence[int], second: t.Sequence[int]) -> bool:
+    """
+    Check if a convolution of two integer sequences, computed with the float64 transforms, can be rounded back to its
+    exact values. Every value of it is bounded by `min(len) * max|first| * max|second|`, which must stay below
+    `2 ** EXACT_BITS`.
+    """
+    bound = min(len(first), len(second)) * max(map(abs, first), default=0) * max(map(abs, second), default=0)
+    return bound < 2 ** EXACT_BITS
+
+
+def realize(values: t.Iterable[complex], integral: bool = False) -> list:
+    """
+    Drop the imaginary parts left by rounding in the transforms of real values, and round the values back to integers
+    when the exact result is known to be integral. The exact values must be small enough to be recovered from the
+    float64 results, which `rounds_exactly` checks for convolutions.
+    """
+    if integral:
+        return [int(round(value.real)) for value in values]
+    return [value.real for value in values]
@@ -0,0 +1,233 @@
+import typing as t
+
+from hypemaths.exceptions import SingularMatrixError
+
+
+def lu_decompose(matrix: list) -> t.Tuple[list, list, int]:
+    """
+    Factorize a square matrix into its LU form using partial pivoting.
+
+    Parameters
+    ----------
+    matrix: list
+        The square 2D list to be factorized. It is not modified.
+
+    Returns
+    -------
+    t.Tuple[list, list, int]
+        The packed LU rows (unit lower triangle below the diagonal, upper triangle on and above it), the row
+        permutation and the sign of the permutation.
+
+    Raises
+    ------
+    SingularMatrixError
+        If a zero pivot is found, which means that the matrix is singular.
+    """
+    size = len(matrix)
+    lu = [list(row) for row in matrix]
+    permutation = list(range(size))
+    sign = 1
+
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda row: abs(lu[row][col]))
+        if lu[pivot][col] == 0:
+            raise SingularMatrixError("The matrix is singular and cannot be factorized.")
+
+        if pivot != col:
+            lu[col], lu[pivot] = lu[pivot], lu[col]
+            permutation[col], permutation[pivot] = permutation[pivot], permutation[col]
+            sign = -sign
+
+        pivot_row = lu[col]
+        pivot_value = pivot_row[col]
+        for row in range(col + 1, size):
+            current_row = lu[row]
+            scaler = current_row[col] / pivot_value
+            if scaler == 0:
+                continue
+
+            current_row[col] = scaler
+            for j in range(col + 1, size):
+                current_row[j] -= scaler * pivot_row[j]
+
+    return lu, permutation, sign
+
+
+def lu_solve(lu: list, permutation: list, values: list) -> list:
+    """
+    Solve `A x = b` for a single right hand side using the output of `lu_decompose`.
+
+    Parameters
+    ----------
+    lu: list
+        The packed LU rows.
+    permutation: list
+        The row permutation returned from the factorization.
+    values: list
+        The right hand side `b`.
+
+    Returns
+    -------
+    list
+        The solution `x`.
+    """
+    size = len(lu)
+    solution = [values[index] for index in permutation]
+
+    for row in range(size):
+        lu_row = lu[row]
+        total = solution[row]
+        for col in range(row):
+            total -= lu_row[col] * solution[col]
+        solution[row] = total
+
+    for row in range(size - 1, -1, -1):
+        lu_row = lu[row]
+        total = solution[row]
+        for col in range(row + 1, size):
+            total -= lu_row[col] * solution[col]
+        solution[row] = total / lu_row[row]
+
+    return solution
+
+
+def lu_determinant(lu: list, sign: int) -> t.Union[int, float]:
+    """
+    Compute the determinant from the output of `lu_decompose`.
+
+    Parameters
+    ----------
+    lu: list
+        The packed LU rows.
+    sign: int
+        The sign of the row permutation.
+
+    Returns
+    -------
+    t.Union[int, float]
+        The determinant of the factorized matrix.
+    """
+    product = sign
+    for index, row in enumerate(lu):
+        product *= row[index]
+    return product
+
+
+def solve_columns(matrix: list, columns: list) -> list:
+    """
+    Solve `A X = B` for every column of `B` with a single factorization of `A`.
+
+    Parameters
+    ----------
+    matrix: list
+        The square 2D list `A`.
+    columns: list
+        The list of right hand side columns.
+
+    Returns
+    -------
+    list
+        The list of solution columns.
+    """
+    lu, permutation, _ = lu_decompose(matrix)
+    return [lu_solve(lu, permutation, column) for column in columns]
+
+
+def lu_inverse(lu: list, permutation: list) -> list:
+    """
+    Compute the inverse from the output of `lu_decompose`, by solving for every column of the identity matrix.
+
+    Parameters
+    ----------
+    lu: list
+        The packed LU rows.
+    permutation: list
+        The row permutation returned from the factorization.
+
+    Returns
+    -------
+    list
+        The rows of the inverse.
+    """
+    size = len(lu)
+    columns = [lu_solve(lu, permutation, [1.0 if row == col else 0.0 for row in range(size)]) for col in range(size)]
+    return [list(row) for row in zip(*columns)]
+
+
+def run_steps(steps: t.Generator) -> t.Any:
+    """
+    Run a step wise kernel, like `matmul_steps`, to the end without pausing.
+
+    Returns
+    -------
+    t.Any
+        The result returned by the kernel.
+    """
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+def matmul_steps(left: list, right: list, chunk_rows: t.Optional[int] = None) -> t.Generator[None, None, list]:
+    """
+    Multiply two 2D lists, pausing after every chunk of rows of the result.
+
+    Parameters
+    ----------
+    left: list
+        The left 2D list.
+    right: list
+        The right 2D list, having as many rows as the columns of `left`.
+    chunk_rows: t.Optional[int]
+        The number of rows computed between the pauses. All the rows are computed at once by default.
+
+    Returns
+    -------
+    list
+        The rows of the product, as the value of the `StopIteration`.
+    """
+    columns = list(zip(*right))
+    chunk_rows = chunk_rows or len(left)
+
+    matrix = []
+    for start in range(0, len(left), chunk_rows):
+        matrix.extend(
+            [sum(a * b for a, b in zip(left_row, column)) for column in columns] for left_row in left[start:start + chunk_rows]
+        )
+        if start + chunk_rows < len(left):
+            yield
+    return matrix
+
+
+def determinant_steps(matrix: list) -> t.Generator[None, None, float]:
+    """
+    Compute the determinant of a square 2D list by elimination, pausing after every column is eliminated.
+
+    Returns
+    -------
+    float
+        The determinant, as the value of the `StopIteration`.
+    """
+    matrix_size = len(matrix)
+    matrix_copy = [list(row) for row in matrix]
+
+    for fd in range(matrix_size):  # FD - The focus diagonal.
+        for i in range(fd + 1, matrix_size):
+            if matrix_copy[fd][fd] == 0:
+                matrix_copy[fd][fd] = 1.0e-18
+
+            current_row_scaler = matrix_copy[i][fd] / matrix_copy[fd][fd]
+
+            for j in range(matrix_size):
+                matrix_copy[i][j] = matrix_copy[i][j] - current_row_scaler * matrix_copy[fd][j]
+
+        if fd + 1 < matrix_size:
+            yield
+
+    product = 1.0
+    for i in range(matrix_size):
+        product *= matrix_copy[i][i]
+
+    return product
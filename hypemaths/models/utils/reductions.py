@@ -0,0 +1,105 @@
+import operator
+import typing as t
+
+
+def column_totals(rows: t.Sequence, function: t.Callable) -> list:
+    """
+    Reduce every column of the rows with a binary function, walking the rows in their storage order.
+
+    Parameters
+    ----------
+    rows: t.Sequence
+        The rows to be reduced, which must not be empty.
+    function: t.Callable
+        The binary function used for combining the values, like `operator.add` or `min`.
+
+    Returns
+    -------
+    list
+        The reduced value of every column.
+    """
+    totals = list(rows[0])
+    for row in rows[1:]:
+        totals = list(map(function, totals, row))
+    return totals
+
+
+def arg_best(values: t.Sequence, better: t.Callable) -> int:
+    """
+    Parameters
+    ----------
+    values: t.Sequence
+        The values to be searched, which must not be empty.
+    better: t.Callable
+        The comparison telling if the first value should replace the second one, like `operator.lt` for the minimum.
+
+    Returns
+    -------
+    int
+        The index of the first best value.
+    """
+    best_index, best = 0, values[0]
+    for index, value in enumerate(values):
+        if better(value, best):
+            best_index, best = index, value
+    return best_index
+
+
+def column_arg_best(rows: t.Sequence, better: t.Callable) -> t.Tuple[list, list]:
+    """
+    Find the best value of every column and its row, walking the rows in their storage order.
+
+    Returns
+    -------
+    t.Tuple[list, list]
+        The row index of the first best value of every column, and the best values.
+    """
+    best = list(rows[0])
+    indices = [0] * len(best)
+    for row_index, row in enumerate(rows):
+        for col, value in enumerate(row):
+            if better(value, best[col]):
+                best[col] = value
+                indices[col] = row_index
+    return indices, best
+
+
+def welford(values: t.Iterable) -> t.Tuple[int, float, float]:
+    """
+    Accumulate the mean and the sum of the squared deviations in a single pass, using Welford's algorithm.
+
+    Returns
+    -------
+    t.Tuple[int, float, float]
+        The number of values, their mean and the sum of their squared deviations from the mean.
+    """
+    count, mean, m2 = 0, 0.0, 0.0
+    for value in values:
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+    return count, mean, m2
+
+
+def column_welford(rows: t.Iterable) -> t.Tuple[int, list, list]:
+    """
+    Accumulate the mean and the sum of the squared deviations of every column in a single pass over the rows, using
+    Welford's algorithm.
+
+    Returns
+    -------
+    t.Tuple[int, list, list]
+        The number of rows, the mean and the sum of the squared deviations of every column.
+    """
+    count, means, m2s = 0, None, None
+    for row in rows:
+        count += 1
+        if means is None:
+            means, m2s = [float(value) for value in row], [0.0] * len(row)
+            continue
+
+        deltas = list(map(operator.sub, row, means))
+        means = [mean + delta / count for mean, delta in zip(means, deltas)]
+        m2s = [m2 + delta * (value - mean) for m2, delta, value, mean in zip(m2s, deltas, row, means)]
+    return count, means, m2s
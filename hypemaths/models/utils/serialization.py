@@ -0,0 +1,329 @@
+"""
+The compact binary format used for serializing matrices and vectors.
+
+A payload is a fixed header followed by the raw values:
+
+- `magic` (4 bytes): `HMMX` for matrices and `HMVX` for vectors.
+- `version` (1 byte): the version of the format, currently `1`.
+- `code` (1 byte): the storage code of the values, see `STORAGE_CODES`.
+- `ndim` (1 byte): the number of dimensions, followed by each dimension as an unsigned 64 bit integer.
+- The values, little endian, in row major order.
+
+Objects with a `dtype` use the upper case storage codes, and the values are written straight from the typed storage.
+Values which have no fixed size binary representation, like integers out of the 64 bit range, fall back to a JSON
+encoded list so that nothing is ever lost.
+"""
+import array
+import json
+import struct
+import sys
+import typing as t
+
+from hypemaths import dtypes
+
+FORMAT_VERSION = 1
+
+MATRIX_MAGIC = b"HMMX"
+VECTOR_MAGIC = b"HMVX"
+
+# The storage codes, mapped to the `array` typecode used for the values.
+STORAGE_CODES = {
+    b"q": "q",  # int64
+    b"d": "d",  # float64
+    b"m": "d",  # float64, followed by a bitmap marking the values that are integers.
+    b"j": None,  # JSON encoded list, used as the fallback.
+    b"F": "f",  # float32 dtype
+    b"D": "d",  # float64 dtype
+    b"I": "i",  # int32 dtype
+    b"Q": "q",  # int64 dtype
+    b"C": "d",  # complex128 dtype, as pairs of float64 for the real and the imaginary parts.
+}
+
+# The storage codes used for each dtype.
+DTYPE_CODES = {
+    dtypes.float32: b"F",
+    dtypes.float64: b"D",
+    dtypes.int32: b"I",
+    dtypes.int64: b"Q",
+    dtypes.complex128: b"C",
+}
+CODE_DTYPES = {code: dtype for dtype, code in DTYPE_CODES.items()}
+
+_HEADER = struct.Struct("<4sBcB")
+_DIMENSION = struct.Struct("<Q")
+
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+_FLOAT_INT_LIMIT = 2 ** 53
+
+
+def _storage_code(values: list) -> bytes:
+    """
+    Parameters
+    ----------
+    values: list
+        The flat list of values to be serialized.
+
+    Returns
+    -------
+    bytes
+        The most compact storage code which can represent all the values exactly.
+    """
+    has_int = has_float = False
+    fits_int64 = fits_float = True
+
+    for value in values:
+        if isinstance(value, int):
+            has_int = True
+            if not _INT64_MIN <= value <= _INT64_MAX:
+                fits_int64 = False
+            if abs(value) > _FLOAT_INT_LIMIT:
+                fits_float = False
+        elif isinstance(value, float):
+            has_float = True
+        else:
+            return b"j"
+
+    if not has_float:
+        return b"q" if fits_int64 else b"j"
+    if not has_int:
+        return b"d"
+    return b"m" if fits_float else b"j"
+
+
+def _values_buffer(values: list, code: bytes) -> t.Union[array.array, bytes]:
+    typecode = STORAGE_CODES[code]
+    if typecode is None:
+        return json.dumps(values).encode()
+
+    buffer = array.array(typecode, values)
+    if sys.byteorder == "big":
+        buffer.byteswap()
+    return buffer
+
+
+def _int_bitmap(values: list) -> bytes:
+    bitmap = bytearray((len(values) + 7) // 8)
+    for index, value in enumerate(values):
+        if isinstance(value, int):
+            bitmap[index >> 3] |= 1 << (index & 7)
+    return bytes(bitmap)
+
+
+def encode_header(magic: bytes, code: bytes, shape: tuple) -> bytes:
+    return _HEADER.pack(magic, FORMAT_VERSION, code, len(shape)) + b"".join(
+        _DIMENSION.pack(dimension) for dimension in shape
+    )
+
+
+def split_values(
+        rows: t.Iterable, dtype: t.Optional[dtypes.DType] = None
+) -> t.Tuple[bytes, t.Union[array.array, bytes], bytes]:
+    """
+    Parameters
+    ----------
+    rows: t.Iterable
+        The rows of values to be serialized, in row major order.
+    dtype: t.Optional[dtypes.DType]
+        The element type of the storage, if it is typed.
+
+    Returns
+    -------
+    t.Tuple[bytes, t.Union[array.array, bytes], bytes]
+        The storage code, the buffer holding the values and the trailer following the buffer.
+    """
+    if dtype is not None:
+        code = DTYPE_CODES[dtype]
+        buffer = array.array(STORAGE_CODES[code])
+        for row in rows:
+            if dtype is dtypes.complex128:
+                buffer.extend(part for value in row for part in (value.real, value.imag))
+            else:
+                buffer.extend(row)
+
+        if sys.byteorder == "big":
+            buffer.byteswap()
+        return code, buffer, b""
+
+    values = [value for row in rows for value in row]
+    code = _storage_code(values)
+    trailer = _int_bitmap(values) if code == b"m" else b""
+    return code, _values_buffer(values, code), trailer
+
+
+def encode(magic: bytes, shape: tuple, rows: t.Iterable, dtype: t.Optional[dtypes.DType] = None) -> bytes:
+    """
+    Serialize the values into the binary format.
+
+    Parameters
+    ----------
+    magic: bytes
+        The magic bytes identifying the kind of object.
+    shape: tuple
+        The dimensions of the object.
+    rows: t.Iterable
+        The rows of values, in row major order.
+    dtype: t.Optional[dtypes.DType]
+        The element type of the storage, if it is typed.
+
+    Returns
+    -------
+    bytes
+        The serialized payload.
+    """
+    code, buffer, trailer = split_values(rows, dtype)
+    data = buffer if isinstance(buffer, bytes) else buffer.tobytes()
+    return encode_header(magic, code, shape) + data + trailer
+
+
+def decode_header(data: t.Union[bytes, memoryview], magic: bytes) -> t.Tuple[bytes, tuple, int]:
+    """
+    Parameters
+    ----------
+    data: t.Union[bytes, memoryview]
+        The serialized payload, or its header.
+    magic: bytes
+        The magic bytes expected for the kind of object.
+
+    Returns
+    -------
+    t.Tuple[bytes, tuple, int]
+        The storage code, the shape and the size of the header in bytes.
+
+    Raises
+    ------
+    ValueError
+        If the header is invalid or written by an unsupported version of the format.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("The payload is too short to contain a header.")
+
+    found_magic, version, code, ndim = _HEADER.unpack_from(data)
+    if found_magic != magic:
+        raise ValueError(f"Invalid payload, expected the magic bytes {magic!r} but got {found_magic!r}.")
+    if version > FORMAT_VERSION:
+        raise ValueError(f"The payload has the format version {version}, only up to {FORMAT_VERSION} is supported.")
+    if code not in STORAGE_CODES:
+        raise ValueError(f"The payload has an unknown storage code {code!r}.")
+
+    offset = _HEADER.size
+    if len(data) < offset + ndim * _DIMENSION.size:
+        raise ValueError("The payload is too short to contain the dimensions.")
+
+    shape = tuple(_DIMENSION.unpack_from(data, offset + index * _DIMENSION.size)[0] for index in range(ndim))
+    return code, shape, offset + ndim * _DIMENSION.size
+
+
+def decode_values(code: bytes, count: int, data: t.Union[bytes, memoryview]) -> t.Union[array.array, list]:
+    """
+    Parameters
+    ----------
+    code: bytes
+        The storage code of the values.
+    count: int
+        The number of values expected.
+    data: t.Union[bytes, memoryview]
+        The buffer holding the values, followed by the trailer if any.
+
+    Returns
+    -------
+    t.Union[array.array, list]
+        The flat values. They are kept in the `array` for the real dtypes, so that they can be used as the storage.
+
+    Raises
+    ------
+    ValueError
+        If the buffer doesn't contain the expected number of values.
+    """
+    typecode = STORAGE_CODES[code]
+    if typecode is None:
+        values = json.loads(bytes(data).decode())
+        if len(values) != count:
+            raise ValueError(f"The payload has {len(values)} values, but {count} were expected.")
+        return values
+
+    if code == b"C":
+        count *= 2
+
+    buffer = array.array(typecode)
+    size = count * buffer.itemsize
+    trailer_size = (count + 7) // 8 if code == b"m" else 0
+    if len(data) != size + trailer_size:
+        raise ValueError(f"The payload has {len(data)} bytes of values, but {size + trailer_size} were expected.")
+
+    buffer.frombytes(data[:size])
+    if sys.byteorder == "big":
+        buffer.byteswap()
+
+    if code in CODE_DTYPES:
+        if code == b"C":
+            return [complex(real, imag) for real, imag in zip(buffer[::2], buffer[1::2])]
+        return buffer
+
+    values = buffer.tolist()
+
+    if code == b"m":
+        bitmap = data[size:]
+        for index in range(count):
+            if bitmap[index >> 3] & (1 << (index & 7)):
+                values[index] = int(values[index])
+
+    return values
+
+
+def decode(data: t.Union[bytes, memoryview], magic: bytes) -> t.Tuple[tuple, t.Any, t.Optional[dtypes.DType]]:
+    """
+    Deserialize a payload created by `encode`.
+
+    Parameters
+    ----------
+    data: t.Union[bytes, memoryview]
+        The serialized payload.
+    magic: bytes
+        The magic bytes expected for the kind of object.
+
+    Returns
+    -------
+    t.Tuple[tuple, t.Any, t.Optional[dtypes.DType]]
+        The shape, the flat values and the element type.
+    """
+    data = memoryview(data).cast("B")
+    code, shape, offset = decode_header(data, magic)
+
+    count = 1
+    for dimension in shape:
+        count *= dimension
+    return shape, decode_values(code, count, data[offset:]), CODE_DTYPES.get(code)
+
+
+def reduce(
+        obj: t.Any, magic: bytes, shape: tuple, rows: t.Iterable, protocol: int, rebuild: t.Callable,
+        dtype: t.Optional[dtypes.DType] = None
+) -> tuple:
+    """
+    Build the pickle reduction of a matrix or a vector.
+
+    With the pickle protocol 5 and above, the values are passed as a `pickle.PickleBuffer`, so that they can be sent
+    out-of-band without any copying.
+    """
+    code, buffer, trailer = split_values(rows, dtype)
+    header = encode_header(magic, code, shape)
+
+    if protocol >= 5 and not isinstance(buffer, bytes) and not trailer:
+        import pickle
+
+        return rebuild, (type(obj), header, pickle.PickleBuffer(buffer))
+
+    data = buffer if isinstance(buffer, bytes) else buffer.tobytes()
+    return rebuild, (type(obj), header, data + trailer)
+
+
+def rebuild_values(header: bytes, data: t.Any, magic: bytes) -> t.Tuple[tuple, t.Any, t.Optional[dtypes.DType]]:
+    """Rebuild the shape and the values of an object reduced by `reduce`, from the header and the values buffer."""
+    data = memoryview(data).cast("B")
+    code, shape, _ = decode_header(header, magic)
+
+    count = 1
+    for dimension in shape:
+        count *= dimension
+    return shape, decode_values(code, count, data), CODE_DTYPES.get(code)
@@ -1,11 +1,20 @@
+import array
+import itertools
+import operator
 import typing as t
 
 import hypemaths as hm
+from hypemaths import dtypes
 from hypemaths.exceptions import MatrixDimensionError, VectorDimensionError
+from hypemaths.generators import RandomGenerator
+from hypemaths.models.utils import serialization
 
 
 class Vector:
-    def __init__(self, *points: t.Union[int, tuple]) -> None:
+    # The element type of the typed storage, `None` for vectors storing the Python numbers as passed.
+    dtype = None
+
+    def __init__(self, *points: t.Union[int, tuple], dtype: t.Union[dtypes.DType, str, type, None] = None) -> None:
         """
         Constructor for the `Vector` class.
 
@@ -13,8 +22,115 @@ class Vector:
         ----------
         points: tuple
             All the points for the vector.
+        dtype: t.Union[DType, str, type, None]
+            The element type, like `hm.float32` or `"int64"`, used for storing the points in typed storage. The points
+            are kept as they are passed by default, unless there are complex values which use `complex128`.
+        """
+        points = self._cleaned_vector(points)
+
+        dtype = dtypes.get_dtype(dtype)
+        if dtype is None:
+            dtype = dtypes.infer(points)
+
+        self._store(points if dtype is None else dtype.storage(points))
+        self.dtype = dtype
+
+    @property
+    def points(self) -> list:
+        """
+        Returns
+        -------
+        list
+            The list storing the points. As it can be modified by the caller, a storage shared with clones is copied
+            before being returned, and the clones made afterwards get a copy of their own.
+        """
+        self._own()
+        self._exposed = True
+        return self._points
+
+    @points.setter
+    def points(self, points: list) -> None:
+        self._store(points)
+        # The caller still holds the list, so it is treated like a storage returned by `points`.
+        self._exposed = True
+
+    def _store(self, points: list) -> None:
+        """Use a new list as the storage, which must not be referenced anywhere else."""
+        self._points = points
+        self._refs = [1]
+        # If the storage has been handed out and can be modified outside of `_own`.
+        self._exposed = False
+
+    def _read(self) -> list:
+        """
+        Returns
+        -------
+        list
+            The list storing the points, without copying a shared storage. It must never be modified.
+        """
+        return self._points
+
+    def _own(self) -> None:
+        """Copy the storage if it is shared with any clones, so that it can be modified safely."""
+        if self._refs[0] > 1:
+            self._refs[0] -= 1
+            self._store(self._points[:])
+
+    @classmethod
+    def _from_points(cls, points: list, dtype: t.Optional[dtypes.DType] = None) -> "Vector":
+        """
+        Create the vector directly from a list of points which is known to be valid, skipping the validation.
+
+        Parameters
+        ----------
+        points: list
+            The valid list of points, which is used as the storage without copying when no `dtype` is given.
+        dtype: t.Optional[dtypes.DType]
+            The element type, for converting the points into the typed storage.
+
+        Returns
+        -------
+        Vector
+            The vector created.
+        """
+        vector = cls.__new__(cls)
+        vector._store(points if dtype is None else dtype.storage(points))
+        vector.dtype = dtype
+        return vector
+
+    @classmethod
+    def get_randomized_vector(
+            cls, size: int, min_value: int, max_value: int, seed: int = None, round_digits: t.Optional[int] = 2
+    ) -> "Vector":
         """
-        self.points = self._cleaned_vector(points)
+        Generate a random vector object with the specified parameters.
+
+        Parameters
+        ----------
+        size: int
+            The number of points in the vector to be generated.
+        min_value: int
+            The minimum value for random number generation
+        max_value: int
+            The maximum value for random number generation
+        seed: int
+            The seed for random number generation which can be recreated later.
+        round_digits: int
+            The number of digits to be in the number after decimal. Set the value as number for integer values.
+
+        Returns
+        -------
+        Vector
+            The random vector generated from the function.
+
+        Examples
+        --------
+        >>> vector = Vector.get_randomized_vector(3, 1, 10, seed=7)
+        >>> vector
+        Vector([3.91, 2.36, 6.86])
+        """
+        generator = RandomGenerator(seed)
+        return cls._from_points(generator.uniform_vector(size, min_value, max_value, round_digits=round_digits or 0)._read())
 
     @staticmethod
     def _cleaned_vector(points: tuple) -> list:
@@ -33,12 +149,15 @@ class Vector:
         """
         def value_check(vector_points: list) -> bool:
             for index, point in enumerate(vector_points):
-                if not isinstance(point, (int, float)):
-                    raise TypeError(f"All points must be integers or floats, but point[{index}] is {type(point)}")
+                if not isinstance(point, (int, float, complex)):
+                    raise TypeError(
+                        f"All points must be integers, floats or complex numbers, but point[{index}] is {type(point)}"
+                    )
             return True
 
-        if len(points) == 1 and isinstance(points[0], list):
-            points = points[0]
+        if len(points) == 1 and isinstance(points[0], (list, array.array)):
+            # The list passed is copied, so that it can't be changed by the caller.
+            points = list(points[0])
         else:
             points = list(points)
 
@@ -47,6 +166,53 @@ class Vector:
 
         return points
 
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        return serialization.reduce(
+            self, serialization.VECTOR_MAGIC, (len(self),), [self._points], protocol, _rebuild_vector, self.dtype
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the vector into a compact binary payload, in the same format as `Matrix.to_bytes`.
+
+        Returns
+        -------
+        bytes
+            The serialized vector.
+        """
+        return serialization.encode(serialization.VECTOR_MAGIC, (len(self),), [self._points], self.dtype)
+
+    @classmethod
+    def from_bytes(cls, data: t.Union[bytes, bytearray, memoryview]) -> "Vector":
+        """
+        Create a vector from a payload serialized by `to_bytes`.
+
+        Parameters
+        ----------
+        data: t.Union[bytes, bytearray, memoryview]
+            The serialized payload.
+
+        Returns
+        -------
+        Vector
+            The deserialized vector.
+
+        Raises
+        ------
+        ValueError
+            If the payload is invalid, truncated or written by an unsupported version of the format.
+        """
+        return cls._from_flat_values(*serialization.decode(data, serialization.VECTOR_MAGIC))
+
+    @classmethod
+    def _from_flat_values(cls, shape: tuple, points: t.Any, dtype: t.Optional[dtypes.DType]) -> "Vector":
+        if len(shape) != 1:
+            raise ValueError(f"The payload has invalid dimensions for a vector: {shape}.")
+
+        vector = cls._from_points(points)
+        vector.dtype = dtype
+        return vector
+
     @property
     def dimensions(self) -> int:
         """
@@ -59,10 +225,12 @@ class Vector:
         return len(self)
 
     def __len__(self) -> int:
-        return len(self.points)
+        return len(self._points)
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({self.points})"
+        if self.dtype is None:
+            return f"{self.__class__.__name__}({self._points})"
+        return f"{self.__class__.__name__}({list(self._points)}, dtype={self.dtype})"
 
     def __eq__(self, other: "Vector") -> bool:
         if not isinstance(other, Vector):
@@ -70,66 +238,185 @@ class Vector:
                 f"Equality comparison with vector can only be performed with another vector, got {type(other)}"
             )
 
-        return self.points == other.points
+        if self.dtype is None and other.dtype is None:
+            return self._points == other._points
+        return list(self._points) == list(other._points)
 
     def __getitem__(self, index: int) -> t.Union[int, float]:
-        return self.points[index]
+        return self._points[index]
+
+    def __iter__(self) -> t.Iterator[t.Union[int, float]]:
+        return iter(self._points)
 
-    def __setitem__(self, index: t.Union[int, tuple], value: t.Union[int, float]) -> None:
-        if isinstance(value, (int, float)):
-            self.points[index] = value
+    def __setitem__(self, index: t.Union[int, tuple], value: t.Union[int, float, complex]) -> None:
+        if isinstance(value, (int, float, complex)):
+            if self.dtype is not None:
+                value = self.dtype.cast(value)
+            elif isinstance(value, complex):
+                raise TypeError("Complex values can only be stored in vectors with a complex dtype.")
+
+            self._own()
+            self._points[index] = value
         else:
             raise TypeError(
-                f"All values must be integers or floats, but value[{value}] is {type(value)}."
+                f"All values must be integers, floats or complex numbers, but value[{value}] is {type(value)}."
             )
 
     def __delitem__(self, index: int) -> None:
-        del self.points[index]
+        self._own()
+        del self._points[index]
 
-    def __add__(self, other: "Vector") -> "Vector":
+    def _elementwise(
+            self, other: t.Union["Vector", dtypes.Number], function: t.Callable, operation: str, reflected: bool = False
+    ) -> "Vector":
+        """
+        Apply an elementwise operation with another vector of the same size, or with a scalar broadcast over the points.
+        """
         cls = self.__class__
 
-        if not isinstance(other, cls):
-            raise TypeError(f"Vector can only be added with another Vector, not with {type(other)}")
+        if isinstance(other, (int, float, complex)):
+            if reflected:
+                points = list(map(function, itertools.repeat(other, len(self)), self._points))
+            else:
+                points = list(map(function, self._points, itertools.repeat(other)))
+            dtype = dtypes.promote_scalar(self.dtype, other)
+        elif isinstance(other, cls):
+            if self.dimensions != other.dimensions:
+                raise VectorDimensionError(f"These vectors cannot be {operation} due to wrong dimensions.")
+
+            left, right = (other._points, self._points) if reflected else (self._points, other._points)
+            points = list(map(function, left, right))
+            dtype = dtypes.promote(self.dtype, other.dtype)
+        else:
+            raise TypeError(f"Vector can only be {operation} with another Vector or a scalar, not with {type(other)}")
 
-        if self.dimensions != other.dimensions:
-            raise VectorDimensionError(
-                "These vectors cannot be added due to wrong dimensions."
-            )
+        if function is operator.truediv:
+            dtype = dtypes.true_divide(dtype)
+        return cls._from_points(points, dtype)
 
-        vector = [self[index] + other[index] for index in range(self.dimensions)]
-        return cls(vector)
+    def __add__(self, other: t.Union["Vector", dtypes.Number]) -> "Vector":
+        if isinstance(other, hm.Matrix):
+            return NotImplemented
+        return self._elementwise(other, operator.add, "added")
 
-    def __sub__(self, other: "Vector") -> "Vector":
-        cls = self.__class__
+    def __sub__(self, other: t.Union["Vector", dtypes.Number]) -> "Vector":
+        if isinstance(other, hm.Matrix):
+            return NotImplemented
+        return self._elementwise(other, operator.sub, "subtracted")
 
-        if not isinstance(other, cls):
-            raise TypeError(f"Vector can only be subtracted with another Vector, not with {type(other)}")
+    def __mul__(self, other: t.Union["Vector", dtypes.Number]) -> "Vector":
+        if isinstance(other, hm.Matrix):
+            return NotImplemented
+        return self._elementwise(other, operator.mul, "multiplied")
 
-        if self.dimensions != other.dimensions:
-            raise VectorDimensionError(
-                "These vectors cannot be subtracted due to wrong dimensions."
-            )
+    def __truediv__(self, other: t.Union["Vector", dtypes.Number]) -> "Vector":
+        if isinstance(other, hm.Matrix):
+            return NotImplemented
+        return self._elementwise(other, operator.truediv, "divided")
+
+    def __radd__(self, other: dtypes.Number) -> "Vector":
+        return self._elementwise(other, operator.add, "added", reflected=True)
+
+    def __rsub__(self, other: dtypes.Number) -> "Vector":
+        return self._elementwise(other, operator.sub, "subtracted", reflected=True)
+
+    def __rmul__(self, other: dtypes.Number) -> "Vector":
+        return self._elementwise(other, operator.mul, "multiplied", reflected=True)
+
+    def __rtruediv__(self, other: dtypes.Number) -> "Vector":
+        return self._elementwise(other, operator.truediv, "divided", reflected=True)
+
+    def outer(self, other: "Vector") -> "hm.Matrix":
+        """
+        Compute the outer product of the vectors, the matrix of the products of every pair of their points.
+
+        Parameters
+        ----------
+        other: Vector
+            The other vector, giving the columns of the product.
+
+        Returns
+        -------
+        Matrix
+            The `len(self) x len(other)` matrix, the value at `[i, j]` being `self[i] * other[j]`.
+
+        Examples
+        --------
+        >>> Vector(1, 2).outer(Vector(3, 4, 5))
+        Matrix([[3, 4, 5], [6, 8, 10]])
+        """
+        if not isinstance(other, Vector):
+            raise TypeError(f"Outer product can only be computed with another Vector. Not {type(other)}")
+
+        other_points = other._read()
+        matrix = [list(map(operator.mul, itertools.repeat(point), other_points)) for point in self._read()]
+        return hm.Matrix._from_rows(matrix, dtypes.promote(self.dtype, other.dtype))
+
+    def astype(self, dtype: t.Union[dtypes.DType, str, type, None]) -> "Vector":
+        """
+        Convert the vector to another element type.
 
-        vector = [self[index] - other[index] for index in range(self.dimensions)]
-        return cls(vector)
+        Parameters
+        ----------
+        dtype: t.Union[DType, str, type, None]
+            The element type to be converted to. `None` gives a vector with untyped storage.
+
+        Returns
+        -------
+        Vector
+            The converted vector. Floats are truncated when converted into integers.
+        """
+        return self._from_points(list(self._points), dtypes.get_dtype(dtype))
+
+    def clone(self) -> "Vector":
+        """
+        Returns the copy of the vector.
+
+        The copy is a copy-on-write snapshot, which takes constant time as the storage is shared until either of the
+        vectors is modified. A storage which has been handed out by `points` is copied right away instead, as it can
+        still be modified through that reference.
 
-    def __mul__(self, other: "Vector") -> "Vector":
+        Returns
+        -------
+        Vector
+            The copy of the present vector.
+        """
         cls = self.__class__
 
-        if not isinstance(other, cls):
-            raise TypeError(f"Vector can only be added with another Vector, not with {type(other)}")
+        clone = cls.__new__(cls)
+        clone.__dict__.update(self.__dict__)
+        if self._exposed:
+            clone._store(self._points[:])
+        else:
+            self._refs[0] += 1
 
-        if self.dimensions != other.dimensions:
-            raise VectorDimensionError(
-                "These vectors cannot be added due to wrong dimensions."
-            )
+        return clone
 
-        vector = [self[index] * other[index] for index in range(self.dimensions)]
-        return cls(vector)
+    def copy(self, deep: bool = False) -> "Vector":
+        """
+        Returns the copy of the vector.
+
+        Parameters
+        ----------
+        deep: bool
+            If the storage should be copied right away, instead of returning a copy-on-write snapshot like `clone`.
+            Defaults to `False`.
 
-    def __radd__(self, other: "Vector") -> "Vector":
-        return self.__add__(other)
+        Returns
+        -------
+        Vector
+            The copy of the present vector.
+        """
+        if not deep:
+            return self.clone()
+
+        cls = self.__class__
+
+        copied = cls.__new__(cls)
+        copied.__dict__.update(self.__dict__)
+        copied._store(self._points[:])
+
+        return copied
 
     @classmethod
     def from_matrix(cls, matrix: "hm.Matrix") -> "Vector":
@@ -149,5 +436,10 @@ class Vector:
         if matrix.cols != 1:
             raise MatrixDimensionError("Matrix must only have 1 column.")
 
-        points = [column[0] for column in matrix]
-        return cls(*points)
+        points = [column[0] for column in matrix._read()]
+        return cls(points, dtype=matrix.dtype)
+
+
+def _rebuild_vector(cls: type, header: bytes, data: t.Any) -> Vector:
+    """Rebuild a pickled vector, from its header and the buffer holding the values."""
+    return cls._from_flat_values(*serialization.rebuild_values(header, data, serialization.VECTOR_MAGIC))
@@ -40,7 +40,7 @@ setuptools.setup(
     },
 
     packages=setuptools.find_packages(
-        exclude=["tests", "tests.*", "tools", "tools.*"]
+        exclude=["tests", "tests.*", "tools", "tools.*", "benchmarks", "benchmarks.*"]
     ),
     install_requires=[],
 
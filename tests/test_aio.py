@@ -0,0 +1,100 @@
+import asyncio
+import concurrent.futures
+import threading
+import typing as t
+import unittest
+
+from hypemaths import DiagonalMatrix, Matrix, Vector, aio
+from hypemaths.exceptions import MatrixDimensionError
+
+
+class AsyncTests(unittest.TestCase):
+    """Tests for checking the awaitable matrix operations."""
+    def setUp(self) -> None:
+        self.matrix = Matrix([[i * 7 + j for j in range(6)] for i in range(5)])
+        self.other = Matrix([[i - j for j in range(4)] for i in range(6)])
+
+    def test_operations(self) -> None:
+        square = Matrix([[4, 3], [6, 3]])
+        test_cases = (
+            (self.matrix.matmul_async(self.other), self.matrix * self.other),
+            (self.matrix.matmul_async(2), self.matrix * 2),
+            (square.determinant_async(), square.determinant()),
+            (DiagonalMatrix([2, 3]).determinant_async(), 6),
+            (square.inverse_async(), square.inverse()),
+            (square.solve_async(Vector(10, 12)), square.solve(Vector(10, 12)))
+        )
+
+        for coroutine, expected in test_cases:
+            self.assertEqual(asyncio.run(coroutine), expected)
+
+        with self.assertRaises(MatrixDimensionError):
+            asyncio.run(self.other.matmul_async(self.matrix))
+
+    def test_runners(self) -> None:
+        expected = self.matrix * self.other
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            runners = (
+                aio.AsyncRunner(executor, max_concurrency=1, chunk_rows=2),
+                aio.AsyncRunner(cooperative=True, chunk_rows=1)
+            )
+
+            async def products(runner: aio.AsyncRunner) -> list:
+                return await asyncio.gather(*(self.matrix.matmul_async(self.other, runner) for _ in range(3)))
+
+            for runner in runners:
+                self.assertEqual(asyncio.run(products(runner)), [expected] * 3)
+
+        with self.assertRaises(ValueError):
+            aio.AsyncRunner(chunk_rows=0)
+
+    def test_cooperative_yielding(self) -> None:
+        ticks = []
+
+        async def ticker() -> None:
+            for _ in range(3):
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def main() -> None:
+            task = asyncio.ensure_future(ticker())
+            await self.matrix.matmul_async(self.other, aio.AsyncRunner(cooperative=True, chunk_rows=1))
+            # The ticker ran while the product was computed, between its chunks.
+            self.assertEqual(len(ticks), 3)
+            await task
+
+        asyncio.run(main())
+
+    def test_cancellation(self) -> None:
+        started, release = threading.Event(), threading.Event()
+        steps = []
+
+        def kernel() -> t.Generator[None, None, None]:
+            started.set()
+            release.wait()
+            for step in range(3):
+                steps.append(step)
+                yield
+
+        async def main() -> None:
+            runner = aio.AsyncRunner(concurrent.futures.ThreadPoolExecutor(1))
+            task = asyncio.ensure_future(runner.run(kernel))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            release.set()
+            runner.executor.shutdown(wait=True)
+
+        asyncio.run(main())
+        # The kernel stopped at its first pause, after being cancelled.
+        self.assertEqual(steps, [0])
+
+    def test_configure(self) -> None:
+        default = aio.get_runner()
+        try:
+            runner = aio.configure(max_concurrency=2)
+            self.assertIs(aio.get_runner(), runner)
+            self.assertEqual(asyncio.run(self.matrix.matmul_async(self.other)), self.matrix * self.other)
+        finally:
+            aio._default_runner = default
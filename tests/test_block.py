@@ -0,0 +1,61 @@
+import unittest
+
+from hypemaths import BlockMatrix, Identity, Matrix, Vector
+from hypemaths.exceptions import MatrixDimensionError
+
+
+class BlockAssemblyTests(unittest.TestCase):
+    """Tests for checking the assembly of matrices from blocks."""
+    def test_stacking(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        test_cases = (
+            (Matrix.hstack([matrix, Matrix([[5], [6]])]), Matrix([[1, 2, 5], [3, 4, 6]])),
+            (Matrix.vstack([matrix, Matrix([[5, 6]])]), Matrix([[1, 2], [3, 4], [5, 6]])),
+            (
+                Matrix.block([[matrix, Identity(2)], [Matrix([[7, 8]]), Matrix([[0, 9]])]]),
+                Matrix([[1, 2, 1, 0], [3, 4, 0, 1], [7, 8, 0, 9]])
+            )
+        )
+
+        for result, expected in test_cases:
+            self.assertEqual(result, expected)
+
+    def test_invalid_blocks(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        test_cases = (
+            [[matrix, Matrix([[1, 2, 3]])]],
+            [[matrix], [Matrix([[1, 2, 3]])]],
+            []
+        )
+
+        for blocks in test_cases:
+            with self.assertRaises(MatrixDimensionError):
+                Matrix.block(blocks)
+
+
+class BlockMatrixTests(unittest.TestCase):
+    """Tests for checking the operations computed block by block."""
+    def setUp(self) -> None:
+        self.block_matrix = BlockMatrix([
+            [Matrix([[4, 1], [1, 3]]), Matrix([[1], [2]])],
+            [Matrix([[1, 2]]), Matrix([[5]])]
+        ])
+        self.dense = self.block_matrix.to_matrix()
+
+    def test_block_multiplication(self) -> None:
+        other = Matrix([[1, 2], [3, 4], [5, 6]])
+
+        self.assertEqual(self.block_matrix * other, self.dense * other)
+        self.assertEqual((self.block_matrix * self.block_matrix).to_matrix(), self.dense * self.dense)
+        self.assertEqual(self.block_matrix * Vector(1, 0, 1), Vector(5, 3, 6))
+        self.assertEqual(self.block_matrix[2, 1], 2)
+
+    def test_block_solve(self) -> None:
+        values = Vector(6, 6, 8)
+        solution = self.block_matrix.solve(values)
+
+        for value, expected in zip(solution, self.dense.solve(values)):
+            self.assertAlmostEqual(value, expected)
+
+        singular_leading = BlockMatrix([[Matrix([[0]]), Matrix([[1]])], [Matrix([[1]]), Matrix([[0]])]])
+        self.assertEqual(singular_leading.solve(Vector(3, 4)), Vector(4.0, 3.0))
@@ -0,0 +1,48 @@
+import pickle
+import unittest
+
+from hypemaths import CovarianceAccumulator, Matrix, SymmetricMatrix, Vector
+from hypemaths.exceptions import VectorDimensionError
+
+
+class CovarianceAccumulatorTests(unittest.TestCase):
+    """Tests for checking the streaming Gram, covariance and correlation matrices."""
+    def setUp(self) -> None:
+        self.samples = Matrix([[1, 2, 0], [2, 1, 1], [4, 0, 1], [3, 5, 2], [0, 1, 1]])
+
+    def assertMatrixAlmostEqual(self, first: Matrix, second: Matrix) -> None:
+        for first_row, second_row in zip(first, second):
+            for first_value, second_value in zip(first_row, second_row):
+                self.assertAlmostEqual(first_value, second_value)
+
+    def test_statistics(self) -> None:
+        accumulator = CovarianceAccumulator()
+        for sample in self.samples:
+            accumulator.update(Vector(sample))
+
+        centered = self.samples - self.samples.mean(axis=0)
+        covariance = centered.transpose() * centered / 4
+
+        self.assertIsInstance(accumulator.covariance(), SymmetricMatrix)
+        self.assertMatrixAlmostEqual(accumulator.covariance(), covariance)
+        self.assertMatrixAlmostEqual(accumulator.gram(), self.samples.transpose() * self.samples)
+        self.assertEqual(accumulator.correlation()[1, 1], 1.0)
+        self.assertAlmostEqual(accumulator.correlation()[0, 1], covariance[0, 1] / (covariance[0, 0] * covariance[1, 1]) ** 0.5)
+
+    def test_merge_chunks(self) -> None:
+        single = CovarianceAccumulator(3).update(self.samples)
+        first = CovarianceAccumulator().update(Matrix(self.samples.matrix[:2]))
+        second = pickle.loads(pickle.dumps(CovarianceAccumulator().update(Matrix(self.samples.matrix[2:]))))
+
+        merged = first.merge(second)
+        self.assertEqual(merged.count, 5)
+        self.assertMatrixAlmostEqual(merged.covariance(ddof=0), single.covariance(ddof=0))
+        self.assertEqual(len(merged.mean()), 3)
+
+    def test_invalid_samples(self) -> None:
+        accumulator = CovarianceAccumulator(2)
+
+        with self.assertRaises(VectorDimensionError):
+            accumulator.update(Vector(1, 2, 3))
+        with self.assertRaises(ValueError):
+            accumulator.update(Vector(1, 2)).covariance()
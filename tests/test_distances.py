@@ -0,0 +1,41 @@
+import unittest
+
+from hypemaths import Matrix, Vector, pairwise, top_k_neighbors
+from hypemaths.exceptions import VectorDimensionError
+
+
+class PairwiseTests(unittest.TestCase):
+    """Tests for checking the pairwise distances between collections of vectors."""
+    def assertMatrixAlmostEqual(self, first: Matrix, second: Matrix) -> None:
+        self.assertEqual(first.dims, second.dims)
+        for first_row, second_row in zip(first, second):
+            for first_value, second_value in zip(first_row, second_row):
+                self.assertAlmostEqual(first_value, second_value)
+
+    def test_metrics(self) -> None:
+        x = [Vector(0, 0), Vector(3, 4), Vector(1, 1)]
+        y = Matrix([[3, 4], [1, 0]])
+        test_cases = (
+            ("euclidean", Matrix([[5, 1], [0, 20 ** 0.5], [13 ** 0.5, 1]])),
+            ("manhattan", Matrix([[7, 1], [0, 6], [5, 1]])),
+            ("cosine", Matrix([[1, 1], [0, 0.4], [1 - 7 / 50 ** 0.5, 1 - 1 / 2 ** 0.5]])),
+            (lambda a, b: sum(a) - sum(b), Matrix([[-7, -1], [0, 6], [-5, 1]]))
+        )
+
+        for metric, expected in test_cases:
+            for block_size in (1, 2, 256):
+                self.assertMatrixAlmostEqual(pairwise(x, y, metric=metric, block_size=block_size), expected)
+
+    def test_invalid_collections(self) -> None:
+        with self.assertRaises(VectorDimensionError):
+            pairwise([Vector(1, 2)], [Vector(1, 2, 3)])
+        with self.assertRaises(ValueError):
+            pairwise([Vector(1, 2)], metric="chebyshev")
+
+    def test_top_k_neighbors(self) -> None:
+        points = [[0, 0], [1, 0], [0, 2], [5, 5], [1, 1]]
+        neighbors = top_k_neighbors(points, k=2, block_size=2)
+
+        self.assertEqual([[index for index, _ in row] for row in neighbors], [[1, 4], [0, 4], [4, 0], [4, 2], [1, 0]])
+        self.assertAlmostEqual(neighbors[3][0][1], 32 ** 0.5)
+        self.assertEqual(top_k_neighbors(points, [[0, 1]], k=1, metric="manhattan")[0], [(0, 1)])
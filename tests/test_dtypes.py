@@ -0,0 +1,71 @@
+import pickle
+import unittest
+
+import hypemaths as hm
+from hypemaths import Matrix, Vector
+
+
+class DTypeTests(unittest.TestCase):
+    """Tests for checking the typed storage and the promotion rules."""
+    def test_typed_storage(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]], dtype="float32")
+
+        self.assertIs(matrix.dtype, hm.float32)
+        self.assertEqual(list(matrix[0]), [1.0, 2.0])
+        self.assertEqual(list(Matrix([[1.9, -2.9]], dtype=int)[0]), [1, -2])
+        self.assertIsNone(Matrix([[1, 2]]).dtype)
+
+        with self.assertRaises(TypeError):
+            Matrix([[1, 2]], dtype="float16")
+        with self.assertRaises(TypeError):
+            Matrix([[1j, 2]], dtype="float64")
+
+    def test_promotion(self) -> None:
+        int32 = Matrix([[1, 2], [3, 4]], dtype="int32")
+        test_cases = (
+            (int32 + Matrix([[1, 2], [3, 4]], dtype="int64"), hm.int64),
+            (int32 + Matrix([[1, 2], [3, 4]], dtype="float32"), hm.float64),
+            (int32 + Matrix([[1, 2], [3, 4]]), hm.int32),
+            (int32 * 2, hm.int32),
+            (int32 * 2.5, hm.float64),
+            (int32 / 2, hm.float64),
+            (int32 * 1j, hm.complex128),
+            (Vector(1, 2, dtype="float32") + Vector(1, 2, dtype="float32"), hm.float32)
+        )
+
+        for result, dtype in test_cases:
+            self.assertIs(result.dtype, dtype)
+
+    def test_complex_values(self) -> None:
+        matrix = Matrix([[1 + 1j, 2], [3, 4]])
+
+        self.assertIs(matrix.dtype, hm.complex128)
+        self.assertEqual(matrix[0, 1], 2 + 0j)
+        self.assertEqual(abs(Matrix([[3 + 4j]])), Matrix([[5.0]]))
+        self.assertIs(Vector(1j, 2).dtype, hm.complex128)
+
+        for result in (Matrix([[1, 2], [3, 4]]) + 1j, Vector(1, 2) * 1j, 1j - Matrix([[1, 2]])):
+            self.assertIs(result.dtype, hm.complex128)
+            self.assertEqual(type(result).from_bytes(result.to_bytes()), result)
+            self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+
+    def test_astype(self) -> None:
+        matrix = Matrix([[1.5, 2.5]], dtype="float64")
+        converted = matrix.astype("int64")
+
+        self.assertIs(converted.dtype, hm.int64)
+        self.assertEqual(list(converted[0]), [1, 2])
+        self.assertIs(matrix.dtype, hm.float64)
+
+    def test_serialization(self) -> None:
+        test_cases = (
+            Matrix([[1.5, 2], [3, 4]], dtype="float32"),
+            Matrix([[1, 2], [3, 4]], dtype="int32"),
+            Matrix([[1 + 2j, 2], [3, -4j]]),
+            Vector(1, 2, 3, dtype="int64")
+        )
+
+        for obj in test_cases:
+            for restored in (type(obj).from_bytes(obj.to_bytes()), pickle.loads(pickle.dumps(obj, protocol=5))):
+                self.assertEqual(restored, obj)
+                self.assertIs(restored.dtype, obj.dtype)
@@ -0,0 +1,37 @@
+import unittest
+
+from hypemaths import Matrix, RandomGenerator
+
+
+class RandomGeneratorTests(unittest.TestCase):
+    """Tests for checking the random generation of matrices and vectors."""
+    def test_reproducible_values(self) -> None:
+        test_cases = (
+            (lambda generator: generator.uniform((3, 2), 1, 5)),
+            (lambda generator: generator.normal((2, 2))),
+            (lambda generator: generator.integers((2, 3), 0, 9)),
+            (lambda generator: generator.sparse((4, 4), 0.25)),
+            (lambda generator: generator.uniform_vector(5))
+        )
+
+        for generate in test_cases:
+            self.assertEqual(generate(RandomGenerator(seed=7)), generate(RandomGenerator(seed=7)))
+
+    def test_value_ranges(self) -> None:
+        generator = RandomGenerator(seed=1)
+
+        matrix = generator.integers((10, 10), -2, 2)
+        self.assertEqual(matrix.dims, (10, 10))
+        self.assertTrue(all(-2 <= value <= 2 for row in matrix for value in row))
+
+        sparse = generator.sparse((10, 10), 0.2, 1, 2)
+        self.assertEqual(sum(1 for row in sparse for value in row if value), 20)
+
+    def test_independent_streams(self) -> None:
+        first, second = RandomGenerator(seed=3).spawn(2)
+
+        self.assertNotEqual(first.uniform((2, 2)), second.uniform((2, 2)))
+        self.assertEqual(RandomGenerator(seed=3, stream=1).uniform((2, 2)), RandomGenerator(seed=3).spawn(2)[1].uniform((2, 2)))
+
+    def test_randomized_matrix_seed(self) -> None:
+        self.assertEqual(Matrix.get_randomized_matrix((2, 2), 1, 10, seed=7), Matrix([[3.91, 2.36], [6.86, 1.65]]))
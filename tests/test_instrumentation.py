@@ -0,0 +1,70 @@
+import unittest
+
+import hypemaths as hm
+from hypemaths import Matrix
+
+
+class InstrumentationTests(unittest.TestCase):
+    """Tests for checking the recording of the operations."""
+    def setUp(self) -> None:
+        hm.instrumentation.reset()
+
+    def tearDown(self) -> None:
+        hm.instrumentation.disable()
+        hm.instrumentation.reset()
+
+    def test_operation_recording(self) -> None:
+        events = []
+        matrix = Matrix([[1, 2], [3, 4]])
+
+        with hm.instrument(events.append):
+            matrix * matrix
+            matrix.transpose()
+
+        report = hm.instrumentation.report()
+
+        self.assertEqual(report["Matrix.__mul__"]["calls"], 1)
+        self.assertEqual(report["Matrix.__mul__"]["elements"], 8)
+        self.assertEqual(report["Matrix.__mul__"]["shapes"], {"(2, 2) x (2, 2)": 1})
+        self.assertEqual(report["Matrix.transpose"]["calls"], 1)
+        self.assertIn("Matrix.__mul__", [event["operation"] for event in events])
+        self.assertEqual(hm.instrumentation.instrumentation.callbacks, [])
+
+    def test_nested_operations(self) -> None:
+        events, other = [], []
+        matrix = Matrix([[1, 2], [3, 4]])
+
+        with hm.instrument(events.append):
+            matrix @ matrix
+
+        with hm.instrument(other.append):
+            matrix.transpose()
+
+        # `__mul__` is called by `__matmul__`, so only the outer call is recorded.
+        self.assertEqual([event["operation"] for event in events], ["Matrix.__matmul__"])
+        self.assertNotIn("Matrix.__mul__", hm.instrumentation.report())
+        self.assertEqual([event["operation"] for event in other], ["Matrix.transpose"])
+
+    def test_allocated_bytes(self) -> None:
+        matrix = Matrix([[1.5, 2.5], [3.5, 4.5]])
+
+        with hm.instrument():
+            matrix.clone()
+            matrix.transpose()
+
+        report = hm.instrumentation.report()
+        self.assertEqual(report["Matrix.clone"]["bytes_allocated"], 0)
+        self.assertGreater(report["Matrix.transpose"]["bytes_allocated"], 0)
+        self.assertGreater(hm.instrumentation._allocated_bytes(hm.DiagonalMatrix([1.5, 2.5])), 0)
+
+    def test_disabled_restores_methods(self) -> None:
+        original = Matrix.__dict__["__mul__"]
+
+        hm.instrument()
+        self.assertIsNot(Matrix.__dict__["__mul__"], original)
+
+        hm.instrumentation.disable()
+        self.assertIs(Matrix.__dict__["__mul__"], original)
+
+        Matrix([[1, 2]]) * Matrix([[1], [2]])
+        self.assertEqual(hm.instrumentation.report(), {})
@@ -0,0 +1,50 @@
+import unittest
+
+from hypemaths import Matrix, MatrixInverse, Vector
+from hypemaths.exceptions import MatrixDimensionError, SingularMatrixError
+
+
+class MatrixInverseTests(unittest.TestCase):
+    """Tests for checking the inverse and its low rank updates."""
+    def setUp(self) -> None:
+        self.matrix = Matrix([[4, 1, 0], [1, 3, 1], [0, 1, 2]])
+
+    def assertMatrixAlmostEqual(self, first: Matrix, second: Matrix) -> None:
+        for first_row, second_row in zip(first, second):
+            for first_value, second_value in zip(first_row, second_row):
+                self.assertAlmostEqual(first_value, second_value)
+
+    def test_inverse(self) -> None:
+        self.assertMatrixAlmostEqual(self.matrix.inverse() * self.matrix, Matrix([[1, 0, 0], [0, 1, 0], [0, 0, 1]]))
+        self.assertAlmostEqual(MatrixInverse(self.matrix).determinant(), self.matrix.determinant())
+
+        with self.assertRaises(SingularMatrixError):
+            Matrix([[1, 2], [2, 4]]).inverse()
+
+    def test_rank1_update(self) -> None:
+        u, v = Vector(1, 0, 2), Vector(0, 1, 1)
+        updated = self.matrix + Matrix.from_vector(u) * Matrix([v.points])
+        inverse = MatrixInverse(self.matrix).update_rank1(u, v)
+
+        self.assertMatrixAlmostEqual(inverse.to_matrix(), updated.inverse())
+        self.assertAlmostEqual(inverse.determinant(), updated.determinant())
+        self.assertEqual(len(inverse.solve(Vector(1, 2, 3))), 3)
+
+    def test_rank_k_update(self) -> None:
+        u = Matrix([[1, 0], [0, 1], [1, 1]])
+        v = Matrix([[0, 2], [1, 0], [1, 0]])
+        updated = self.matrix + u * v.transpose()
+        inverse = MatrixInverse(self.matrix).update_rank_k(u, v)
+
+        self.assertMatrixAlmostEqual(inverse.to_matrix(), updated.inverse())
+        self.assertAlmostEqual(inverse.determinant(), updated.determinant())
+
+        with self.assertRaises(MatrixDimensionError):
+            inverse.update_rank_k(u, Matrix([[1], [2], [3]]))
+
+    def test_singular_update(self) -> None:
+        inverse = MatrixInverse(Matrix([[1, 0], [0, 1]]))
+
+        with self.assertRaises(SingularMatrixError):
+            inverse.update_rank1(Vector(-1, 0), Vector(1, 0))
+        self.assertEqual(inverse.determinant(), 1)
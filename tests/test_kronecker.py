@@ -0,0 +1,73 @@
+import unittest
+
+from hypemaths import KroneckerOperator, Matrix, Vector
+from hypemaths.exceptions import MatrixDimensionError, MatrixNotSquare
+
+
+class ProductTests(unittest.TestCase):
+    """Tests for checking the Kronecker, Hadamard and outer products."""
+    def test_products(self) -> None:
+        test_cases = (
+            (
+                Matrix([[1, 2], [3, 4]]).kron(Matrix([[0, 1], [1, 0]])),
+                Matrix([[0, 1, 0, 2], [1, 0, 2, 0], [0, 3, 0, 4], [3, 0, 4, 0]])
+            ),
+            (Matrix([[1, 2, 3]]).kron(Matrix([[2], [3]])), Matrix([[2, 4, 6], [3, 6, 9]])),
+            (Matrix([[1, 2], [3, 4]]).hadamard(Matrix([[2, 0], [1, 3]])), Matrix([[2, 0], [3, 12]])),
+            (Vector(1, 2).outer(Vector(3, 4, 5)), Matrix([[3, 4, 5], [6, 8, 10]]))
+        )
+
+        for result, expected in test_cases:
+            self.assertEqual(result, expected)
+
+        with self.assertRaises(MatrixDimensionError):
+            Matrix([[1, 2]]).hadamard(Matrix([[1], [2]]))
+
+
+class KroneckerOperatorTests(unittest.TestCase):
+    """Tests for checking the lazy Kronecker products against the materialized ones."""
+    def setUp(self) -> None:
+        self.a = Matrix([[2, 1], [1, 3]])
+        self.b = Matrix([[1, 0, 2], [0, 1, 1]])
+        self.c = Matrix([[4, 1], [2, 5]])
+
+    def test_products(self) -> None:
+        operators = (
+            KroneckerOperator(self.a, self.b),
+            KroneckerOperator(self.b, self.a),
+            KroneckerOperator(self.a, self.b, self.c)
+        )
+
+        for operator in operators:
+            dense = operator.to_matrix()
+            self.assertEqual(operator.dims, dense.dims)
+
+            vector = Vector(list(range(1, operator.cols + 1)))
+            self.assertEqual(operator * vector, Vector.from_matrix(dense * Matrix.from_vector(vector)))
+
+            matrix = Matrix([[i - 2 * j for j in range(2)] for i in range(operator.cols)])
+            self.assertEqual(operator @ matrix, dense * matrix)
+            self.assertEqual(operator.transpose().to_matrix(), dense.transpose())
+            self.assertEqual((2 * operator).to_matrix(), dense * 2)
+
+        with self.assertRaises(MatrixDimensionError):
+            KroneckerOperator(self.a, self.b) * Vector(1, 2, 3)
+
+    def test_mixed_product(self) -> None:
+        left, right = KroneckerOperator(self.a, self.c), KroneckerOperator(self.c, self.a)
+        product = left * right
+
+        self.assertIsInstance(product, KroneckerOperator)
+        self.assertEqual(product.to_matrix(), left.to_matrix() * right.to_matrix())
+
+    def test_inverse(self) -> None:
+        operator = KroneckerOperator(self.a, self.c)
+        dense = operator.to_matrix()
+
+        self.assertAlmostEqual(operator.determinant(), dense.determinant())
+        solution = operator.solve(Vector(1, 2, 3, 4))
+        for value, expected in zip(solution, dense.solve(Vector(1, 2, 3, 4))):
+            self.assertAlmostEqual(value, expected)
+
+        with self.assertRaises(MatrixNotSquare):
+            KroneckerOperator(self.a, self.b).inverse()
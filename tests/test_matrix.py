@@ -1,6 +1,6 @@
 import unittest
 
-from hypemaths import Matrix
+from hypemaths import Matrix, Vector
 from hypemaths.exceptions import (
     InvalidMatrixError,
     MatrixDimensionError
@@ -113,6 +113,28 @@ class MatrixOperationTests(unittest.TestCase):
         for matrix_a, matrix_b, output_matrix in test_cases:
             self.assertEqual(matrix_a * matrix_b, output_matrix)
 
+    def test_matrix_broadcasting(self) -> None:
+        matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+        test_cases = (
+            (matrix + 1, Matrix([[2, 3, 4], [5, 6, 7]])),
+            (10 - matrix, Matrix([[9, 8, 7], [6, 5, 4]])),
+            (matrix - Matrix([[1, 2, 3]]), Matrix([[0, 0, 0], [3, 3, 3]])),
+            (matrix + Matrix([[10], [20]]), Matrix([[11, 12, 13], [24, 25, 26]])),
+            (Matrix([[1], [2]]) + Matrix([[10, 20]]), Matrix([[11, 21], [12, 22]])),
+            (matrix * Vector(1, 0, 2), Matrix([[1, 0, 6], [4, 0, 12]])),
+            (matrix / Vector(1, 2), Matrix([[1.0, 2.0, 3.0], [2.0, 2.5, 3.0]])),
+            (Vector(1, 1, 1) - matrix, Matrix([[0, -1, -2], [-3, -4, -5]])),
+            (matrix.multiply(Matrix([[2], [3]])), Matrix([[2, 4, 6], [12, 15, 18]]))
+        )
+
+        for result, expected in test_cases:
+            self.assertEqual(result, expected)
+
+        with self.assertRaises(MatrixDimensionError):
+            matrix + Matrix([[1, 2]])
+        with self.assertRaises(MatrixDimensionError):
+            matrix - Vector(1, 2, 3, 4)
+
 
 class MatrixMethodTests(unittest.TestCase):
     """Tests for matrix transposition."""
@@ -154,6 +176,33 @@ class MatrixMethodTests(unittest.TestCase):
         for matrix, cloned_matrix in test_cases:
             self.assertEqual(matrix.clone(), cloned_matrix)
 
+    def test_matrix_copy_on_write(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        cloned_matrix = matrix.clone()
+
+        cloned_matrix[0, 0] = 9
+        cloned_matrix[1][1] = 7
+        matrix.matrix[0][1] = 5
+
+        self.assertEqual(matrix, Matrix([[1, 5], [3, 4]]))
+        self.assertEqual(cloned_matrix, Matrix([[9, 2], [3, 7]]))
+        self.assertEqual(matrix.copy(deep=True), matrix)
+        self.assertIsNot(matrix.copy(deep=True).matrix, matrix.matrix)
+
+    def test_matrix_clone_of_exposed_rows(self) -> None:
+        rows = [[1, 2], [3, 4]]
+        matrix = Matrix(rows)
+        row = matrix[0]
+        first, *_ = matrix
+        cloned_matrix = matrix.clone()
+
+        row[0] = 99
+        first[1] = 98
+        rows[1][0] = 97
+
+        self.assertEqual(matrix, Matrix([[99, 98], [3, 4]]))
+        self.assertEqual(cloned_matrix, Matrix([[1, 2], [3, 4]]))
+
     def test_matrix_tracing(self) -> None:
         test_cases = (
             (
@@ -168,3 +217,36 @@ class MatrixMethodTests(unittest.TestCase):
 
         for matrix, diagonal_sum in test_cases:
             self.assertEqual(matrix.trace(), diagonal_sum)
+
+    def test_matrix_solve(self) -> None:
+        test_cases = (
+            (Matrix([[2, 0], [0, 4]]), Vector(2, 2), Vector(1, 0.5)),
+            (Matrix([[0, 1], [1, 0]]), Matrix([[3], [5]]), Matrix([[5], [3]]))
+        )
+
+        for matrix, values, solution in test_cases:
+            self.assertEqual(matrix.solve(values), solution)
+
+    def test_matrix_reductions(self) -> None:
+        matrix = Matrix([[1, 5, 3], [4, 2, 6]])
+        test_cases = (
+            (matrix.sum(), 21),
+            (matrix.sum(axis=0), Vector(5, 7, 9)),
+            (matrix.mean(axis=1), Vector(3.0, 4.0)),
+            (matrix.min(axis=0), Vector(1, 2, 3)),
+            (matrix.max(), 6),
+            (matrix.argmin(axis=0), Vector(0, 1, 0)),
+            (matrix.argmax(), 5),
+            (matrix.argmax(axis=1), Vector(1, 2)),
+            (matrix.var(axis=0), Vector(2.25, 2.25, 2.25)),
+            (matrix.std(axis=1, ddof=1), Vector(2.0, 2.0))
+        )
+
+        for result, expected in test_cases:
+            self.assertEqual(result, expected)
+
+        self.assertAlmostEqual(Matrix([[1e9 + 1, 1e9 + 2], [1e9 + 3, 1e9 + 4]]).var(), 1.25)
+        with self.assertRaises(ValueError):
+            matrix.sum(axis=2)
+        with self.assertRaises(ValueError):
+            Matrix([[1, 2]]).var(axis=0, ddof=1)
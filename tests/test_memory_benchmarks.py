@@ -0,0 +1,36 @@
+import unittest
+
+from benchmarks import memory
+
+
+class MemoryBenchmarkTests(unittest.TestCase):
+    """Tests for checking the memory benchmark harness and its budgets."""
+    def test_budgets(self) -> None:
+        budgets = memory.load_budgets()
+
+        self.assertEqual(set(budgets["budgets"]), set(memory.BENCHMARKS))
+        for sizes in budgets["budgets"].values():
+            self.assertEqual(set(sizes), {str(size) for size in budgets["sizes"]})
+
+    def test_within_budgets(self) -> None:
+        budgets = memory.load_budgets()
+        failures = memory.check(
+            memory.run(sizes=budgets["sizes"]), budgets["budgets"], budgets["tolerance"], budgets["slack"]
+        )
+
+        self.assertEqual(failures, [], "\n".join(failures))
+
+    def test_check(self) -> None:
+        results = memory.run(["Matrix.__add__"], sizes=(4,))
+        measured = results["Matrix.__add__"]["4"]
+        self.assertGreater(measured["peak"], 0)
+        self.assertGreaterEqual(measured["peak"], measured["retained"])
+
+        test_cases = (
+            ({"Matrix.__add__": {"4": measured}}, 0),
+            ({"Matrix.__add__": {"4": {"peak": measured["peak"] // 2, "retained": measured["retained"]}}}, 1),
+            ({"Matrix.__add__": {"8": {"peak": 0, "retained": 0}}}, 0)
+        )
+
+        for budgets, failures in test_cases:
+            self.assertEqual(len(memory.check(results, budgets, tolerance=0.1, slack=0)), failures)
@@ -0,0 +1,65 @@
+import unittest
+
+from hypemaths import Matrix, ModMatrix, Vector
+from hypemaths.exceptions import SingularMatrixError
+
+
+class ModMatrixTests(unittest.TestCase):
+    """Tests for checking the exact arithmetic of matrices mod a prime."""
+    def test_valid_mod_matrix(self) -> None:
+        self.assertEqual(ModMatrix([[8, -1]], 7).matrix, [[1, 6]])
+
+        with self.assertRaises(ValueError):
+            ModMatrix([[1, 2]], 8)
+        with self.assertRaises(TypeError):
+            ModMatrix([[1.5, 2]], 7)
+
+    def test_operations(self) -> None:
+        matrix = ModMatrix([[1, 1], [1, 0]], 7)
+        test_cases = (
+            (matrix + 6, [[0, 0], [0, 6]]),
+            (matrix * 3, [[3, 3], [3, 0]]),
+            (matrix * matrix, [[2, 1], [1, 1]]),
+            (matrix ** 10, [[5, 6], [6, 6]]),
+            (matrix ** -1, [[0, 1], [1, 6]]),
+            (matrix / 3, [[5, 5], [5, 0]])
+        )
+
+        for result, expected in test_cases:
+            self.assertIsInstance(result, ModMatrix)
+            self.assertEqual(result.matrix, expected)
+
+    def test_reflected_operations(self) -> None:
+        matrix = ModMatrix([[5, 3]], 7)
+        test_cases = (
+            (Matrix([[5, 6]]) + matrix, [[3, 2]]),
+            (Matrix([[1, 1]]) - matrix, [[3, 5]]),
+            (Matrix([[1, 1]]) / matrix, [[3, 5]]),
+            (2 - matrix, [[4, 6]])
+        )
+
+        for result, expected in test_cases:
+            self.assertIsInstance(result, ModMatrix)
+            self.assertEqual(result.matrix, expected)
+
+    def test_large_prime_product(self) -> None:
+        prime = 2 ** 61 - 1
+        values = [[prime - 1, prime - 2, 3], [5, prime - 7, 11], [prime - 13, 17, 19]]
+
+        product = ModMatrix(values, prime) * ModMatrix(values, prime)
+        expected = Matrix(values) * Matrix(values)
+        self.assertEqual(product.matrix, [[value % prime for value in row] for row in expected.matrix])
+
+    def test_elimination(self) -> None:
+        matrix = ModMatrix([[2, 3, 1], [4, 1, 5], [6, 4, 3]], 11)
+
+        self.assertEqual(matrix.determinant(), (2 * (3 - 20) - 3 * (12 - 30) + (16 - 6)) % 11)
+        self.assertEqual((matrix * matrix.inverse()).matrix, [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+        solution = matrix.solve(Vector(1, 2, 3))
+        self.assertEqual((matrix * Matrix.from_vector(solution)).matrix, [[1], [2], [3]])
+
+        singular = ModMatrix([[1, 2], [2, 4]], 5)
+        self.assertEqual((singular.determinant(), singular.rank()), (0, 1))
+        with self.assertRaises(SingularMatrixError):
+            singular.inverse()
@@ -0,0 +1,47 @@
+import pickle
+import unittest
+
+from hypemaths import Matrix, Vector
+
+
+class SerializationTests(unittest.TestCase):
+    """Tests for checking the binary serialization and pickling of matrices and vectors."""
+    def test_bytes_round_trip(self) -> None:
+        test_cases = (
+            Matrix([[1, 2], [3, 4]]),
+            Matrix([[1.5, 2.25], [-3.0, 4.5]]),
+            Matrix([[1, 2.5], [3.5, 4]]),
+            Matrix([[2 ** 70, 1]])
+        )
+
+        for matrix in test_cases:
+            restored = Matrix.from_bytes(matrix.to_bytes())
+            self.assertEqual(restored, matrix)
+            self.assertEqual([type(value) for value in restored[0]], [type(value) for value in matrix[0]])
+
+    def test_pickle_round_trip(self) -> None:
+        matrix = Matrix([[1.5, 2], [3, 4.5]])
+        vector = Vector(1, 2.5, 3)
+
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(matrix, protocol=protocol)), matrix)
+            self.assertEqual(pickle.loads(pickle.dumps(vector, protocol=protocol)), vector)
+
+    def test_payload_size(self) -> None:
+        matrix = Matrix([[float(value) for value in range(100)] for _ in range(100)])
+
+        self.assertLess(len(matrix.to_bytes()), 8 * 100 * 100 + 64)
+        self.assertLess(len(pickle.dumps(matrix, protocol=4)), 8 * 100 * 100 + 256)
+
+    def test_invalid_payload(self) -> None:
+        payload = Matrix([[1, 2], [3, 4]]).to_bytes()
+        test_cases = (
+            payload[:5],
+            payload[:-1],
+            b"XXXX" + payload[4:],
+            Vector(1, 2).to_bytes()
+        )
+
+        for test in test_cases:
+            with self.assertRaises(ValueError):
+                Matrix.from_bytes(test)
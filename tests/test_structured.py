@@ -0,0 +1,225 @@
+import cmath
+import unittest
+
+from hypemaths import (
+    BandedMatrix,
+    CirculantMatrix,
+    DiagonalMatrix,
+    Identity,
+    Matrix,
+    SymmetricMatrix,
+    ToeplitzMatrix,
+    TriangularMatrix,
+    Vector,
+    complex128,
+    detect_structure
+)
+from hypemaths.exceptions import InvalidMatrixError, SingularMatrixError
+from hypemaths.models.structured import StructuredMatrix
+from hypemaths.models.utils.fft import fft
+
+
+class ValidStructuredMatrixTests(unittest.TestCase):
+    """Tests for checking the validation when a structured matrix is initialized."""
+    def test_dense_values(self) -> None:
+        test_cases = (
+            (DiagonalMatrix([1, 2]), [[1, 0], [0, 2]]),
+            (Identity(2), [[1, 0], [0, 1]]),
+            (TriangularMatrix([[1, 0], [2, 3]]), [[1, 0], [2, 3]]),
+            (TriangularMatrix([[1, 2], [0, 3]], lower=False), [[1, 2], [0, 3]]),
+            (SymmetricMatrix([[1, 2], [2, 3]]), [[1, 2], [2, 3]]),
+            (BandedMatrix([[1, 2, 0], [3, 4, 5], [0, 6, 7]]), [[1, 2, 0], [3, 4, 5], [0, 6, 7]])
+        )
+
+        for matrix, matrix_value in test_cases:
+            self.assertEqual(matrix.matrix, matrix_value)
+
+    def test_invalid_structure(self) -> None:
+        test_cases = (
+            lambda: TriangularMatrix([[1, 2], [0, 3]]),
+            lambda: SymmetricMatrix([[1, 2], [3, 4]]),
+            lambda: BandedMatrix([[1, 0, 2], [0, 1, 0], [0, 0, 1]], 0, 1)
+        )
+
+        for test in test_cases:
+            with self.assertRaises(InvalidMatrixError):
+                test()
+
+    def test_incomplete_subclass(self) -> None:
+        class RowMatrix(StructuredMatrix):
+            def _get(self, row: int, col: int) -> int:
+                return row
+
+        with self.assertRaises(TypeError):
+            RowMatrix._new(2)
+
+
+class StructuredMatrixOperationTests(unittest.TestCase):
+    """Tests for checking the structure exploiting operations against the dense results."""
+    def test_multiplication(self) -> None:
+        dense = Matrix([[1, 2], [3, 4]])
+        test_cases = (
+            (DiagonalMatrix([2, 3]) * DiagonalMatrix([4, 5]), DiagonalMatrix([8, 15])),
+            (DiagonalMatrix([2, 3]) * dense, Matrix([[2, 4], [9, 12]])),
+            (dense * DiagonalMatrix([2, 3]), Matrix([[2, 6], [6, 12]])),
+            (Identity(2) * dense, dense),
+            (TriangularMatrix([[1, 0], [2, 3]]) * TriangularMatrix([[4, 0], [5, 6]]), Matrix([[4, 0], [23, 18]]))
+        )
+
+        for product, output_matrix in test_cases:
+            self.assertEqual(product, output_matrix)
+
+        self.assertIsInstance(DiagonalMatrix([2, 3]) * DiagonalMatrix([4, 5]), DiagonalMatrix)
+        self.assertIsInstance(TriangularMatrix([[1, 0], [2, 3]]) * TriangularMatrix([[4, 0], [5, 6]]), TriangularMatrix)
+
+    def test_complex_scalars(self) -> None:
+        test_cases = (
+            (DiagonalMatrix([1, 2]) * (1 + 1j), Matrix([[1 + 1j, 0], [0, 2 + 2j]])),
+            (2j * Identity(2), Matrix([[2j, 0], [0, 2j]])),
+            (ToeplitzMatrix([1, 2], [1, 3]) / 1j, Matrix([[1, 3], [2, 1]]) / 1j),
+            (1j - SymmetricMatrix([[1, 2], [2, 3]]), 1j - Matrix([[1, 2], [2, 3]]))
+        )
+
+        for result, output_matrix in test_cases:
+            self.assertEqual(result, output_matrix)
+            self.assertIs(result.dtype, complex128)
+
+    def test_dense_results(self) -> None:
+        dense = Matrix([[1, 2], [3, 4]])
+        test_cases = (
+            (DiagonalMatrix([1, 2]).hadamard(dense), Matrix([[1, 0], [0, 8]])),
+            (ToeplitzMatrix([1, 2], [1, 3]).hadamard(dense), Matrix([[1, 6], [6, 4]])),
+            (DiagonalMatrix([1, 2]).astype("float64"), Matrix([[1.0, 0.0], [0.0, 2.0]], dtype="float64")),
+            (SymmetricMatrix([[1, 2], [2, 3]]).astype(None), Matrix([[1, 2], [2, 3]]))
+        )
+
+        for result, output_matrix in test_cases:
+            self.assertIs(type(result), Matrix)
+            self.assertEqual(result, output_matrix)
+            self.assertIs(result.dtype, output_matrix.dtype)
+
+    def test_determinant_and_trace(self) -> None:
+        test_cases = (
+            (DiagonalMatrix([2, 3, 4]), 24, 9),
+            (Identity(3), 1, 3),
+            (TriangularMatrix([[1, 0, 0], [2, 3, 0], [4, 5, 6]]), 18, 10),
+            (BandedMatrix([[2, 1, 0], [1, 2, 1], [0, 1, 2]]), 4, 6)
+        )
+
+        for matrix, determinant, trace in test_cases:
+            self.assertAlmostEqual(matrix.determinant(), determinant)
+            self.assertEqual(matrix.trace(), trace)
+
+    def test_transpose(self) -> None:
+        lower = TriangularMatrix([[1, 0], [2, 3]])
+
+        self.assertEqual(lower.transpose(), Matrix([[1, 2], [0, 3]]))
+        self.assertFalse(lower.transpose().lower)
+
+    def test_solve(self) -> None:
+        test_cases = (
+            (DiagonalMatrix([2, 4]), Vector(2, 2), [1, 0.5]),
+            (TriangularMatrix([[1, 0], [2, 4]]), Vector(1, 6), [1, 1]),
+            (BandedMatrix([[2, 1, 0], [1, 2, 1], [0, 1, 2]]), Vector(3, 4, 3), [1, 1, 1]),
+            (SymmetricMatrix([[2, 1], [1, 2]]), Vector(3, 3), [1, 1])
+        )
+
+        for matrix, values, solution in test_cases:
+            for point, expected in zip(matrix.solve(values), solution):
+                self.assertAlmostEqual(point, expected)
+
+
+class ConvolutionMatrixTests(unittest.TestCase):
+    """Tests for checking the FFT based Toeplitz and circulant matrices against the dense results."""
+    def test_fft(self) -> None:
+        for size in (1, 4, 6, 7):
+            values = [complex(index % 3, index // 2) for index in range(size)]
+            dft = [
+                sum(value * cmath.exp(-2j * cmath.pi * j * k / size) for j, value in enumerate(values))
+                for k in range(size)
+            ]
+
+            for point, expected in zip(fft(values), dft):
+                self.assertAlmostEqual(point, expected)
+            for point, expected in zip(fft(fft(values), inverse=True), values):
+                self.assertAlmostEqual(point, expected)
+
+    def test_products(self) -> None:
+        matrices = (
+            ToeplitzMatrix([1, 2, 3], [1, 4, 5]),
+            ToeplitzMatrix([4, 1, 0, 2, 5]),
+            CirculantMatrix([2, 1, 0, 3]),
+            CirculantMatrix([1, 5, 2])
+        )
+
+        for matrix in matrices:
+            dense = matrix.to_matrix()
+            other = Matrix([[row - 2 * col for col in range(2)] for row in range(matrix.rows)])
+            vector = Vector(list(range(1, matrix.rows + 1)))
+
+            self.assertEqual(matrix * other, dense * other)
+            self.assertEqual(other.transpose() * matrix, other.transpose() * dense)
+            self.assertEqual(matrix.matvec(vector), Vector.from_matrix(dense * Matrix.from_vector(vector)))
+            self.assertEqual(matrix * vector, dense * vector)
+            self.assertEqual(vector * matrix, vector * dense)
+            self.assertEqual(matrix.transpose(), dense.transpose())
+
+        product = CirculantMatrix([2, 1, 0]) * CirculantMatrix([1, 0, 3])
+        self.assertIsInstance(product, CirculantMatrix)
+        self.assertEqual(product, Matrix([[5, 6, 1], [1, 5, 6], [6, 1, 5]]))
+
+    def test_large_integer_products(self) -> None:
+        big = 10 ** 17
+        matrices = (ToeplitzMatrix([big, 1, 2], [big, 3, 4]), CirculantMatrix([big, 1, 2]))
+        ones = Vector(1, 1, 1)
+
+        for matrix in matrices:
+            dense = matrix.to_matrix()
+            self.assertEqual(matrix.matvec(ones), Vector.from_matrix(dense * Matrix.from_vector(ones)))
+            self.assertEqual(matrix * matrix.to_matrix(), dense * dense)
+            self.assertEqual(matrix * matrix, dense * dense)
+
+        self.assertEqual(matrices[0].matvec(ones), Vector(big + 7, big + 4, big + 3))
+        # The determinant is too large to be exact, so it isn't rounded to an integer.
+        self.assertIsInstance(CirculantMatrix([big, 1, 2]).determinant(), float)
+        self.assertEqual(CirculantMatrix([2, 1, 0]).determinant(), 9)
+
+    def test_solve_and_determinant(self) -> None:
+        test_cases = (
+            (ToeplitzMatrix([4, 1, 2, 0.5], [4, 3, 1, 2]), 192),
+            (ToeplitzMatrix([0, 1, 2], [0, 3, 1]), 19),
+            (CirculantMatrix([5, 1, 2, 0, 1]), 3069)
+        )
+
+        for matrix, determinant in test_cases:
+            dense = matrix.to_matrix()
+            values = Vector(list(range(1, matrix.rows + 1)))
+
+            self.assertAlmostEqual(matrix.determinant(), determinant)
+            for point, expected in zip(matrix.solve(values), dense.solve(values)):
+                self.assertAlmostEqual(point, expected)
+
+        inverse = CirculantMatrix([2, 1, 0, 0]).inverse()
+        self.assertIsInstance(inverse, CirculantMatrix)
+        for row, expected in zip(inverse * CirculantMatrix([2, 1, 0, 0]), Identity(4).matrix):
+            for point, value in zip(row, expected):
+                self.assertAlmostEqual(point, value)
+
+        with self.assertRaises(SingularMatrixError):
+            CirculantMatrix([1, 1]).solve(Vector(1, 2))
+        with self.assertRaises(InvalidMatrixError):
+            ToeplitzMatrix([1, 2], [3, 4])
+
+
+class DetectStructureTests(unittest.TestCase):
+    def test_detect_structure(self) -> None:
+        test_cases = (
+            (Matrix([[1, 0], [0, 1]]), Identity),
+            (Matrix([[1, 0], [0, 2]]), DiagonalMatrix),
+            (Matrix([[1, 2], [0, 2]]), TriangularMatrix),
+            (Matrix([[1, 2], [2, 1]]), SymmetricMatrix),
+            (Matrix([[1, 2], [3, 4]]), Matrix)
+        )
+
+        for matrix, matrix_type in test_cases:
+            self.assertIs(type(detect_structure(matrix)), matrix_type)
@@ -49,3 +49,42 @@ class VectorComparisonTests(unittest.TestCase):
 
         for vector_1, vector_2 in test_cases:
             self.assertEqual(vector_1, vector_2)
+
+    def test_vector_copy_on_write(self) -> None:
+        vector = Vector(1, 2, 3)
+        cloned_vector = vector.clone()
+
+        cloned_vector[0] = 9
+        del vector[2]
+
+        self.assertEqual(vector, Vector(1, 2))
+        self.assertEqual(cloned_vector, Vector(9, 2, 3))
+        self.assertEqual(vector.copy(deep=True), vector)
+
+    def test_vector_clone_of_exposed_points(self) -> None:
+        points = [1, 2, 3]
+        vector = Vector(points)
+        exposed = vector.points
+        cloned_vector = vector.clone()
+
+        exposed[0] = 99
+        points[1] = 98
+
+        self.assertEqual(vector, Vector(99, 2, 3))
+        self.assertEqual(cloned_vector, Vector(1, 2, 3))
+
+
+class VectorOperationTests(unittest.TestCase):
+    """Tests for checking the operations on vectors."""
+    def test_vector_scalar_operations(self) -> None:
+        test_cases = (
+            (Vector(1, 2) * 3, Vector(3, 6)),
+            (3 * Vector(1, 2), Vector(3, 6)),
+            (Vector(1, 2) + 1, Vector(2, 3)),
+            (1 - Vector(1, 2), Vector(0, -1)),
+            (Vector(1, 2) / 2, Vector(0.5, 1.0)),
+            (Vector(1, 2) * Vector(3, 4), Vector(3, 8))
+        )
+
+        for result, expected in test_cases:
+            self.assertEqual(result, expected)